@@ -49,7 +49,7 @@ function App() {
       
       if (response.data.status === 'success') {
         alert(
-          `âœ… Tags Updated!\n\n` +
+          `✅ Tags Updated!\n\n` +
           `${response.data.updated_count} component(s) updated`
         );
         // Reload would be needed to see updated tags
@@ -57,7 +57,7 @@ function App() {
       }
     } catch (error) {
       console.error('Error updating tags:', error);
-      alert('âŒ Failed to update tags');
+      alert('❌ Failed to update tags');
     }
   };
 
@@ -67,7 +67,7 @@ function App() {
       <div className="toolbar">
         <div className="toolbar-group">
           <div className="flex items-center space-x-3">
-            <h1 className="text-xl font-bold text-cad-accent">âš¡ PwrSysPro</h1>
+            <h1 className="text-xl font-bold text-cad-accent">⚡ PwrSysPro</h1>
             <span className="text-sm text-cad-text-secondary">Analysis Suite</span>
             <span className="text-xs bg-cad-success px-2 py-1 rounded text-white font-medium">
               Phase 4
@@ -100,7 +100,7 @@ function App() {
             className="btn btn-secondary text-sm"
             title="Update all component tags based on topology"
           >
-            ðŸ·ï¸ Update Tags
+            🏷️ Update Tags
           </button>
           
           {/* Phase 3 & 4 Features - Network Analysis */}
@@ -132,7 +132,7 @@ function App() {
           ) : (
             <div className="flex items-center justify-center h-full">
               <div className="text-center">
-                <div className="text-6xl mb-4">âš¡</div>
+                <div className="text-6xl mb-4">⚡</div>
                 <h2 className="text-xl font-semibold text-cad-text-primary mb-2">
                   Welcome to PwrSysPro
                 </h2>
@@ -157,11 +157,11 @@ function App() {
           </span>
           {currentProject && (
             <>
-              <span>â€¢</span>
+              <span>•</span>
               <span>Standards: {currentProject.standard_short_circuit}</span>
-              <span>â€¢</span>
+              <span>•</span>
               <span>Base MVA: {currentProject.base_mva}</span>
-              <span>â€¢</span>
+              <span>•</span>
               <span>Frequency: {currentProject.system_frequency} Hz</span>
             </>
           )}
@@ -169,9 +169,9 @@ function App() {
         
         <div className="flex items-center space-x-4">
           <span className="text-cad-success font-medium">Phase 4: Professional Reports</span>
-          <span>â€¢</span>
-          <span>IEEE 1584 â€¢ PDF Reports</span>
-          <span>â€¢</span>
+          <span>•</span>
+          <span>IEEE 1584 • PDF Reports</span>
+          <span>•</span>
           <span>v4.0.0</span>
         </div>
       </div>
@@ -45,12 +45,12 @@ const ComponentLibrary = () => {
 
   // Group basic components (not from library)
   const basicComponents = [
-    { type: 'Source', icon: 'âš¡', label: 'Power Source', color: 'text-yellow-500' },
-    { type: 'Bus', icon: 'â–¬', label: 'Busbar', color: 'text-blue-500' },
-    { type: 'Transformer', icon: 'ðŸ”„', label: 'Transformer', color: 'text-purple-500' },
+    { type: 'Source', icon: '⚡', label: 'Power Source', color: 'text-yellow-500' },
+    { type: 'Bus', icon: '▬', label: 'Busbar', color: 'text-blue-500' },
+    { type: 'Transformer', icon: '🔄', label: 'Transformer', color: 'text-purple-500' },
     { type: 'Motor', icon: 'M~', label: 'Motor', color: 'text-green-500' },
-    { type: 'Load', icon: 'ðŸ’¡', label: 'Load', color: 'text-orange-500' },
-    { type: 'Breaker', icon: 'âŠ¥âŠ¥', label: 'Circuit Breaker', color: 'text-red-500' },
+    { type: 'Load', icon: '💡', label: 'Load', color: 'text-orange-500' },
+    { type: 'Breaker', icon: '⊥⊥', label: 'Circuit Breaker', color: 'text-red-500' },
   ];
 
   return (
@@ -138,7 +138,7 @@ const ComponentLibrary = () => {
                       {component.manufacturer} {component.model}
                     </div>
                     <div className="text-xs text-cad-text-secondary">
-                      {component.type} â€¢ {component.voltage_rating}kV
+                      {component.type} • {component.voltage_rating}kV
                     </div>
                     {component.ampacity_base && (
                       <div className="text-xs text-cad-accent">
@@ -161,13 +161,13 @@ const ComponentLibrary = () => {
       {/* Help Text */}
       <div className="mt-6 p-3 bg-cad-dark rounded-lg border border-cad-border">
         <h4 className="text-xs font-medium text-cad-text-primary mb-2">
-          ðŸ’¡ Quick Tips
+          💡 Quick Tips
         </h4>
         <ul className="text-xs text-cad-text-secondary space-y-1">
-          <li>â€¢ Drag components to canvas</li>
-          <li>â€¢ Connect by dragging handles</li>
-          <li>â€¢ Click to edit properties</li>
-          <li>â€¢ Auto-tag updates on connection</li>
+          <li>• Drag components to canvas</li>
+          <li>• Connect by dragging handles</li>
+          <li>• Click to edit properties</li>
+          <li>• Auto-tag updates on connection</li>
         </ul>
       </div>
     </div>
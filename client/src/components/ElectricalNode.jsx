@@ -10,17 +10,17 @@ const ElectricalNode = ({ data, selected }) => {
   // Determine node icon based on component type
   const getNodeIcon = (type) => {
     const icons = {
-      Source: 'âš¡',
-      Transformer: 'ðŸ”„',
-      Bus: 'â–¬',
-      Breaker: 'âŠ¥âŠ¥',
+      Source: '⚡',
+      Transformer: '🔄',
+      Bus: '▬',
+      Breaker: '⊥⊥',
       Motor: 'M~',
-      Cable: 'â€”',
-      Load: 'ðŸ’¡',
-      Panel: 'â–­',
+      Cable: '—',
+      Load: '💡',
+      Panel: '▭',
       Generator: 'G~',
     };
-    return icons[type] || 'â—¯';
+    return icons[type] || '◯';
   };
 
   // Determine status color
@@ -99,7 +99,7 @@ const ElectricalNode = ({ data, selected }) => {
           )}
           {data.results.voltage_drop_percent && (
             <div className="text-xs">
-              <span className="text-cad-text-secondary">Î”V: </span>
+              <span className="text-cad-text-secondary">ΔV: </span>
               <span className={`font-mono ${
                 data.results.voltage_drop_percent > 5 ? 'text-cad-danger' : 'text-cad-success'
               }`}>
@@ -37,11 +37,11 @@ const FileOperations = ({ projectId, currentProject }) => {
         document.body.removeChild(a);
         window.URL.revokeObjectURL(url);
 
-        alert('âœ… Project exported successfully!');
+        alert('✅ Project exported successfully!');
       }
     } catch (error) {
       console.error('Export error:', error);
-      alert('âŒ Export failed: ' + (error.response?.data?.detail || error.message));
+      alert('❌ Export failed: ' + (error.response?.data?.detail || error.message));
     } finally {
       setIsExporting(false);
     }
@@ -60,7 +60,7 @@ const FileOperations = ({ projectId, currentProject }) => {
 
       if (response.data.status === 'success') {
         alert(
-          `âœ… Project imported successfully!\n\n` +
+          `✅ Project imported successfully!\n\n` +
           `Project: ${response.data.project_name}\n` +
           `Nodes: ${response.data.nodes_imported}\n` +
           `Connections: ${response.data.connections_imported}\n\n` +
@@ -70,7 +70,7 @@ const FileOperations = ({ projectId, currentProject }) => {
       }
     } catch (error) {
       console.error('Import error:', error);
-      alert('âŒ Import failed: ' + (error.response?.data?.detail || error.message));
+      alert('❌ Import failed: ' + (error.response?.data?.detail || error.message));
     } finally {
       setIsImporting(false);
       event.target.value = ''; // Reset input
@@ -92,7 +92,7 @@ const FileOperations = ({ projectId, currentProject }) => {
             Exporting...
           </span>
         ) : (
-          'ðŸ’¾ Export Project'
+          '💾 Export Project'
         )}
       </button>
 
@@ -103,7 +103,7 @@ const FileOperations = ({ projectId, currentProject }) => {
         className="btn btn-secondary text-sm"
         title="Import project from .psp file"
       >
-        ðŸ“‚ Import Project
+        📂 Import Project
       </button>
 
       {/* Import Dialog */}
@@ -111,7 +111,7 @@ const FileOperations = ({ projectId, currentProject }) => {
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
           <div className="bg-cad-panel border border-cad-border rounded-lg w-96 p-6">
             <h2 className="text-lg font-semibold text-cad-text-primary mb-4">
-              ðŸ“‚ Import Project
+              📂 Import Project
             </h2>
 
             <div className="mb-4 text-sm text-cad-text-secondary">
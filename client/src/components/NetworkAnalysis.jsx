@@ -52,7 +52,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
     } catch (err) {
       console.error('Analysis error:', err);
       setError(err.response?.data?.detail || err.message);
-      alert(`âŒ Analysis failed: ${err.response?.data?.detail || err.message}`);
+      alert(`❌ Analysis failed: ${err.response?.data?.detail || err.message}`);
     } finally {
       setLoading(false);
     }
@@ -72,7 +72,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             Analyzing...
           </span>
         ) : (
-          'âš¡ Short Circuit'
+          '⚡ Short Circuit'
         )}
       </button>
 
@@ -88,7 +88,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             Analyzing...
           </span>
         ) : (
-          'ðŸ“ˆ Load Flow'
+          '📈 Load Flow'
         )}
       </button>
 
@@ -104,7 +104,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             Analyzing...
           </span>
         ) : (
-          'ðŸ”¥ Arc Flash'
+          '🔥 Arc Flash'
         )}
       </button>
 
@@ -120,7 +120,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             Analyzing...
           </span>
         ) : (
-          'ðŸŽ¯ Complete Analysis'
+          '🎯 Complete Analysis'
         )}
       </button>
     </div>
@@ -151,7 +151,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
               onClick={() => setIsOpen(false)}
               className="btn btn-secondary text-sm"
             >
-              âœ• Close
+              ✕ Close
             </button>
           </div>
 
@@ -163,7 +163,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                 {/* Project Info */}
                 <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                   <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                    ðŸ“‹ Project Information
+                    📋 Project Information
                   </h3>
                   <div className="grid grid-cols-4 gap-4 text-sm">
                     <div>
@@ -193,7 +193,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                 {results.short_circuit_summary && (
                   <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                     <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                      âš¡ Short Circuit Summary
+                      ⚡ Short Circuit Summary
                     </h3>
                     <div className="grid grid-cols-3 gap-4">
                       <div className="text-center p-3 bg-cad-panel rounded-lg">
@@ -222,12 +222,12 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                 {results.load_flow_summary && (
                   <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                     <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                      ðŸ“ˆ Load Flow Summary
+                      📈 Load Flow Summary
                     </h3>
                     <div className="grid grid-cols-4 gap-4">
                       <div className="text-center p-3 bg-cad-panel rounded-lg">
                         <div className="text-xl font-bold text-cad-success">
-                          {results.load_flow_summary.converged ? 'âœ…' : 'âŒ'}
+                          {results.load_flow_summary.converged ? '✅' : '❌'}
                         </div>
                         <div className="text-sm text-cad-text-secondary">
                           {results.load_flow_summary.converged ? 'Converged' : 'Not Converged'}
@@ -262,7 +262,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                 {results.breaker_summary && (
                   <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                     <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                      ðŸ”’ Breaker Validation Summary
+                      🔒 Breaker Validation Summary
                     </h3>
                     <div className="grid grid-cols-3 gap-4">
                       <div className="text-center p-3 bg-cad-panel rounded-lg">
@@ -273,13 +273,13 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                       </div>
                       <div className="text-center p-3 bg-cad-panel rounded-lg">
                         <div className="text-xl font-bold text-cad-success">
-                          {results.breaker_summary.pass} âœ…
+                          {results.breaker_summary.pass} ✅
                         </div>
                         <div className="text-sm text-cad-text-secondary">Pass</div>
                       </div>
                       <div className="text-center p-3 bg-cad-panel rounded-lg">
                         <div className="text-xl font-bold text-cad-danger">
-                          {results.breaker_summary.fail} âŒ
+                          {results.breaker_summary.fail} ❌
                         </div>
                         <div className="text-sm text-cad-text-secondary">Fail</div>
                       </div>
@@ -293,14 +293,14 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             {analysisType === 'arc-flash' && results.results && Object.keys(results.results).length > 0 && (
               <div className="bg-cad-dark p-4 rounded-lg border border-cad-danger">
                 <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                  ðŸ”¥ Arc Flash Analysis Results (IEEE 1584-2018)
+                  🔥 Arc Flash Analysis Results (IEEE 1584-2018)
                 </h3>
                 <div className="overflow-x-auto">
                   <table className="w-full text-sm">
                     <thead>
                       <tr className="border-b border-cad-border">
                         <th className="text-left p-2 text-cad-text-secondary">Bus</th>
-                        <th className="text-right p-2 text-cad-text-secondary">IE (cal/cmÂ²)</th>
+                        <th className="text-right p-2 text-cad-text-secondary">IE (cal/cm²)</th>
                         <th className="text-right p-2 text-cad-text-secondary">AFB (ft)</th>
                         <th className="text-center p-2 text-cad-text-secondary">PPE Cat</th>
                         <th className="text-center p-2 text-cad-text-secondary">Hazard</th>
@@ -331,7 +331,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                             </span>
                           </td>
                           <td className="p-2 text-center text-xs">{data.hazard_level}</td>
-                          <td className="p-2 text-center">{data.is_safe ? 'âœ…' : 'âš ï¸'}</td>
+                          <td className="p-2 text-center">{data.is_safe ? '✅' : '⚠️'}</td>
                         </tr>
                       ))}
                     </tbody>
@@ -341,12 +341,12 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                 {/* Safety Warning */}
                 <div className="mt-4 p-3 bg-cad-danger bg-opacity-10 border border-cad-danger rounded-lg">
                   <div className="flex items-start space-x-2">
-                    <span className="text-xl">âš ï¸</span>
+                    <span className="text-xl">⚠️</span>
                     <div className="text-sm">
                       <div className="font-medium text-cad-danger mb-1">Safety Notice</div>
                       <div className="text-cad-text-secondary">
                         All personnel must wear appropriate PPE as indicated above when working on energized equipment.
-                        Consider de-energizing equipment when incident energy exceeds 40 cal/cmÂ².
+                        Consider de-energizing equipment when incident energy exceeds 40 cal/cm².
                       </div>
                     </div>
                   </div>
@@ -358,7 +358,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             {results.results && Object.keys(results.results).length > 0 && (
               <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                 <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                  âš¡ Short Circuit Detailed Results
+                  ⚡ Short Circuit Detailed Results
                 </h3>
                 <div className="overflow-x-auto">
                   <table className="w-full text-sm">
@@ -391,7 +391,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
             {results.bus_results && Object.keys(results.bus_results).length > 0 && (
               <div className="bg-cad-dark p-4 rounded-lg border border-cad-border">
                 <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                  ðŸ“ˆ Load Flow Detailed Results
+                  📈 Load Flow Detailed Results
                 </h3>
                 <div className="overflow-x-auto">
                   <table className="w-full text-sm">
@@ -399,7 +399,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                       <tr className="border-b border-cad-border">
                         <th className="text-left p-2 text-cad-text-secondary">Bus</th>
                         <th className="text-right p-2 text-cad-text-secondary">V (pu)</th>
-                        <th className="text-right p-2 text-cad-text-secondary">Î¸ (deg)</th>
+                        <th className="text-right p-2 text-cad-text-secondary">θ (deg)</th>
                         <th className="text-right p-2 text-cad-text-secondary">P (MW)</th>
                         <th className="text-right p-2 text-cad-text-secondary">Q (MVAR)</th>
                       </tr>
@@ -415,7 +415,7 @@ const NetworkAnalysis = ({ projectId, currentProject }) => {
                           }`}>
                             {data.v_magnitude_pu}
                           </td>
-                          <td className="p-2 text-right">{data.v_angle_deg}Â°</td>
+                          <td className="p-2 text-right">{data.v_angle_deg}°</td>
                           <td className="p-2 text-right">{data.p_mw}</td>
                           <td className="p-2 text-right">{data.q_mvar}</td>
                         </tr>
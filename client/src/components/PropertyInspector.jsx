@@ -51,7 +51,7 @@ const PropertyInspector = ({ selectedNode }) => {
     return (
       <div className="property-inspector w-80 h-full p-4">
         <div className="text-center text-cad-text-secondary py-8">
-          <div className="text-4xl mb-3">â—¯</div>
+          <div className="text-4xl mb-3">◯</div>
           <p className="text-sm">Select a component to view properties</p>
         </div>
       </div>
@@ -66,12 +66,12 @@ const PropertyInspector = ({ selectedNode }) => {
       <div className="mb-6">
         <div className="flex items-center space-x-3 mb-2">
           <span className="text-3xl">
-            {data.type === 'Source' && 'âš¡'}
-            {data.type === 'Transformer' && 'ðŸ”„'}
+            {data.type === 'Source' && '⚡'}
+            {data.type === 'Transformer' && '🔄'}
             {data.type === 'Motor' && 'M~'}
-            {data.type === 'Bus' && 'â–¬'}
-            {data.type === 'Breaker' && 'âŠ¥âŠ¥'}
-            {data.type === 'Load' && 'ðŸ’¡'}
+            {data.type === 'Bus' && '▬'}
+            {data.type === 'Breaker' && '⊥⊥'}
+            {data.type === 'Load' && '💡'}
           </span>
           <div>
             <h2 className="text-lg font-semibold text-cad-text-primary">
@@ -131,7 +131,7 @@ const PropertyInspector = ({ selectedNode }) => {
               <div>
                 <label className="property-label">Resistance (R)</label>
                 <div className="property-value bg-opacity-50">
-                  {data.component.impedance_r} Î©/km
+                  {data.component.impedance_r} Ω/km
                 </div>
               </div>
             )}
@@ -140,7 +140,7 @@ const PropertyInspector = ({ selectedNode }) => {
               <div>
                 <label className="property-label">Reactance (X)</label>
                 <div className="property-value bg-opacity-50">
-                  {data.component.impedance_x} Î©/km
+                  {data.component.impedance_x} Ω/km
                 </div>
               </div>
             )}
@@ -174,7 +174,7 @@ const PropertyInspector = ({ selectedNode }) => {
               Calculating...
             </span>
           ) : (
-            'âš¡ Calculate Voltage Drop'
+            '⚡ Calculate Voltage Drop'
           )}
         </button>
 
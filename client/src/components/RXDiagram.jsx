@@ -65,7 +65,7 @@ const RXDiagram = ({ projectId, projectName }) => {
   return (
     <div className="rx-diagram-container">
       <div className="flex items-center justify-between mb-4">
-        <h3 className="text-xl font-bold">ðŸ“Š R-X Impedance Diagram</h3>
+        <h3 className="text-xl font-bold">📊 R-X Impedance Diagram</h3>
         
         <div className="flex gap-2">
           <button
@@ -75,12 +75,12 @@ const RXDiagram = ({ projectId, projectName }) => {
           >
             {loading ? (
               <>
-                <span className="animate-spin">â³</span>
+                <span className="animate-spin">⏳</span>
                 Generating...
               </>
             ) : (
               <>
-                ðŸ“Š Generate Diagram
+                📊 Generate Diagram
               </>
             )}
           </button>
@@ -105,19 +105,19 @@ const RXDiagram = ({ projectId, projectName }) => {
                 onClick={downloadPNG}
                 className="px-4 py-2 bg-green-600 text-white rounded hover:bg-green-700 flex items-center gap-2"
               >
-                ðŸ“¥ Download PNG
+                📥 Download PNG
               </button>
               <button
                 onClick={downloadSVG}
                 className="px-4 py-2 bg-purple-600 text-white rounded hover:bg-purple-700 flex items-center gap-2"
               >
-                ðŸ“¥ Download SVG
+                📥 Download SVG
               </button>
               <button
                 onClick={() => setShowStats(!showStats)}
                 className="px-4 py-2 bg-gray-600 text-white rounded hover:bg-gray-700"
               >
-                {showStats ? 'ðŸ“Š Hide Stats' : 'ðŸ“Š Show Stats'}
+                {showStats ? '📊 Hide Stats' : '📊 Show Stats'}
               </button>
             </div>
           </div>
@@ -125,7 +125,7 @@ const RXDiagram = ({ projectId, projectName }) => {
           {/* Statistics */}
           {showStats && diagramData.statistics && (
             <div className="bg-white rounded-lg shadow-lg p-6">
-              <h4 className="text-lg font-bold mb-4">ðŸ“ˆ Impedance Statistics</h4>
+              <h4 className="text-lg font-bold mb-4">📈 Impedance Statistics</h4>
               
               <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
                 <div className="bg-blue-50 p-4 rounded-lg">
@@ -169,7 +169,7 @@ const RXDiagram = ({ projectId, projectName }) => {
                         <th className="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase">R (pu)</th>
                         <th className="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase">X (pu)</th>
                         <th className="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase">Z (pu)</th>
-                        <th className="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase">Angle (Â°)</th>
+                        <th className="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase">Angle (°)</th>
                       </tr>
                     </thead>
                     <tbody className="bg-white divide-y divide-gray-200">
@@ -180,7 +180,7 @@ const RXDiagram = ({ projectId, projectName }) => {
                           <td className="px-4 py-3 text-sm">{comp.r?.toFixed(4)}</td>
                           <td className="px-4 py-3 text-sm">{comp.x?.toFixed(4)}</td>
                           <td className="px-4 py-3 text-sm">{comp.z?.toFixed(4)}</td>
-                          <td className="px-4 py-3 text-sm">{comp.angle?.toFixed(1)}Â°</td>
+                          <td className="px-4 py-3 text-sm">{comp.angle?.toFixed(1)}°</td>
                         </tr>
                       ))}
                     </tbody>
@@ -192,7 +192,7 @@ const RXDiagram = ({ projectId, projectName }) => {
 
           {/* Help Text */}
           <div className="mt-4 bg-blue-50 border-l-4 border-blue-500 p-4">
-            <h5 className="font-bold text-blue-900 mb-2">ðŸ“– About R-X Diagrams</h5>
+            <h5 className="font-bold text-blue-900 mb-2">📖 About R-X Diagrams</h5>
             <p className="text-sm text-blue-800">
               The R-X diagram plots component impedances on the Resistance-Reactance plane.
               This visualization helps in:
@@ -212,7 +212,7 @@ const RXDiagram = ({ projectId, projectName }) => {
 
       {!diagramData && !loading && (
         <div className="bg-gray-50 border-2 border-dashed border-gray-300 rounded-lg p-12 text-center">
-          <div className="text-6xl mb-4">ðŸ“Š</div>
+          <div className="text-6xl mb-4">📊</div>
           <h4 className="text-xl font-bold text-gray-700 mb-2">No Diagram Generated</h4>
           <p className="text-gray-600 mb-4">
             Click "Generate Diagram" to create an R-X impedance diagram for this project.
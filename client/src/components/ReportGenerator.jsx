@@ -18,33 +18,30 @@ const ReportGenerator = ({ projectId, currentProject }) => {
     setGenerating(true);
     try {
       const response = await axios.post(
-        `http://localhost:8000/api/projects/${projectId}/generate-report`
+        `http://localhost:8000/api/projects/${projectId}/generate-report`,
+        null,
+        { responseType: 'blob' }
       );
 
-      if (response.data.status === 'success') {
-        // Convert base64 to blob
-        const binaryString = window.atob(response.data.pdf_data);
-        const bytes = new Uint8Array(binaryString.length);
-        for (let i = 0; i < binaryString.length; i++) {
-          bytes[i] = binaryString.charCodeAt(i);
-        }
-        const blob = new Blob([bytes], { type: 'application/pdf' });
+      if (response.status === 200) {
+        const reportName = `${currentProject?.name || 'Project'}_Report.pdf`;
+        const blob = new Blob([response.data], { type: 'application/pdf' });
 
         // Create download link
         const url = window.URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;
-        a.download = response.data.report_name;
+        a.download = reportName;
         document.body.appendChild(a);
         a.click();
         document.body.removeChild(a);
         window.URL.revokeObjectURL(url);
 
-        alert(`âœ… Report generated successfully!\n\nFile: ${response.data.report_name}`);
+        alert(`✅ Report generated successfully!\n\nFile: ${reportName}`);
       }
     } catch (error) {
       console.error('Report generation error:', error);
-      alert(`âŒ Report generation failed: ${error.response?.data?.detail || error.message}`);
+      alert(`❌ Report generation failed: ${error.response?.data?.detail || error.message}`);
     } finally {
       setGenerating(false);
     }
@@ -63,7 +60,7 @@ const ReportGenerator = ({ projectId, currentProject }) => {
           Generating...
         </span>
       ) : (
-        'ðŸ“„ Generate Report'
+        '📄 Generate Report'
       )}
     </button>
   );
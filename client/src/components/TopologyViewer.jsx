@@ -41,7 +41,7 @@ const TopologyViewer = ({ projectId }) => {
         onClick={() => setIsOpen(true)}
         className="btn btn-secondary text-sm"
       >
-        ðŸ” Analyze Topology
+        🔍 Analyze Topology
       </button>
     );
   }
@@ -52,7 +52,7 @@ const TopologyViewer = ({ projectId }) => {
         {/* Header */}
         <div className="flex items-center justify-between p-4 border-b border-cad-border">
           <h2 className="text-lg font-semibold text-cad-text-primary">
-            ðŸ”— Network Topology Analysis
+            🔗 Network Topology Analysis
           </h2>
           <div className="flex items-center space-x-2">
             <button
@@ -60,13 +60,13 @@ const TopologyViewer = ({ projectId }) => {
               disabled={loading}
               className="btn btn-primary text-sm"
             >
-              {loading ? 'ðŸ”„ Analyzing...' : 'ðŸ”„ Refresh'}
+              {loading ? '🔄 Analyzing...' : '🔄 Refresh'}
             </button>
             <button
               onClick={() => setIsOpen(false)}
               className="btn btn-secondary text-sm"
             >
-              âœ• Close
+              ✕ Close
             </button>
           </div>
         </div>
@@ -111,7 +111,7 @@ const TopologyViewer = ({ projectId }) => {
               {Object.keys(topology.topology.buses).length > 0 && (
                 <div>
                   <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                    ðŸšŒ Identified Buses
+                    🚌 Identified Buses
                   </h3>
                   <div className="space-y-2">
                     {Object.entries(topology.topology.buses).map(([busName, nodeIds]) => (
@@ -133,7 +133,7 @@ const TopologyViewer = ({ projectId }) => {
               {topology.loops && topology.loops.length > 0 && (
                 <div>
                   <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                    ðŸ”„ Detected Loops
+                    🔄 Detected Loops
                   </h3>
                   <div className="space-y-2">
                     {topology.loops.map((loop, index) => (
@@ -155,7 +155,7 @@ const TopologyViewer = ({ projectId }) => {
               {topology.validation_issues && topology.validation_issues.length > 0 ? (
                 <div>
                   <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                    âš ï¸ Validation Issues
+                    ⚠️ Validation Issues
                   </h3>
                   <div className="space-y-2">
                     {topology.validation_issues.map((issue, index) => (
@@ -175,7 +175,7 @@ const TopologyViewer = ({ projectId }) => {
               ) : (
                 <div className="bg-cad-success bg-opacity-10 border border-cad-success rounded-lg p-4">
                   <div className="flex items-center space-x-2">
-                    <span className="text-2xl">âœ…</span>
+                    <span className="text-2xl">✅</span>
                     <div>
                       <div className="font-medium text-cad-success">No Issues Found</div>
                       <div className="text-sm text-cad-text-secondary">
@@ -190,7 +190,7 @@ const TopologyViewer = ({ projectId }) => {
               {topology.topology.nodes && (
                 <div>
                   <h3 className="text-md font-semibold text-cad-text-primary mb-3">
-                    ðŸ“Š Network Levels
+                    📊 Network Levels
                   </h3>
                   <div className="bg-cad-dark p-4 rounded-lg border border-cad-border max-h-60 overflow-y-auto">
                     <div className="space-y-1 font-mono text-sm">
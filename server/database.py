@@ -4,9 +4,11 @@ Defines the SQLAlchemy models for the component library, project nodes, and conn
 Standards Reference: IEC 60364-5-52 (Cable Ampacity), IEC 60909 (Short Circuit)
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, JSON, ForeignKey, DateTime
+import os
+
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, deferred
 from datetime import datetime
 
 Base = declarative_base()
@@ -32,15 +34,15 @@ class ComponentLibrary(Base):
     # Thermal & Protection Parameters
     ampacity_base = Column(Float)  # Base current rating in Amps
     short_circuit_rating = Column(Float)  # kAIC rating for breakers
-    thermal_limit_i2t = Column(Float)  # IÂ²t withstand for cables
+    thermal_limit_i2t = Column(Float)  # I²t withstand for cables
     
     # Physical & Installation Data
-    cross_section = Column(Float)  # Cable CSA in mmÂ²
+    cross_section = Column(Float)  # Cable CSA in mm²
     conductor_material = Column(String)  # Copper, Aluminum
     insulation_type = Column(String)  # XLPE, PVC, EPR
     
-    # Additional properties stored as JSON
-    properties = Column(JSON)  # Trip curves, dimensions, etc.
+    # Additional properties stored as JSON (deferred - only loaded when requested)
+    properties = deferred(Column(JSON))  # Trip curves, dimensions, etc.
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -83,9 +85,14 @@ class ProjectNode(Base):
     Each node has a position, type, and auto-generated tag.
     """
     __tablename__ = 'project_nodes'
+    __table_args__ = (
+        Index('ix_nodes_proj_type', 'project_id', 'type'),  # Type-filtered project queries
+    )
+    # Fetch generated id/created_at via INSERT ... RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False, index=True)
     
     # Canvas Position
     position_x = Column(Float, nullable=False)
@@ -96,19 +103,19 @@ class ProjectNode(Base):
     custom_tag = Column(String)  # Auto-generated tag: [TYPE]-[V]-[FROM]-[TO]-[SEQ]
     
     # Link to Component Library
-    component_library_id = Column(Integer, ForeignKey('component_library.id'))
+    component_library_id = Column(Integer, ForeignKey('component_library.id'), index=True)
     component_library = relationship("ComponentLibrary")
     
-    # Node-specific properties (JSON blob for flexibility)
-    properties = Column(JSON)  # Length, trip settings, load details, etc.
+    # Node-specific properties (JSON blob for flexibility, deferred)
+    properties = deferred(Column(JSON))  # Length, trip settings, load details, etc.
     
     # Location Hierarchy (for cable routing and derating)
     location_site = Column(String)
     location_building = Column(String)
     location_room = Column(String)
     
-    # Calculation Results (cached)
-    results = Column(JSON)  # Voltage drop, fault current, etc.
+    # Calculation Results (cached, deferred)
+    results = deferred(Column(JSON))  # Voltage drop, fault current, etc.
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -137,14 +144,14 @@ class ProjectConnection(Base):
     __tablename__ = 'project_connections'
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False, index=True)
     
     # Source and Target Nodes
-    source_node_id = Column(Integer, ForeignKey('project_nodes.id'), nullable=False)
-    target_node_id = Column(Integer, ForeignKey('project_nodes.id'), nullable=False)
+    source_node_id = Column(Integer, ForeignKey('project_nodes.id'), nullable=False, index=True)
+    target_node_id = Column(Integer, ForeignKey('project_nodes.id'), nullable=False, index=True)
     
     # Cable/Connection Properties
-    cable_library_id = Column(Integer, ForeignKey('component_library.id'))
+    cable_library_id = Column(Integer, ForeignKey('component_library.id'), index=True)
     cable_library = relationship("ComponentLibrary")
     
     # Physical Parameters
@@ -153,7 +160,7 @@ class ProjectConnection(Base):
     # Installation Conditions (for derating per IEC 60364-5-52)
     installation_method = Column(String)  # Tray, Conduit, Underground
     grouping_factor = Column(Float, default=1.0)
-    ambient_temp = Column(Float, default=30.0)  # Â°C
+    ambient_temp = Column(Float, default=30.0)  # °C
     
     # Connection Properties
     properties = Column(JSON)  # Additional settings
@@ -166,7 +173,7 @@ class ProjectConnection(Base):
     target_node = relationship("ProjectNode", foreign_keys=[target_node_id], back_populates="incoming_connections")
     
     def __repr__(self):
-        return f"<Connection {self.source_node_id} â†’ {self.target_node_id}>"
+        return f"<Connection {self.source_node_id} → {self.target_node_id}>"
 
 
 class CalculationHistory(Base):
@@ -182,21 +189,70 @@ class CalculationHistory(Base):
     calculation_type = Column(String, nullable=False)  # ShortCircuit, LoadFlow, VoltageDrop
     timestamp = Column(DateTime, default=datetime.utcnow)
     
-    # Snapshot of system state when calculation was performed
-    system_snapshot = Column(JSON)
+    # Snapshot of system state when calculation was performed (deferred)
+    system_snapshot = deferred(Column(JSON))
     
-    # Results
-    results = Column(JSON)
+    # Results (deferred)
+    results = deferred(Column(JSON))
     is_valid = Column(Integer, default=1)  # 1 = Valid, 0 = Invalidated by changes
     
     def __repr__(self):
         return f"<Calculation {self.calculation_type} at {self.timestamp}>"
 
 
+# Connection pool settings (override via environment for production deployments)
+DB_POOL_SIZE = int(os.environ.get("PWRSYSPRO_DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.environ.get("PWRSYSPRO_DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(os.environ.get("PWRSYSPRO_DB_POOL_TIMEOUT", 30))  # seconds
+DB_POOL_RECYCLE = int(os.environ.get("PWRSYSPRO_DB_POOL_RECYCLE", 3600))  # seconds
+
+# Bulk insert batching (executemany of INSERT ... VALUES)
+DB_INSERT_PAGE_SIZE = int(os.environ.get("PWRSYSPRO_DB_INSERT_PAGE_SIZE", 1000))
+DB_BATCH_PAGE_SIZE = int(os.environ.get("PWRSYSPRO_DB_BATCH_PAGE_SIZE", 500))
+
+# Compiled SQL statement cache (per engine); SQLAlchemy's default is 500
+DB_QUERY_CACHE_SIZE = int(os.environ.get("PWRSYSPRO_DB_QUERY_CACHE_SIZE", 1200))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection.
+    WAL lets readers proceed during writes; synchronous=NORMAL is safe under WAL
+    and avoids the second fsync per commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    cursor.close()
+
+
 # Database initialization
 def init_db(db_path='sqlite:///pwrsyspro.db'):
     """Initialize the database with tables."""
-    engine = create_engine(db_path, connect_args={"check_same_thread": False})
+    engine_kwargs = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "query_cache_size": DB_QUERY_CACHE_SIZE,
+    }
+    if db_path.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        engine_kwargs["insertmanyvalues_page_size"] = DB_INSERT_PAGE_SIZE
+    if db_path.startswith(("postgresql://", "postgresql+psycopg2://")):
+        # psycopg2: multi-row VALUES for INSERTs, execute_batch for UPDATE/DELETE
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+        engine_kwargs["executemany_batch_page_size"] = DB_BATCH_PAGE_SIZE
+    
+    engine = create_engine(db_path, **engine_kwargs)
+    
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    
     Base.metadata.create_all(bind=engine)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return engine, SessionLocal
@@ -3,12 +3,24 @@ PwrSysPro Analysis Suite - FastAPI Server
 Main application entry point with REST API endpoints.
 """
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import select, update, insert, func, case
+from sqlalchemy.orm import Session, undefer
+from typing import Dict, Iterator, List, Optional, Tuple
 from pydantic import BaseModel
-import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import anyio
+import orjson
 
 from models.database import init_db, get_db_session, ComponentLibrary, Project, ProjectNode, ProjectConnection
 from utils.tagging import generate_tag, update_tag_on_move, validate_tag
@@ -19,7 +31,7 @@ from utils.tagging_enhanced import (
 )
 from utils.topology import (
     TopologyGraph, TopologyNode, TopologyEdge,
-    build_topology_from_database
+    build_topology_from_database, build_topology_from_rows
 )
 from utils.serialization import PSPFileFormat, create_backup
 from utils.calculations import (
@@ -28,19 +40,17 @@ from utils.calculations import (
     calculate_cable_derating_factor,
     check_cable_sizing
 )
-from utils.per_unit import PerUnitSystem
-from utils.short_circuit import IEC60909Calculator, ShortCircuitParameters
-from utils.load_flow import NewtonRaphsonLoadFlow, BusType
-from utils.integrated_calc import IntegratedCalculationService
-from utils.arc_flash import calculate_arc_flash_for_bus, IEEE1584ArcFlashCalculator
-from utils.report_generator import generate_analysis_report, PwrSysProReportGenerator
-from utils.protection import ProtectionCoordinator, ProtectiveDeviceSettings, recommend_relay_settings
+# Calculation engines (numpy, reportlab, ...) are imported inside the
+# endpoints that use them to keep worker start-up light.
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="PwrSysPro Analysis Suite API",
     description="Backend API for electrical power system analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson: faster encoding, native NumPy support
 )
 
 # CORS configuration for React frontend
@@ -52,11 +62,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Sync (DB-bound) endpoints run in the AnyIO worker threadpool; its default of
+# 40 threads caps request concurrency well below what the DB pool can serve.
+THREADPOOL_SIZE = int(os.environ.get("PWRSYSPRO_THREADPOOL_SIZE", 100))
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Raise the worker threadpool limit used for sync endpoints."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+
 # Initialize database
 engine, SessionLocal = init_db()
 
 def get_db():
-    """Database session dependency."""
+    """
+    Database session dependency.
+    
+    The ORM session is synchronous, so endpoints that depend on it are declared
+    with plain ``def``; FastAPI runs them in its worker threadpool instead of
+    blocking the event loop.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -152,28 +179,87 @@ async def root():
     }
 
 
+# Component library is reference data that rarely changes, so list responses
+# are cached as pre-serialized JSON, keyed on component_library_version().
+def component_library_version(db: Session) -> Tuple:
+    """
+    Return the cache key for component library data, read from the database
+    so reseeding the library (delete + re-insert) is seen by every worker.
+    Combines the row count, max id and latest created_at.
+    """
+    return tuple(db.execute(
+        select(
+            func.count(ComponentLibrary.id),
+            func.max(ComponentLibrary.id),
+            func.max(ComponentLibrary.created_at)
+        )
+    ).one())
+
+
+# (type filter, library version) -> (json_body, etag), least recently used first
+_components_cache: "OrderedDict[Tuple, Tuple[bytes, str]]" = OrderedDict()
+_components_cache_lock = threading.Lock()
+COMPONENTS_CACHE_SIZE = 32
+
+
+def _components_payload(db: Session, type_filter: Optional[str]) -> Tuple[bytes, str]:
+    """
+    Query and serialize the component list once per (type, library version).
+    The version and, on a miss, the rows are read in the same session
+    and transaction, so a cached body always matches its version key.
+    Returns (json_body, etag).
+    """
+    key = (type_filter, component_library_version(db))
+    with _components_cache_lock:
+        cached = _components_cache.get(key)
+        if cached is not None:
+            _components_cache.move_to_end(key)
+            return cached
+    
+    stmt = select(
+        ComponentLibrary.id,
+        ComponentLibrary.type,
+        ComponentLibrary.model,
+        ComponentLibrary.manufacturer,
+        ComponentLibrary.voltage_rating,
+        ComponentLibrary.ampacity_base,
+        ComponentLibrary.impedance_r,
+        ComponentLibrary.impedance_x
+    )
+    if type_filter:
+        stmt = stmt.where(ComponentLibrary.type == type_filter)
+    
+    rows = db.execute(stmt).mappings().all()
+    
+    body = orjson.dumps([dict(row) for row in rows])
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    
+    with _components_cache_lock:
+        _components_cache[key] = (body, etag)
+        if len(_components_cache) > COMPONENTS_CACHE_SIZE:
+            _components_cache.popitem(last=False)
+    return body, etag
+
+
 @app.get("/api/components", response_model=List[ComponentLibraryResponse])
-async def get_components(
-    type: Optional[str] = None,
-    db: Session = Depends(get_db)
-):
+def get_components(request: Request, type: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Get all components from the library.
     Optionally filter by component type (Cable, Breaker, Transformer, Motor).
+    Supports conditional requests via ETag / If-None-Match.
     """
-    query = db.query(ComponentLibrary)
+    body, etag = _components_payload(db, type)
     
-    if type:
-        query = query.filter(ComponentLibrary.type == type)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     
-    components = query.all()
-    return components
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/components/{component_id}", response_model=ComponentLibraryResponse)
-async def get_component(component_id: int, db: Session = Depends(get_db)):
+def get_component(component_id: int, db: Session = Depends(get_db)):
     """Get a specific component by ID."""
-    component = db.query(ComponentLibrary).filter(ComponentLibrary.id == component_id).first()
+    component = db.get(ComponentLibrary, component_id)
     
     if not component:
         raise HTTPException(status_code=404, detail="Component not found")
@@ -186,16 +272,16 @@ async def get_component(component_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @app.get("/api/projects", response_model=List[ProjectResponse])
-async def get_projects(db: Session = Depends(get_db)):
+def get_projects(db: Session = Depends(get_db)):
     """Get all projects."""
     projects = db.query(Project).all()
     return projects
 
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+def get_project(project_id: int, db: Session = Depends(get_db)):
     """Get a specific project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -208,7 +294,7 @@ async def get_project(project_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @app.post("/api/nodes", response_model=NodeResponse)
-async def create_node(request: NodeCreateRequest, db: Session = Depends(get_db)):
+def create_node(request: NodeCreateRequest, db: Session = Depends(get_db)):
     """
     Create a new node on the canvas.
     Automatically generates a tag based on the component type and connections.
@@ -218,9 +304,7 @@ async def create_node(request: NodeCreateRequest, db: Session = Depends(get_db))
     voltage_kv = 0.4  # Default to 400V if not specified
     
     if request.component_library_id:
-        component = db.query(ComponentLibrary).filter(
-            ComponentLibrary.id == request.component_library_id
-        ).first()
+        component = db.get(ComponentLibrary, request.component_library_id)
         if component:
             voltage_kv = component.voltage_rating
     
@@ -245,28 +329,118 @@ async def create_node(request: NodeCreateRequest, db: Session = Depends(get_db))
     )
     
     db.add(node)
+    db.flush()  # INSERT ... RETURNING populates node.id without a refresh SELECT
+    response = NodeResponse.model_validate(node)
+    bump_project_version(db, request.project_id)
     db.commit()
-    db.refresh(node)
     
-    return node
+    return response
+
+
+@app.post("/api/nodes/bulk", response_model=List[NodeResponse])
+def create_nodes_bulk(requests: List[NodeCreateRequest], db: Session = Depends(get_db)):
+    """
+    Create many nodes in one request (SLD import, pasted sub-circuits).
+    Tags are generated in Python and all rows are inserted with a single
+    executemany INSERT ... RETURNING and one commit.
+    """
+    if not requests:
+        return []
+    
+    # Look up voltage ratings for all referenced components in one query
+    component_ids = {r.component_library_id for r in requests if r.component_library_id}
+    voltage_by_component = {}
+    if component_ids:
+        voltage_by_component = dict(db.execute(
+            select(ComponentLibrary.id, ComponentLibrary.voltage_rating)
+            .where(ComponentLibrary.id.in_(component_ids))
+        ).all())
+    
+    rows = [
+        {
+            "project_id": r.project_id,
+            "type": r.type,
+            "position_x": r.position_x,
+            "position_y": r.position_y,
+            "component_library_id": r.component_library_id,
+            "custom_tag": generate_tag(
+                component_type=r.type,
+                voltage_kv=voltage_by_component.get(r.component_library_id, 0.4),
+                from_bus=None,
+                to_bus=None,
+                sequence=1
+            ),
+            "properties": r.properties or {}
+        }
+        for r in requests
+    ]
+    
+    new_ids = db.execute(
+        insert(ProjectNode).returning(ProjectNode.id, sort_by_parameter_order=True),
+        rows
+    ).scalars().all()
+    for project_id in {r.project_id for r in requests}:
+        bump_project_version(db, project_id)
+    db.commit()
+    
+    return [
+        {
+            "id": node_id,
+            "type": row["type"],
+            "custom_tag": row["custom_tag"],
+            "position_x": row["position_x"],
+            "position_y": row["position_y"],
+            "properties": row["properties"]
+        }
+        for node_id, row in zip(new_ids, rows)
+    ]
+
+
+STREAM_BATCH_SIZE = 500
+
+
+def _stream_json_array(stmt) -> Iterator[bytes]:
+    """
+    Stream the rows of a Core select as a JSON array, one batch at a time.
+
+    The generator opens its own session: dependencies with ``yield`` are
+    torn down before a StreamingResponse body is iterated.
+    """
+    with SessionLocal() as db:
+        result = db.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        yield b"["
+        first = True
+        for row in result.mappings():
+            if not first:
+                yield b","
+            yield orjson.dumps(dict(row))
+            first = False
+        yield b"]"
 
 
 @app.get("/api/projects/{project_id}/nodes", response_model=List[NodeResponse])
-async def get_project_nodes(project_id: int, db: Session = Depends(get_db)):
+def get_project_nodes(project_id: int):
     """Get all nodes for a project."""
-    nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-    return nodes
+    stmt = select(
+        ProjectNode.id,
+        ProjectNode.type,
+        ProjectNode.custom_tag,
+        ProjectNode.position_x,
+        ProjectNode.position_y,
+        ProjectNode.properties,
+    ).where(ProjectNode.project_id == project_id)
+    return StreamingResponse(_stream_json_array(stmt), media_type="application/json")
 
 
 @app.put("/api/nodes/{node_id}/position")
-async def update_node_position(
+def update_node_position(
     node_id: int,
     position_x: float,
     position_y: float,
     db: Session = Depends(get_db)
 ):
     """Update node position on canvas."""
-    node = db.query(ProjectNode).filter(ProjectNode.id == node_id).first()
+    node = db.get(ProjectNode, node_id)
     
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
@@ -274,19 +448,22 @@ async def update_node_position(
     node.position_x = position_x
     node.position_y = position_y
     
+    bump_project_version(db, node.project_id)
     db.commit()
     return {"status": "success", "node_id": node_id}
 
 
 @app.delete("/api/nodes/{node_id}")
-async def delete_node(node_id: int, db: Session = Depends(get_db)):
+def delete_node(node_id: int, db: Session = Depends(get_db)):
     """Delete a node."""
-    node = db.query(ProjectNode).filter(ProjectNode.id == node_id).first()
+    node = db.get(ProjectNode, node_id)
     
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
     
+    project_id = node.project_id
     db.delete(node)
+    bump_project_version(db, project_id)
     db.commit()
     
     return {"status": "success", "message": "Node deleted"}
@@ -297,14 +474,20 @@ async def delete_node(node_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @app.post("/api/connections")
-async def create_connection(request: ConnectionCreateRequest, db: Session = Depends(get_db)):
+def create_connection(request: ConnectionCreateRequest, db: Session = Depends(get_db)):
     """
     Create a connection between two nodes.
     Updates tags of connected nodes to reflect the connection.
     """
-    # Validate nodes exist
-    source = db.query(ProjectNode).filter(ProjectNode.id == request.source_node_id).first()
-    target = db.query(ProjectNode).filter(ProjectNode.id == request.target_node_id).first()
+    # Validate both nodes exist with a single IN-list query
+    endpoint_rows = db.execute(
+        select(ProjectNode.id, ProjectNode.custom_tag, ProjectNode.type)
+        .where(ProjectNode.id.in_([request.source_node_id, request.target_node_id]))
+    ).all()
+    endpoints = {row.id: row for row in endpoint_rows}
+    
+    source = endpoints.get(request.source_node_id)
+    target = endpoints.get(request.target_node_id)
     
     if not source or not target:
         raise HTTPException(status_code=404, detail="Source or target node not found")
@@ -324,53 +507,65 @@ async def create_connection(request: ConnectionCreateRequest, db: Session = Depe
     # Update tags of connected nodes
     # For now, simple implementation - Phase 2 will have full topology awareness
     if source.custom_tag:
-        source.custom_tag = update_tag_on_move(
-            source.custom_tag,
-            new_to_bus=target.type
-        )
+        try:
+            new_tag = update_tag_on_move(source.custom_tag, new_to_bus=target.type)
+        except ValueError:
+            # Hand-edited or imported tag that can't be parsed; leave it as is
+            new_tag = None
+        
+        if new_tag is not None:
+            db.execute(
+                update(ProjectNode)
+                .where(ProjectNode.id == source.id)
+                .values(custom_tag=new_tag)
+            )
     
+    bump_project_version(db, request.project_id)
     db.commit()
     
     return {"status": "success", "connection_id": connection.id}
 
 
 @app.get("/api/projects/{project_id}/connections")
-async def get_project_connections(project_id: int, db: Session = Depends(get_db)):
+def get_project_connections(project_id: int):
     """Get all connections for a project."""
-    connections = db.query(ProjectConnection).filter(
-        ProjectConnection.project_id == project_id
-    ).all()
-    
-    return [
-        {
-            "id": conn.id,
-            "source_node_id": conn.source_node_id,
-            "target_node_id": conn.target_node_id,
-            "length": conn.length
-        }
-        for conn in connections
-    ]
+    stmt = select(
+        ProjectConnection.id,
+        ProjectConnection.source_node_id,
+        ProjectConnection.target_node_id,
+        ProjectConnection.length,
+    ).where(ProjectConnection.project_id == project_id)
+    return StreamingResponse(_stream_json_array(stmt), media_type="application/json")
 
 
 # ============================================================================
 # API ROUTES - Calculations
 # ============================================================================
 
+def _round_dict(d: dict, ndigits: int = 2, precision: Optional[Dict[str, int]] = None) -> dict:
+    """Round float values of a result dict once, just before it is returned."""
+    precision = precision or {}
+    return {
+        k: round(v, precision.get(k, ndigits)) if isinstance(v, float) else v
+        for k, v in d.items()
+    }
+
+
 @app.post("/api/calculate/voltage-drop")
 async def calculate_voltage_drop(request: VoltageDropCalculationRequest):
     """
     Calculate voltage drop for a cable run.
     
     Implements IEC 60364-5-52 standard formula:
-        Î”V = âˆš3 Ã— I Ã— (R Ã— cos(Ï†) + X Ã— sin(Ï†)) Ã— L (3-phase)
-        Î”V = 2 Ã— I Ã— (R Ã— cos(Ï†) + X Ã— sin(Ï†)) Ã— L (1-phase)
+        ΔV = √3 × I × (R × cos(φ) + X × sin(φ)) × L (3-phase)
+        ΔV = 2 × I × (R × cos(φ) + X × sin(φ)) × L (1-phase)
     """
-    # Calculate derating factors
-    derating = calculate_cable_derating_factor(
+    # Calculate derating factors (rounded before use, as the published factors)
+    derating = _round_dict(calculate_cable_derating_factor(
         ambient_temp_celsius=request.ambient_temp,
         number_of_cables_grouped=request.num_cables_grouped,
         installation_method=request.installation_method
-    )
+    ), 3)
     
     # Create cable parameters
     cable = CableParameters(
@@ -384,11 +579,14 @@ async def calculate_voltage_drop(request: VoltageDropCalculationRequest):
     )
     
     # Create load parameters
-    load = LoadParameters(
-        current_amps=request.load_current,
-        power_factor=request.power_factor,
-        voltage_nominal=request.voltage_nominal
-    )
+    try:
+        load = LoadParameters(
+            current_amps=request.load_current,
+            power_factor=request.power_factor,
+            voltage_nominal=request.voltage_nominal
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # Calculate voltage drop
     if request.phases == 3:
@@ -405,8 +603,8 @@ async def calculate_voltage_drop(request: VoltageDropCalculationRequest):
     )
     
     return {
-        "voltage_drop": vd_results,
-        "cable_sizing": sizing_results,
+        "voltage_drop": _round_dict(vd_results, 2, {"power_loss_kw": 3}),
+        "cable_sizing": _round_dict(sizing_results, 1),
         "derating_factors": derating,
         "cable_impedance": {
             "total_resistance_ohms": cable.total_resistance,
@@ -442,47 +640,83 @@ async def calculate_tag(
 # API ROUTES - Topology Analysis (Phase 2)
 # ============================================================================
 
-@app.get("/api/projects/{project_id}/topology")
-async def get_project_topology(project_id: int, db: Session = Depends(get_db)):
+# Topology responses are cached per project as pre-serialized JSON, keyed on
+# a version read from the database so every worker process sees the same
+# value. Every endpoint that writes nodes or connections touches the
+# project's updated_at in the same transaction, which retires cached entries.
+
+def bump_project_version(db: Session, project_id: int) -> None:
+    """Mark a project's topology as changed; call before committing a write."""
+    db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(updated_at=datetime.utcnow())
+    )
+
+
+def project_version(db: Session, project_id: int) -> Tuple:
     """
-    Analyze network topology for a project.
-    Returns graph structure, buses, levels, and validation issues.
+    Return the cache key for a project's topology.
+    Combines projects.updated_at with node and connection counts and max ids,
+    so rows inserted or deleted outside the API also change the key.
     """
-    # Get project nodes and connections
-    nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-    connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-    
-    # Convert to dictionaries
-    nodes_data = [
-        {
-            "id": node.id,
-            "type": node.type,
-            "custom_tag": node.custom_tag,
-            "voltage_level": 0.4,  # Default - would come from component library
-            "properties": node.properties or {}
-        }
-        for node in nodes
-    ]
+    def node_agg(column):
+        return select(column).where(ProjectNode.project_id == project_id).scalar_subquery()
+    
+    def connection_agg(column):
+        return select(column).where(ProjectConnection.project_id == project_id).scalar_subquery()
+    
+    return tuple(db.execute(
+        select(
+            select(Project.updated_at).where(Project.id == project_id).scalar_subquery(),
+            node_agg(func.count(ProjectNode.id)),
+            node_agg(func.max(ProjectNode.id)),
+            connection_agg(func.count(ProjectConnection.id)),
+            connection_agg(func.max(ProjectConnection.id))
+        )
+    ).one())
+
+
+def _load_topology_rows(db: Session, project_id: int):
+    """
+    Fetch the columns needed to build a project topology as plain row tuples.
+    Returns (node_rows, connection_rows) in the shape expected by
+    build_topology_from_rows.
+    """
+    node_rows = db.execute(
+        select(ProjectNode.id, ProjectNode.type, ProjectNode.custom_tag, ProjectNode.properties)
+        .where(ProjectNode.project_id == project_id)
+    ).all()
+    connection_rows = db.execute(
+        select(
+            ProjectConnection.id,
+            ProjectConnection.source_node_id,
+            ProjectConnection.target_node_id,
+            ProjectConnection.cable_library_id,
+            ProjectConnection.length
+        )
+        .where(ProjectConnection.project_id == project_id)
+    ).all()
     
-    connections_data = [
-        {
-            "id": conn.id,
-            "source_node_id": conn.source_node_id,
-            "target_node_id": conn.target_node_id,
-            "cable_library_id": conn.cable_library_id,
-            "length": conn.length
-        }
-        for conn in connections
-    ]
+    return node_rows, connection_rows
+
+
+@lru_cache(maxsize=64)
+def _topology_payload(project_id: int, version: Tuple) -> bytes:
+    """Build, analyze and serialize a project topology once per version."""
+    with SessionLocal() as db:
+        # Get project nodes and connections as plain column tuples (no ORM instances)
+        node_rows, connection_rows = _load_topology_rows(db, project_id)
     
-    # Build topology graph
-    graph = build_topology_from_database(nodes_data, connections_data)
+    # Build topology graph straight from the result rows
+    # (voltage level defaults to 0.4 kV - would come from component library)
+    graph = build_topology_from_rows(node_rows, connection_rows)
     
     # Get analysis results
     loops = graph.detect_loops()
     validation_issues = graph.validate_topology()
     
-    return {
+    return orjson.dumps({
         "topology": graph.to_dict(),
         "statistics": {
             "total_nodes": len(graph.nodes),
@@ -492,57 +726,57 @@ async def get_project_topology(project_id: int, db: Session = Depends(get_db)):
         },
         "loops": loops,
         "validation_issues": validation_issues
-    }
+    })
+
+
+@app.get("/api/projects/{project_id}/topology")
+def get_project_topology(project_id: int, db: Session = Depends(get_db)):
+    """
+    Analyze network topology for a project.
+    Returns graph structure, buses, levels, and validation issues.
+    Results are cached until the next write to the project.
+    """
+    body = _topology_payload(project_id, project_version(db, project_id))
+    return Response(content=body, media_type="application/json")
+
+
+# Nodes per tag UPDATE; keeps the CASE and IN lists well under the
+# bound-parameter limits of SQLite and PostgreSQL
+TAG_UPDATE_BATCH_SIZE = 500
 
 
 @app.post("/api/projects/{project_id}/update-tags")
-async def update_project_tags(project_id: int, db: Session = Depends(get_db)):
+def update_project_tags(project_id: int, db: Session = Depends(get_db)):
     """
     Update all tags in a project based on current topology.
     This should be called after connection changes.
     """
     # Get project data
-    nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-    connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
+    node_rows, connection_rows = _load_topology_rows(db, project_id)
     
     # Build topology
-    nodes_data = [
-        {
-            "id": node.id,
-            "type": node.type,
-            "custom_tag": node.custom_tag,
-            "voltage_level": 0.4,
-            "properties": node.properties or {}
-        }
-        for node in nodes
-    ]
-    
-    connections_data = [
-        {
-            "id": conn.id,
-            "source_node_id": conn.source_node_id,
-            "target_node_id": conn.target_node_id,
-            "cable_library_id": conn.cable_library_id,
-            "length": conn.length
-        }
-        for conn in connections
-    ]
-    
-    graph = build_topology_from_database(nodes_data, connections_data)
+    graph = build_topology_from_rows(node_rows, connection_rows)
     
     # Update tags
     tag_updates = update_all_tags_enhanced(graph)
     
-    # Save updates to database
+    # Save updates with one UPDATE ... CASE id WHEN per batch; each is a
+    # single statement, so its rowcount is exact on every backend
     updated_count = 0
-    for node_id_str, new_tag in tag_updates.items():
-        node_id = int(node_id_str)
-        node = db.query(ProjectNode).filter(ProjectNode.id == node_id).first()
-        if node:
-            node.custom_tag = new_tag
-            updated_count += 1
+    items = [(int(node_id_str), new_tag) for node_id_str, new_tag in tag_updates.items()]
+    for start in range(0, len(items), TAG_UPDATE_BATCH_SIZE):
+        batch = dict(items[start:start + TAG_UPDATE_BATCH_SIZE])
+        result = db.execute(
+            update(ProjectNode)
+            .where(ProjectNode.project_id == project_id, ProjectNode.id.in_(batch))
+            .values(custom_tag=case(batch, value=ProjectNode.id))
+            .execution_options(synchronize_session=False)
+        )
+        updated_count += result.rowcount
     
-    db.commit()
+    if updated_count:
+        bump_project_version(db, project_id)
+        db.commit()
     
     return {
         "status": "success",
@@ -556,18 +790,20 @@ async def update_project_tags(project_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @app.post("/api/projects/{project_id}/export")
-async def export_project(project_id: int, db: Session = Depends(get_db)):
+def export_project(project_id: int, db: Session = Depends(get_db)):
     """
     Export project to .psp file format.
     Returns the serialized project data.
     """
     # Get project
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Get nodes and connections
-    nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
+    nodes = db.query(ProjectNode).options(
+        undefer(ProjectNode.properties), undefer(ProjectNode.results)
+    ).filter(ProjectNode.project_id == project_id).all()
     connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
     
     # Convert to dictionaries
@@ -636,8 +872,83 @@ async def export_project(project_id: int, db: Session = Depends(get_db)):
     }
 
 
+def _stream_project_ndjson(project_id: int) -> Iterator[bytes]:
+    """
+    Yield a project as NDJSON: one {"table": ..., "row": ...} line for the
+    project, then one per node and per connection, fetched in batches.
+    """
+    with SessionLocal() as db:
+        project_row = db.execute(select(
+            Project.id,
+            Project.name,
+            Project.description,
+            Project.base_mva,
+            Project.system_frequency,
+            Project.standard_short_circuit,
+            Project.standard_cable,
+            Project.created_at,
+            Project.updated_at
+        ).where(Project.id == project_id)).mappings().one()
+        yield orjson.dumps({"table": "project", "row": dict(project_row)}) + b"\n"
+        
+        node_rows = db.execute(
+            select(
+                ProjectNode.id,
+                ProjectNode.type,
+                ProjectNode.position_x,
+                ProjectNode.position_y,
+                ProjectNode.custom_tag,
+                ProjectNode.component_library_id,
+                ProjectNode.properties,
+                ProjectNode.location_site,
+                ProjectNode.location_building,
+                ProjectNode.location_room,
+                ProjectNode.results
+            )
+            .where(ProjectNode.project_id == project_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        ).mappings()
+        for row in node_rows:
+            yield orjson.dumps({"table": "nodes", "row": dict(row)}) + b"\n"
+        
+        connection_rows = db.execute(
+            select(
+                ProjectConnection.id,
+                ProjectConnection.source_node_id,
+                ProjectConnection.target_node_id,
+                ProjectConnection.cable_library_id,
+                ProjectConnection.length,
+                ProjectConnection.installation_method,
+                ProjectConnection.grouping_factor,
+                ProjectConnection.ambient_temp,
+                ProjectConnection.properties
+            )
+            .where(ProjectConnection.project_id == project_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        ).mappings()
+        for row in connection_rows:
+            yield orjson.dumps({"table": "connections", "row": dict(row)}) + b"\n"
+
+
+@app.get("/api/projects/{project_id}/export.ndjson")
+def export_project_ndjson(project_id: int, db: Session = Depends(get_db)):
+    """
+    Stream project data as newline-delimited JSON.
+    Rows are written as they are read, so memory stays flat for large
+    projects. Use /export for the checksummed .psp envelope.
+    """
+    if db.get(Project, project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    return StreamingResponse(
+        _stream_project_ndjson(project_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="project_{project_id}.ndjson"'}
+    )
+
+
 @app.post("/api/projects/import")
-async def import_project(psp_data: dict, db: Session = Depends(get_db)):
+def import_project(psp_data: dict, db: Session = Depends(get_db)):
     """
     Import project from .psp file data.
     Creates a new project with all nodes and connections.
@@ -665,39 +976,52 @@ async def import_project(psp_data: dict, db: Session = Depends(get_db)):
     db.add(new_project)
     db.flush()  # Get the new project ID
     
-    # Create nodes (with new IDs)
+    # Create nodes (with new IDs) in a single executemany INSERT ... RETURNING
+    node_rows = [
+        {
+            "project_id": new_project.id,
+            "type": node_data["type"],
+            "position_x": node_data["position_x"],
+            "position_y": node_data["position_y"],
+            "custom_tag": node_data["custom_tag"],
+            "component_library_id": node_data.get("component_library_id"),
+            "properties": node_data.get("properties", {}),
+            "location_site": node_data.get("location_site"),
+            "location_building": node_data.get("location_building"),
+            "location_room": node_data.get("location_room")
+        }
+        for node_data in deserialized["nodes"]
+    ]
+    
     node_id_mapping = {}  # Old ID -> New ID
-    for node_data in deserialized["nodes"]:
-        new_node = ProjectNode(
-            project_id=new_project.id,
-            type=node_data["type"],
-            position_x=node_data["position_x"],
-            position_y=node_data["position_y"],
-            custom_tag=node_data["custom_tag"],
-            component_library_id=node_data.get("component_library_id"),
-            properties=node_data.get("properties", {}),
-            location_site=node_data.get("location_site"),
-            location_building=node_data.get("location_building"),
-            location_room=node_data.get("location_room")
-        )
-        db.add(new_node)
-        db.flush()
-        node_id_mapping[node_data["id"]] = new_node.id
+    if node_rows:
+        new_ids = db.execute(
+            insert(ProjectNode).returning(ProjectNode.id, sort_by_parameter_order=True),
+            node_rows
+        ).scalars().all()
+        node_id_mapping = {
+            node_data["id"]: new_id
+            for node_data, new_id in zip(deserialized["nodes"], new_ids)
+        }
     
     # Create connections (with updated node IDs)
-    for conn_data in deserialized["connections"]:
-        new_conn = ProjectConnection(
-            project_id=new_project.id,
-            source_node_id=node_id_mapping[conn_data["source_node_id"]],
-            target_node_id=node_id_mapping[conn_data["target_node_id"]],
-            cable_library_id=conn_data.get("cable_library_id"),
-            length=conn_data.get("length", 0),
-            installation_method=conn_data.get("installation_method", "E"),
-            grouping_factor=conn_data.get("grouping_factor", 1.0),
-            ambient_temp=conn_data.get("ambient_temp", 30.0)
-        )
-        db.add(new_conn)
+    connection_rows = [
+        {
+            "project_id": new_project.id,
+            "source_node_id": node_id_mapping[conn_data["source_node_id"]],
+            "target_node_id": node_id_mapping[conn_data["target_node_id"]],
+            "cable_library_id": conn_data.get("cable_library_id"),
+            "length": conn_data.get("length", 0),
+            "installation_method": conn_data.get("installation_method", "E"),
+            "grouping_factor": conn_data.get("grouping_factor", 1.0),
+            "ambient_temp": conn_data.get("ambient_temp", 30.0)
+        }
+        for conn_data in deserialized["connections"]
+    ]
+    if connection_rows:
+        db.execute(insert(ProjectConnection), connection_rows)
     
+    bump_project_version(db, new_project.id)
     db.commit()
     
     return {
@@ -713,59 +1037,146 @@ async def import_project(psp_data: dict, db: Session = Depends(get_db)):
 # API ROUTES - Advanced Calculations (Phase 3)
 # ============================================================================
 
+def load_project_bundle(db: Session, project_id: int):
+    """
+    Load a project and index its nodes by id for O(1) lookups when
+    formatting per-bus results. Nodes are fetched as lightweight
+    (id, custom_tag) rows; the topology itself comes from
+    _analysis_topology.
+    
+    Returns:
+        (project, nodes_by_id); project is None if not found
+    """
+    project = db.get(Project, project_id)
+    if project is None:
+        return None, {}
+    
+    node_rows = db.execute(
+        select(ProjectNode.id, ProjectNode.custom_tag)
+        .where(ProjectNode.project_id == project_id)
+    ).all()
+    nodes_by_id = {node.id: node for node in node_rows}
+    return project, nodes_by_id
+
+
+@lru_cache(maxsize=8)
+def _component_data(version: Tuple, profile: str) -> dict:
+    """
+    Build the component_data dictionary used by the calculation service.
+    Cached per (component_library_version(), profile), so a library reseed
+    retires the cached copies. Profiles pick the fields each analysis needs:
+    "sc", "lf", "complete", "arc" and "report".
+    """
+    with SessionLocal() as db:
+        components = db.execute(
+            select(
+                ComponentLibrary.id,
+                ComponentLibrary.type,
+                ComponentLibrary.model,
+                ComponentLibrary.impedance_r,
+                ComponentLibrary.impedance_x,
+                ComponentLibrary.impedance_z_percent,
+                ComponentLibrary.short_circuit_rating,
+                ComponentLibrary.ampacity_base,
+                ComponentLibrary.properties
+            )
+            .execution_options(yield_per=1000)
+        )
+        
+        # Rows arrive in batches; build the dictionary as they stream in
+        component_data = {}
+        for comp in components:
+            if profile == "lf":
+                comp_dict = {
+                    'impedance_r': comp.impedance_r,
+                    'impedance_x': comp.impedance_x
+                }
+            elif profile == "arc":
+                comp_dict = {
+                    'impedance_r': comp.impedance_r,
+                    'impedance_x': comp.impedance_x,
+                    'short_circuit_rating': comp.short_circuit_rating
+                }
+            elif profile == "sc":
+                comp_dict = {
+                    'impedance_r': comp.impedance_r,
+                    'impedance_x': comp.impedance_x,
+                    'impedance_z_percent': comp.impedance_z_percent,
+                    'short_circuit_rating': comp.short_circuit_rating,
+                    'power_kw': comp.properties.get('power_kw') if comp.properties else None,
+                    'rating_mva': comp.properties.get('rating_kva', 1000) / 1000 if comp.properties else 1.0
+                }
+            else:
+                comp_dict = {
+                    'type': comp.type,
+                    'model': comp.model,
+                    'impedance_r': comp.impedance_r,
+                    'impedance_x': comp.impedance_x,
+                    'impedance_z_percent': comp.impedance_z_percent,
+                    'short_circuit_rating': comp.short_circuit_rating,
+                    'ampacity_base': comp.ampacity_base
+                }
+                if profile == "complete" and comp.properties:
+                    comp_dict.update({
+                        'power_kw': comp.properties.get('power_kw'),
+                        'rating_kva': comp.properties.get('rating_kva')
+                    })
+            component_data[str(comp.id)] = comp_dict
+    
+    return component_data
+
+
+@lru_cache(maxsize=32)
+def _analysis_topology(project_id: int, version: Tuple) -> TopologyGraph:
+    """
+    Build a project's analysis topology once per project version
+    (see project_version). The cached graph is shared between
+    requests, so it is frozen before it is returned: CSR, levels and
+    buses are already built and any mutation raises.
+    Connections without a length default to 50 m.
+    """
+    with SessionLocal() as db:
+        node_rows, connection_rows = _load_topology_rows(db, project_id)
+    
+    topology = build_topology_from_rows(
+        node_rows,
+        (
+            (conn.id, conn.source_node_id, conn.target_node_id, conn.cable_library_id, conn.length or 50.0)
+            for conn in connection_rows
+        )
+    )
+    topology.freeze()
+    return topology
+
+
+def _prepare_analysis_inputs(db: Session, project_id: int, profile: str):
+    """
+    Return the (component_data, topology) pair used by the analysis
+    endpoints, both served from in-process caches keyed on versions
+    read from the database.
+    """
+    component_data = _component_data(component_library_version(db), profile)
+    topology = _analysis_topology(project_id, project_version(db, project_id))
+    return component_data, topology
+
+
 @app.post("/api/projects/{project_id}/analyze/short-circuit")
-async def analyze_short_circuit(project_id: int, db: Session = Depends(get_db)):
+def analyze_short_circuit(project_id: int, db: Session = Depends(get_db)):
     """
     Run IEC 60909 short circuit analysis on entire network.
     Calculates fault currents at all buses and validates breakers.
     """
     try:
         # Get project and components
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project, nodes_by_id = load_project_bundle(db, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-        connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-        components = db.query(ComponentLibrary).all()
-        
-        # Build component data dictionary
-        component_data = {
-            str(comp.id): {
-                'impedance_r': comp.impedance_r,
-                'impedance_x': comp.impedance_x,
-                'impedance_z_percent': comp.impedance_z_percent,
-                'short_circuit_rating': comp.short_circuit_rating,
-                'power_kw': comp.properties.get('power_kw') if comp.properties else None,
-                'rating_mva': comp.properties.get('rating_kva', 1000) / 1000 if comp.properties else 1.0
-            }
-            for comp in components
-        }
-        
-        # Build topology
-        nodes_data = [
-            {
-                "id": node.id,
-                "type": node.type,
-                "custom_tag": node.custom_tag,
-                "voltage_level": 0.4,
-                "properties": node.properties or {}
-            }
-            for node in nodes
-        ]
-        
-        connections_data = [
-            {
-                "id": conn.id,
-                "source_node_id": conn.source_node_id,
-                "target_node_id": conn.target_node_id,
-                "cable_library_id": conn.cable_library_id,
-                "length": conn.length or 50.0
-            }
-            for conn in connections
-        ]
+        # Component data and topology shared by all analyses
+        component_data, topology = _prepare_analysis_inputs(db, project_id, "sc")
         
-        topology = build_topology_from_database(nodes_data, connections_data)
+        from utils.integrated_calc import IntegratedCalculationService
+        import numpy as np
         
         # Run integrated analysis
         calc_service = IntegratedCalculationService(
@@ -775,16 +1186,28 @@ async def analyze_short_circuit(project_id: int, db: Session = Depends(get_db)):
         
         result = calc_service.analyze_network(topology, component_data, run_load_flow=False)
         
-        # Format results for API response
+        # Format results for API response, rounding each quantity as one array
+        sc_items = list(result.short_circuit_results.items())
+        n_buses = len(sc_items)
+        i_k3_initial = np.fromiter((sc.i_k3_initial for _, sc in sc_items), dtype=np.float64, count=n_buses)
+        i_k3_peak = np.fromiter((sc.i_k3_peak for _, sc in sc_items), dtype=np.float64, count=n_buses)
+        i_k3_breaking = np.fromiter((sc.i_k3_breaking for _, sc in sc_items), dtype=np.float64, count=n_buses)
+        s_k3 = np.fromiter((sc.s_k3 for _, sc in sc_items), dtype=np.float64, count=n_buses)
+        
+        i_k3_initial_ka = np.round(i_k3_initial, 2).tolist()
+        i_k3_peak_ka = np.round(i_k3_peak, 2).tolist()
+        i_k3_breaking_ka = np.round(i_k3_breaking, 2).tolist()
+        s_k3_mva = np.round(s_k3, 2).tolist()
+        
         sc_results_formatted = {}
-        for bus_id, sc_result in result.short_circuit_results.items():
-            node = next((n for n in nodes if n.id == int(bus_id)), None)
+        for i, (bus_id, _) in enumerate(sc_items):
+            node = nodes_by_id.get(int(bus_id))
             sc_results_formatted[bus_id] = {
                 'node_tag': node.custom_tag if node else bus_id,
-                'i_k3_initial_ka': round(sc_result.i_k3_initial, 2),
-                'i_k3_peak_ka': round(sc_result.i_k3_peak, 2),
-                'i_k3_breaking_ka': round(sc_result.i_k3_breaking, 2),
-                's_k3_mva': round(sc_result.s_k3, 2)
+                'i_k3_initial_ka': i_k3_initial_ka[i],
+                'i_k3_peak_ka': i_k3_peak_ka[i],
+                'i_k3_breaking_ka': i_k3_breaking_ka[i],
+                's_k3_mva': s_k3_mva[i]
             }
         
         return {
@@ -798,57 +1221,26 @@ async def analyze_short_circuit(project_id: int, db: Session = Depends(get_db)):
         }
     
     except Exception as e:
+        logger.exception("Short circuit analysis failed for project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @app.post("/api/projects/{project_id}/analyze/load-flow")
-async def analyze_load_flow(project_id: int, db: Session = Depends(get_db)):
+def analyze_load_flow(project_id: int, db: Session = Depends(get_db)):
     """
     Run Newton-Raphson load flow analysis.
     Calculates voltages, power flows, and losses.
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project, nodes_by_id = load_project_bundle(db, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-        connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-        components = db.query(ComponentLibrary).all()
+        # Component data and topology shared by all analyses
+        component_data, topology = _prepare_analysis_inputs(db, project_id, "lf")
         
-        # Build component data
-        component_data = {
-            str(comp.id): {
-                'impedance_r': comp.impedance_r,
-                'impedance_x': comp.impedance_x
-            }
-            for comp in components
-        }
-        
-        # Build topology
-        nodes_data = [
-            {
-                "id": node.id,
-                "type": node.type,
-                "custom_tag": node.custom_tag,
-                "voltage_level": 0.4,
-                "properties": node.properties or {}
-            }
-            for node in nodes
-        ]
-        
-        connections_data = [
-            {
-                "id": conn.id,
-                "source_node_id": conn.source_node_id,
-                "target_node_id": conn.target_node_id,
-                "cable_library_id": conn.cable_library_id,
-                "length": conn.length or 50.0
-            }
-            for conn in connections
-        ]
-        
-        topology = build_topology_from_database(nodes_data, connections_data)
+        from utils.integrated_calc import IntegratedCalculationService
+        import numpy as np
         
         # Run analysis
         calc_service = IntegratedCalculationService(
@@ -861,15 +1253,29 @@ async def analyze_load_flow(project_id: int, db: Session = Depends(get_db)):
         # Format load flow results
         if result.load_flow_result:
             lf = result.load_flow_result
+            
+            # Convert and round all buses in one vectorized pass
+            bus_items = list(lf.buses.items())
+            n_buses = len(bus_items)
+            v_mag = np.fromiter((bus.v_magnitude for _, bus in bus_items), dtype=np.float64, count=n_buses)
+            v_ang = np.fromiter((bus.v_angle for _, bus in bus_items), dtype=np.float64, count=n_buses)
+            p_calc = np.fromiter((bus.p_calculated for _, bus in bus_items), dtype=np.float64, count=n_buses)
+            q_calc = np.fromiter((bus.q_calculated for _, bus in bus_items), dtype=np.float64, count=n_buses)
+            
+            v_mag_pu = np.round(v_mag, 4).tolist()
+            v_ang_deg = np.round(np.rad2deg(v_ang), 2).tolist()
+            p_mw = np.round(p_calc * project.base_mva, 3).tolist()
+            q_mvar = np.round(q_calc * project.base_mva, 3).tolist()
+            
             bus_results = {}
-            for bus_id, bus in lf.buses.items():
-                node = next((n for n in nodes if str(n.id) == bus_id), None)
+            for i, (bus_id, _) in enumerate(bus_items):
+                node = nodes_by_id.get(int(bus_id))
                 bus_results[bus_id] = {
                     'node_tag': node.custom_tag if node else bus_id,
-                    'v_magnitude_pu': round(bus.v_magnitude, 4),
-                    'v_angle_deg': round(np.rad2deg(bus.v_angle), 2),
-                    'p_mw': round(bus.p_calculated * project.base_mva, 3),
-                    'q_mvar': round(bus.q_calculated * project.base_mva, 3)
+                    'v_magnitude_pu': v_mag_pu[i],
+                    'v_angle_deg': v_ang_deg[i],
+                    'p_mw': p_mw[i],
+                    'q_mvar': q_mvar[i]
                 }
             
             return {
@@ -889,11 +1295,12 @@ async def analyze_load_flow(project_id: int, db: Session = Depends(get_db)):
             raise HTTPException(status_code=500, detail="Load flow did not converge")
     
     except Exception as e:
+        logger.exception("Load flow analysis failed for project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @app.post("/api/projects/{project_id}/analyze/complete")
-async def analyze_complete(project_id: int, db: Session = Depends(get_db)):
+def analyze_complete(project_id: int, db: Session = Depends(get_db)):
     """
     Run complete network analysis (Phase 3):
     - Per-unit system
@@ -904,57 +1311,14 @@ async def analyze_complete(project_id: int, db: Session = Depends(get_db)):
     This is the flagship analysis combining all Phase 3 capabilities.
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project, nodes_by_id = load_project_bundle(db, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-        connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-        components = db.query(ComponentLibrary).all()
+        # Component data and topology shared by all analyses
+        component_data, topology = _prepare_analysis_inputs(db, project_id, "complete")
         
-        # Build component data
-        component_data = {}
-        for comp in components:
-            comp_dict = {
-                'type': comp.type,
-                'model': comp.model,
-                'impedance_r': comp.impedance_r,
-                'impedance_x': comp.impedance_x,
-                'impedance_z_percent': comp.impedance_z_percent,
-                'short_circuit_rating': comp.short_circuit_rating,
-                'ampacity_base': comp.ampacity_base
-            }
-            if comp.properties:
-                comp_dict.update({
-                    'power_kw': comp.properties.get('power_kw'),
-                    'rating_kva': comp.properties.get('rating_kva')
-                })
-            component_data[str(comp.id)] = comp_dict
-        
-        # Build topology
-        nodes_data = [
-            {
-                "id": node.id,
-                "type": node.type,
-                "custom_tag": node.custom_tag,
-                "voltage_level": 0.4,  # Would come from component in production
-                "properties": node.properties or {}
-            }
-            for node in nodes
-        ]
-        
-        connections_data = [
-            {
-                "id": conn.id,
-                "source_node_id": conn.source_node_id,
-                "target_node_id": conn.target_node_id,
-                "cable_library_id": str(conn.cable_library_id) if conn.cable_library_id else None,
-                "length": conn.length or 50.0
-            }
-            for conn in connections
-        ]
-        
-        topology = build_topology_from_database(nodes_data, connections_data)
+        from utils.integrated_calc import IntegratedCalculationService
         
         # Run complete analysis
         calc_service = IntegratedCalculationService(
@@ -981,8 +1345,7 @@ async def analyze_complete(project_id: int, db: Session = Depends(get_db)):
         }
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Complete analysis failed for project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
@@ -991,75 +1354,51 @@ async def analyze_complete(project_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @app.post("/api/projects/{project_id}/analyze/arc-flash")
-async def analyze_arc_flash(project_id: int, db: Session = Depends(get_db)):
+def analyze_arc_flash(project_id: int, db: Session = Depends(get_db)):
     """
     Run IEEE 1584 arc flash analysis.
     Calculates incident energy and PPE requirements at all buses.
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project, nodes_by_id = load_project_bundle(db, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        # Get short circuit results first (needed for arc flash)
-        nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-        connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-        components = db.query(ComponentLibrary).all()
-        
-        # Build component data
-        component_data = {str(comp.id): {
-            'impedance_r': comp.impedance_r,
-            'impedance_x': comp.impedance_x,
-            'short_circuit_rating': comp.short_circuit_rating
-        } for comp in components}
-        
-        # Build topology
-        nodes_data = [{
-            "id": node.id,
-            "type": node.type,
-            "custom_tag": node.custom_tag,
-            "voltage_level": 0.4,
-            "properties": node.properties or {}
-        } for node in nodes]
-        
-        connections_data = [{
-            "id": conn.id,
-            "source_node_id": conn.source_node_id,
-            "target_node_id": conn.target_node_id,
-            "cable_library_id": conn.cable_library_id,
-            "length": conn.length or 50.0
-        } for conn in connections]
+        # Component data and topology shared by all analyses
+        component_data, topology = _prepare_analysis_inputs(db, project_id, "arc")
         
-        from utils.topology import build_topology_from_database
-        topology = build_topology_from_database(nodes_data, connections_data)
+        from utils.integrated_calc import IntegratedCalculationService
+        from utils.arc_flash import calculate_arc_flash_batch
         
         # Run short circuit first
         calc_service = IntegratedCalculationService(project.base_mva, project.system_frequency)
         sc_analysis = calc_service.analyze_network(topology, component_data, run_load_flow=False)
         
-        # Run arc flash for each bus with fault current
-        arc_flash_results = {}
+        # Buses with fault current that map to a project node
+        sc_results = sc_analysis.short_circuit_results
+        bus_ids = [bus_id for bus_id in sc_results if int(bus_id) in nodes_by_id]
         
-        for bus_id, sc_result in sc_analysis.short_circuit_results.items():
-            node = next((n for n in nodes if n.id == int(bus_id)), None)
-            if not node:
-                continue
-            
-            # Determine breaker clearing time (cycles)
-            # Would come from breaker specs in production
-            clearing_cycles = 5.0  # Typical for LV breaker
-            
-            # Calculate arc flash
-            af_result = calculate_arc_flash_for_bus(
-                fault_current_ka=sc_result.i_k3_initial,
-                voltage_kv=0.4,  # Would come from node voltage
-                breaker_clearing_cycles=clearing_cycles,
-                working_distance_inches=18.0,
-                equipment_type="VCB"
-            )
+        # Calculate arc flash for all buses in one vectorized pass
+        # Breaker clearing time would come from breaker specs in production
+        fault_currents = [sc_results[bus_id].i_k3_initial for bus_id in bus_ids]
+        af_results = calculate_arc_flash_batch(
+            fault_currents,
+            voltage_kv=0.4,  # Would come from node voltage
+            breaker_clearing_cycles=5.0,  # Typical for LV breaker
+            working_distance_inches=18.0,
+            equipment_type="VCB"
+        )
+        
+        arc_flash_results = {}
+        max_incident_energy = 0
+        high_hazard_count = 0
+        for bus_id, af_result in zip(bus_ids, af_results):
+            # Summary figures accumulate in the same pass
+            max_incident_energy = max(max_incident_energy, af_result.incident_energy)
+            high_hazard_count += af_result.incident_energy > 25.0
             
             arc_flash_results[bus_id] = {
-                'node_tag': node.custom_tag,
+                'node_tag': nodes_by_id[int(bus_id)].custom_tag,
                 'incident_energy': af_result.incident_energy,
                 'afb_inches': af_result.arc_flash_boundary,
                 'afb_ft': af_result.arc_flash_boundary_ft,
@@ -1078,64 +1417,52 @@ async def analyze_arc_flash(project_id: int, db: Session = Depends(get_db)):
             "results": arc_flash_results,
             "summary": {
                 'buses_analyzed': len(arc_flash_results),
-                'max_incident_energy': max([r['incident_energy'] for r in arc_flash_results.values()]) if arc_flash_results else 0,
-                'high_hazard_count': sum(1 for r in arc_flash_results.values() if r['incident_energy'] > 25.0)
+                'max_incident_energy': max_incident_energy,
+                'high_hazard_count': high_hazard_count
             }
         }
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Arc flash analysis failed for project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Arc flash analysis failed: {str(e)}")
 
 
+def _build_report_sync(project_info: dict, analysis_data: dict) -> str:
+    """
+    Render the PDF report to a temporary file and return its path.
+    Does no database access, so it can run after the request's session
+    has been released. The file is removed if rendering fails.
+    """
+    from utils.report_generator import generate_analysis_report
+    
+    fd, output_path = tempfile.mkstemp(suffix='.pdf', prefix='pwrsyspro_report_')
+    os.close(fd)
+    try:
+        return generate_analysis_report(output_path, project_info, analysis_data)
+    except BaseException:
+        os.remove(output_path)
+        raise
+
+
 @app.post("/api/projects/{project_id}/generate-report")
-async def generate_report(project_id: int, db: Session = Depends(get_db)):
+def generate_report(project_id: int, db: Session = Depends(get_db)):
     """
     Generate comprehensive PDF report with all analysis results.
     This is the flagship Phase 4 feature.
     """
     try:
-        import os
-        import tempfile
-        
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project, nodes_by_id = load_project_bundle(db, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        # Run complete analysis
-        nodes = db.query(ProjectNode).filter(ProjectNode.project_id == project_id).all()
-        connections = db.query(ProjectConnection).filter(ProjectConnection.project_id == project_id).all()
-        components = db.query(ComponentLibrary).all()
-        
-        component_data = {str(comp.id): {
-            'type': comp.type,
-            'model': comp.model,
-            'impedance_r': comp.impedance_r,
-            'impedance_x': comp.impedance_x,
-            'impedance_z_percent': comp.impedance_z_percent,
-            'short_circuit_rating': comp.short_circuit_rating,
-            'ampacity_base': comp.ampacity_base
-        } for comp in components}
-        
-        nodes_data = [{
-            "id": node.id,
-            "type": node.type,
-            "custom_tag": node.custom_tag,
-            "voltage_level": 0.4,
-            "properties": node.properties or {}
-        } for node in nodes]
+        # Component data and topology shared by all analyses
+        component_data, topology = _prepare_analysis_inputs(db, project_id, "report")
         
-        connections_data = [{
-            "id": conn.id,
-            "source_node_id": conn.source_node_id,
-            "target_node_id": conn.target_node_id,
-            "cable_library_id": str(conn.cable_library_id) if conn.cable_library_id else None,
-            "length": conn.length or 50.0
-        } for conn in connections]
+        # Everything needed is loaded; return the pooled connection before
+        # the CPU-bound analysis and PDF rendering
+        db.close()
         
-        from utils.topology import build_topology_from_database
-        topology = build_topology_from_database(nodes_data, connections_data)
+        from utils.integrated_calc import IntegratedCalculationService
         
         # Run integrated analysis
         calc_service = IntegratedCalculationService(project.base_mva, project.system_frequency)
@@ -1153,7 +1480,7 @@ async def generate_report(project_id: int, db: Session = Depends(get_db)):
         analysis_data = {
             'summary': {
                 'overall_status': 'PASS' if result.summary.get('breakers', {}).get('fail', 0) == 0 else 'WARNING',
-                'total_components': len(nodes),
+                'total_components': len(nodes_by_id),
                 'max_fault_current': result.summary.get('short_circuit', {}).get('max_fault_current_ka', 0),
                 'critical_bus': result.summary.get('short_circuit', {}).get('max_fault_bus', 'N/A'),
                 'total_losses': result.summary.get('load_flow', {}).get('total_losses_mw', 0),
@@ -1184,28 +1511,18 @@ async def generate_report(project_id: int, db: Session = Depends(get_db)):
         }
         
         # Generate PDF
-        output_path = tempfile.mktemp(suffix='.pdf', prefix='pwrsyspro_report_')
-        report_path = generate_analysis_report(output_path, project_info, analysis_data)
-        
-        # Read file and return as base64
-        import base64
-        with open(report_path, 'rb') as f:
-            pdf_data = base64.b64encode(f.read()).decode('utf-8')
-        
-        # Clean up temp file
-        os.remove(report_path)
+        report_path = _build_report_sync(project_info, analysis_data)
         
-        return {
-            "status": "success",
-            "report_name": f"{project.name}_Report.pdf",
-            "pdf_data": pdf_data,
-            "pages": "Multiple",
-            "size_kb": len(pdf_data) * 0.75 / 1024  # Approximate
-        }
+        # Stream the file as-is and remove it once the response is sent
+        return FileResponse(
+            report_path,
+            media_type='application/pdf',
+            filename=f"{project.name}_Report.pdf",
+            background=BackgroundTask(os.remove, report_path)
+        )
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Report generation failed for project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
 
@@ -1249,11 +1566,11 @@ async def analyze_protection_coordination(
 
 if __name__ == "__main__":
     import uvicorn
-    print("ðŸš€ Starting PwrSysPro API Server (Phase 4)...")
-    print("ðŸ“Š Swagger Docs: http://localhost:8000/docs")
-    print("\nðŸ†• Phase 4 Features:")
-    print("   â€¢ IEEE 1584 Arc Flash Analysis")
-    print("   â€¢ PDF Report Generation")
-    print("   â€¢ Protection Coordination")
-    print("   â€¢ Professional Deliverables")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    print("🚀 Starting PwrSysPro API Server (Phase 4)...")
+    print("📊 Swagger Docs: http://localhost:8000/docs")
+    print("\n🆕 Phase 4 Features:")
+    print("   • IEEE 1584 Arc Flash Analysis")
+    print("   • PDF Report Generation")
+    print("   • Protection Coordination")
+    print("   • Professional Deliverables")
+    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True, loop="uvloop", http="httptools")
@@ -0,0 +1,20 @@
+"""
+Shared pytest setup: make the server package importable the way main.py
+sees it, including the flat utils.<module> names used between phases.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parents[1]
+if str(SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVER_DIR))
+
+# Cross-phase imports use the flat names (utils.calculations, utils.tagging, ...)
+for _flat, _module in (
+    ("utils.calculations", "utils.phase1.calculations"),
+    ("utils.tagging", "utils.phase1.tagging"),
+    ("utils.topology", "utils.phase2.topology"),
+):
+    sys.modules.setdefault(_flat, importlib.import_module(_module))
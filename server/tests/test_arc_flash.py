@@ -0,0 +1,86 @@
+"""
+Arc flash batch kernel vs. the per-bus IEEE 1584 calculator.
+"""
+
+import math
+
+import pytest
+
+from utils.phase4.arc_flash import (
+    ArcFlashParameters,
+    EquipmentType,
+    IEEE1584ArcFlashCalculator,
+    calculate_arc_flash_batch,
+)
+
+
+def _reference(fault_current_ka, voltage_kv, clearing_cycles, working_distance, equipment_type):
+    """Per-bus calculation with the voltage-based gap used by the batch kernel."""
+    if voltage_kv <= 0.6:
+        gap = 32.0
+    elif voltage_kv <= 15.0:
+        gap = 104.0
+    else:
+        gap = 152.0
+    return IEEE1584ArcFlashCalculator(ArcFlashParameters(
+        bolted_fault_current=fault_current_ka,
+        voltage=voltage_kv,
+        working_distance=working_distance,
+        gap_between_conductors=gap,
+        equipment_type=EquipmentType(equipment_type),
+        clearing_time=clearing_cycles
+    )).calculate()
+
+
+@pytest.mark.parametrize("voltage_kv, equipment_type, working_distance", [
+    (0.208, "VCB", 18.0),   # LV enclosed
+    (0.48, "VCB", 18.0),    # LV enclosed
+    (0.48, "VCBB", 24.0),   # LV enclosed with barrier
+    (0.48, "VOA", 18.0),    # LV open air
+    (0.6, "HOA", 24.0),     # LV open air
+    (4.16, "VCB", 36.0),    # MV enclosed
+    (13.8, "VCB", 36.0),    # MV enclosed
+    (13.8, "VOA", 36.0),    # MV open air
+    (34.5, "HCB", 36.0),    # HV gap
+])
+def test_batch_matches_calculator(voltage_kv, equipment_type, working_distance):
+    fault_currents = [0.5, 2.0, 8.0, 25.0, 42.0, 65.0]
+    clearing_cycles = 5.0
+    
+    batch = calculate_arc_flash_batch(
+        fault_currents, voltage_kv, clearing_cycles, working_distance, equipment_type
+    )
+    
+    assert len(batch) == len(fault_currents)
+    for i_bf, result in zip(fault_currents, batch):
+        expected = _reference(i_bf, voltage_kv, clearing_cycles, working_distance, equipment_type)
+        assert result == expected
+
+
+def test_batch_broadcasts_per_bus_voltage_and_clearing_time():
+    fault_currents = [10.0, 20.0, 30.0]
+    voltages = [0.48, 4.16, 13.8]
+    cycles = [3.0, 5.0, 30.0]
+    
+    batch = calculate_arc_flash_batch(fault_currents, voltages, cycles)
+    
+    for args, result in zip(zip(fault_currents, voltages, cycles), batch):
+        assert result == _reference(*args, 18.0, "VCB")
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"fault_current_ka": [25.0, 0.0]},
+    {"fault_current_ka": [-5.0]},
+    {"fault_current_ka": [math.nan]},
+    {"fault_current_ka": [math.inf]},
+    {"voltage_kv": 0.0},
+    {"voltage_kv": [0.48, math.nan]},
+    {"breaker_clearing_cycles": 0.0},
+    {"breaker_clearing_cycles": -1.0},
+])
+def test_batch_rejects_non_positive_and_non_finite_inputs(kwargs):
+    args = {"fault_current_ka": [25.0, 30.0], "voltage_kv": 0.48, "breaker_clearing_cycles": 5.0}
+    args.update(kwargs)
+    
+    with pytest.raises(ValueError):
+        calculate_arc_flash_batch(**args)
@@ -0,0 +1,122 @@
+"""
+Scalar vs. batch voltage drop and derating calculations.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from utils.phase1.calculations import (
+    CableParameters,
+    LoadParameters,
+    calculate_cable_derating_factor,
+    calculate_voltage_drop_three_phase,
+)
+from utils.phase1.calculations_batch import (
+    CableArray,
+    calculate_cable_derating_factor_batch,
+    calculate_voltage_drop_three_phase_batch,
+)
+
+
+FEEDERS = [
+    # (R ohm/km, X ohm/km, length km, ampacity A, current A, pf, voltage V)
+    (0.161, 0.086, 0.050, 285.0, 200.0, 0.85, 400.0),
+    (0.524, 0.090, 0.120, 140.0, 95.0, 0.90, 400.0),
+    (1.830, 0.100, 0.030, 52.0, 40.0, 1.00, 230.0),
+    (0.0754, 0.079, 0.400, 460.0, 380.0, 0.80, 690.0),
+]
+
+
+def test_scalar_engine_does_not_import_numpy():
+    code = (
+        "import sys; sys.path.insert(0, '.');"
+        "import utils.phase1.calculations;"
+        "assert 'numpy' not in sys.modules"
+    )
+    server_dir = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], cwd=server_dir, check=True)
+
+
+def test_voltage_drop_batch_matches_scalar():
+    columns = np.array(FEEDERS, dtype=np.float64).T
+    R, X, L, _, I, pf, V = columns
+    
+    batch = calculate_voltage_drop_three_phase_batch(R, X, L, I, pf, V)
+    
+    for i, (r, x, length, ampacity, current, power_factor, voltage) in enumerate(FEEDERS):
+        expected = calculate_voltage_drop_three_phase(
+            CableParameters(r, x, length, ampacity),
+            LoadParameters(current, power_factor, voltage)
+        )
+        for key, value in expected.items():
+            if isinstance(value, float):
+                assert batch[key][i] == pytest.approx(value, rel=1e-12)
+            else:
+                assert batch[key][i] == value
+
+
+def test_cable_array_matches_dataclasses():
+    cables = [
+        CableParameters(r, x, length, ampacity, 0.91, 0.80, 0.95)
+        for r, x, length, ampacity, *_ in FEEDERS
+    ]
+    
+    array = CableArray.from_dataclasses(cables, dtype=np.float64)
+    
+    assert len(array) == len(cables)
+    for i, cable in enumerate(cables):
+        assert array.total_resistance()[i] == pytest.approx(cable.total_resistance)
+        assert array.total_reactance()[i] == pytest.approx(cable.total_reactance)
+        assert array.total_impedance()[i] == pytest.approx(cable.total_impedance)
+        assert array.effective_ampacity()[i] == pytest.approx(cable.effective_ampacity)
+
+
+def test_derating_batch_matches_scalar():
+    ambient = [20.0, 30.0, 40.0, 55.0, 80.0]
+    grouped = [0, 1, 3, 6, 9]
+    methods = ["E", "F", "C", "D", "X"]
+    
+    factors = calculate_cable_derating_factor_batch(ambient, grouped, methods)
+    
+    for i, args in enumerate(zip(ambient, grouped, methods)):
+        expected = calculate_cable_derating_factor(args[0], 30.0, args[1], args[2])
+        assert factors[i].tolist() == pytest.approx([
+            expected["temperature_factor"],
+            expected["grouping_factor"],
+            expected["installation_factor"],
+            expected["overall_factor"],
+        ])
+
+
+@pytest.mark.parametrize("power_factor", [0.0, -0.5, 1.01, 1.5, float("nan")])
+def test_power_factor_outside_unit_interval_is_rejected(power_factor):
+    with pytest.raises(ValueError):
+        LoadParameters(100.0, power_factor, 400.0)
+    
+    with pytest.raises(ValueError):
+        calculate_voltage_drop_three_phase_batch(
+            [0.161, 0.161], [0.086, 0.086], [0.05, 0.05],
+            [100.0, 100.0], [0.85, power_factor], [400.0, 400.0]
+        )
+
+
+def test_load_parameters_are_frozen():
+    load = LoadParameters(100.0, 0.8, 400.0)
+    
+    assert load.sin_phi == pytest.approx(0.6)
+    with pytest.raises(AttributeError):
+        load.power_factor = 0.5
+
+
+def test_cable_parameters_are_frozen():
+    cable = CableParameters(0.161, 0.086, 0.050, 285.0, 0.91, 0.80, 1.0)
+    
+    assert cable.total_resistance == pytest.approx(0.00805)
+    assert cable.total_reactance == pytest.approx(0.0043)
+    assert cable.effective_ampacity == pytest.approx(285.0 * 0.91 * 0.80)
+    with pytest.raises(AttributeError):
+        cable.length_km = 0.1
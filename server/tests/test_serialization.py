@@ -0,0 +1,175 @@
+"""
+.psp save/load/merge round trips across payload and compression formats.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from utils.phase2.serialization import (
+    ORMSGPACK_AVAILABLE,
+    ZSTD_AVAILABLE,
+    PSPFileFormat,
+    create_backup,
+    merge_projects,
+)
+
+
+def _project(name: str, first_id: int = 1):
+    project_data = {
+        "id": first_id,
+        "name": name,
+        "description": "400V distribution with motor loads",
+        "base_mva": 100.0,
+        "system_frequency": 50.0,
+        "created_at": "2024-01-01T00:00:00+00:00",
+    }
+    nodes_data = [
+        {
+            "id": first_id + i,
+            "type": node_type,
+            "position_x": 100.0 * i,
+            "position_y": 50.5,
+            "custom_tag": f"{node_type[:1]}-0.40-MDP1-{i + 1:02d}",
+            "component_library_id": 7 if node_type == "Cable" else None,
+            "properties": {"rating_kva": 500, "notes": "Schaltanlage – 40 °C"},
+            "results": {"voltage_pu": 0.987},
+        }
+        for i, node_type in enumerate(["Source", "Bus", "Cable", "Motor"])
+    ]
+    connections_data = [
+        {
+            "id": first_id + i,
+            "source_node_id": first_id + i,
+            "target_node_id": first_id + i + 1,
+            "cable_library_id": 7,
+            "length": 25.0 * (i + 1),
+            "installation_method": "C",
+        }
+        for i in range(3)
+    ]
+    psp = PSPFileFormat()
+    return psp.serialize_project(
+        project_data, nodes_data, connections_data,
+        topology_data={"buses": {"BUS-0.4kV-01": ["2"]}},
+        calculations_data={"short_circuit": {"2": {"i_k3": 25.31}}}
+    )
+
+
+needs_msgpack = pytest.mark.skipif(not ORMSGPACK_AVAILABLE, reason="ormsgpack not installed")
+needs_zstd = pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+
+# (binary, compress, zstd)
+JSON = (False, False, False)
+JSON_GZIP = (False, True, False)
+JSON_ZSTD = (False, True, True)
+MSGPACK = (True, False, False)
+MSGPACK_GZIP = (True, True, False)
+MSGPACK_ZSTD = (True, True, True)
+
+FORMATS = [
+    pytest.param(*JSON, id="json"),
+    pytest.param(*JSON_GZIP, id="json-gzip"),
+    pytest.param(*JSON_ZSTD, id="json-zstd", marks=needs_zstd),
+    pytest.param(*MSGPACK, id="msgpack", marks=needs_msgpack),
+    pytest.param(*MSGPACK_GZIP, id="msgpack-gzip", marks=needs_msgpack),
+    pytest.param(*MSGPACK_ZSTD, id="msgpack-zstd", marks=[needs_msgpack, needs_zstd]),
+]
+
+
+def _writer(binary: bool, compress: bool, zstd: bool) -> PSPFileFormat:
+    psp = PSPFileFormat()
+    psp.binary = binary
+    psp.compress = compress
+    psp.zstd = zstd
+    return psp
+
+
+@pytest.mark.parametrize("binary, compress, zstd", FORMATS)
+def test_save_load_round_trip(tmp_path, binary, compress, zstd):
+    psp_data = _project("Plant A")
+    
+    assert _writer(binary, compress, zstd).save_to_file(psp_data, str(tmp_path / "plant"))
+    
+    assert PSPFileFormat().load_from_file(str(tmp_path / "plant.psp")) == psp_data
+
+
+def test_default_output_is_gzip_json_readable_by_the_original_loader(tmp_path):
+    psp_data = _project("Plant A")
+    path = tmp_path / "plant.psp"
+    
+    assert PSPFileFormat().save_to_file(psp_data, str(path))
+    
+    # The original loader: gzip text mode plus json.load
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert json.load(f) == psp_data
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_files_from_the_original_writer_still_load(tmp_path, compress):
+    psp_data = _project("Plant A")
+    path = tmp_path / "plant.psp"
+    
+    # The original writer: indented stdlib JSON, optionally gzip text mode
+    json_str = json.dumps(psp_data, indent=2, ensure_ascii=False)
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json_str)
+    else:
+        path.write_text(json_str, encoding="utf-8")
+    
+    assert PSPFileFormat().load_from_file(str(path)) == psp_data
+
+
+def test_load_rejects_unsupported_version(tmp_path):
+    psp_data = {**_project("Plant A"), "format_version": "1.0"}
+    path = tmp_path / "plant.psp"
+    PSPFileFormat().save_to_file(psp_data, str(path))
+    
+    assert PSPFileFormat().load_from_file(str(path)) is None
+
+
+@pytest.mark.parametrize("first_format, second_format", [
+    pytest.param(JSON_GZIP, JSON_GZIP, id="json-gzip"),
+    pytest.param(JSON, JSON_ZSTD, id="json+json-zstd", marks=needs_zstd),
+    pytest.param(MSGPACK_GZIP, MSGPACK_ZSTD, id="msgpack", marks=[needs_msgpack, needs_zstd]),
+])
+def test_merge_projects(tmp_path, first_format, second_format):
+    first, second = _project("Plant A"), _project("Plant B", first_id=1)
+    _writer(*first_format).save_to_file(first, str(tmp_path / "a.psp"))
+    _writer(*second_format).save_to_file(second, str(tmp_path / "b.psp"))
+    
+    assert merge_projects(str(tmp_path / "a.psp"), str(tmp_path / "b.psp"), str(tmp_path / "ab.psp"))
+    merged = PSPFileFormat().load_from_file(str(tmp_path / "ab.psp"))
+    
+    offset = max(node["id"] for node in first["nodes"]) + 1
+    assert merged["project"]["name"] == "Plant A + Plant B"
+    assert merged["project"]["description"] == "Merged project"
+    assert merged["nodes"] == first["nodes"] + [
+        {**node, "id": node["id"] + offset} for node in second["nodes"]
+    ]
+    assert merged["connections"] == first["connections"] + [
+        {
+            **conn,
+            "id": conn["id"] + offset,
+            "source_node_id": conn["source_node_id"] + offset,
+            "target_node_id": conn["target_node_id"] + offset,
+        }
+        for conn in second["connections"]
+    ]
+    assert merged["metadata"]["node_count"] == len(merged["nodes"])
+    assert merged["metadata"]["connection_count"] == len(merged["connections"])
+    
+    # Inputs are left untouched
+    assert PSPFileFormat().load_from_file(str(tmp_path / "b.psp")) == second
+
+
+def test_create_backup_copies_bytes(tmp_path):
+    path = tmp_path / "plant.psp"
+    PSPFileFormat().save_to_file(_project("Plant A"), str(path))
+    
+    backup = create_backup(str(path))
+    
+    assert backup is not None
+    assert (tmp_path / backup).read_bytes() == path.read_bytes()
@@ -0,0 +1,71 @@
+"""
+Tag generation, parsing and validation.
+"""
+
+import pytest
+
+from utils.phase1.tagging import ParsedTag, generate_tag, parse_tag, validate_tag
+
+
+@pytest.mark.parametrize("tag, expected", [
+    ("C-0.48-MDP1-M1-01", ParsedTag("C", 0.48, "MDP1", "M1", 1)),
+    ("C-0.48-MDP_1-01", ParsedTag("C", 0.48, "MDP_1", None, 1)),
+    ("C-0.48-A-B-C-01", ParsedTag("C", 0.48, "A", "B", 1)),
+    ("C-0.48--01", ParsedTag("C", 0.48, "", None, 1)),
+    ("C-0.48-MDP1-M1-01-02", ParsedTag("C", 0.48, "MDP1", "M1", 2)),
+    ("CB-0.40-PANELA", ParsedTag("CB", 0.4, "PANELA", None, None)),
+])
+def test_parse_tag_accepts_split_based_tags(tag, expected):
+    assert parse_tag(tag) == expected
+
+
+@pytest.mark.parametrize("tag", ["C-01", "C", "C-abc-01"])
+def test_parse_tag_rejects_malformed_tags(tag):
+    with pytest.raises(ValueError):
+        parse_tag(tag)
+
+
+@pytest.mark.parametrize("tag", [
+    "C-0.48-MDP1-M1-01",
+    "C-0.48-MDP_1-01",
+    "C-0.48-A-B-C-01",
+    "C-0.48--01",
+    "C-0.48-MDP1-M1-01-02",
+    "C-0.48-mdp1-m1-01",
+    "CB-0.40-PANELA-03",
+])
+def test_validate_tag_accepts(tag):
+    assert validate_tag(tag) == (True, "Valid tag")
+
+
+@pytest.mark.parametrize("tag, message", [
+    ("C-01", "Tag must have at least 3 parts: TYPE-VOLTAGE-SEQUENCE"),
+    ("X-0.48-MDP1-01", "Invalid type code: X"),
+    ("C-0-MDP1-01", "Voltage must be positive"),
+    ("C-abc-MDP1-01", "Invalid voltage format: abc"),
+    ("C-0.48-MDP1-00", "Sequence must be positive"),
+])
+def test_validate_tag_rejects(tag, message):
+    assert validate_tag(tag) == (False, message)
+
+
+@pytest.mark.parametrize("tag", [None, 42, ["C", "0.48", "01"], {"tag": "C-0.48-01"}])
+def test_validate_tag_reports_non_strings_without_raising(tag):
+    is_valid, message = validate_tag(tag)
+    
+    assert not is_valid
+    assert message.startswith("Tag parsing error:")
+
+
+@pytest.mark.parametrize("from_bus, to_bus, expected", [
+    ("--", "M-1", "C-0.48-M1-01"),
+    ("MDP-1", "--", "C-0.48-MDP1-01"),
+    ("--", "--", "C-0.48-01"),
+    ("", None, "C-0.48-01"),
+])
+def test_generate_tag_omits_bus_names_that_sanitize_to_nothing(from_bus, to_bus, expected):
+    tag = generate_tag("Cable", 0.48, from_bus, to_bus, 1)
+    
+    assert tag == expected
+    assert validate_tag(tag) == (True, "Valid tag")
+    assert parse_tag(tag).sequence == 1
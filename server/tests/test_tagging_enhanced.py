@@ -0,0 +1,111 @@
+"""
+Topology-aware tagging: prefix assembly and parallel sequence numbers.
+"""
+
+import random
+from typing import Dict
+
+import pytest
+
+from utils.phase1.tagging import generate_tag
+from utils.phase2.tagging_enhanced import (
+    _build_parallel_index,
+    _calculate_sequence_number,
+    generate_topology_aware_tag,
+    update_all_tags,
+    validate_tag_uniqueness,
+)
+from utils.phase2.topology import TopologyEdge, TopologyGraph, TopologyNode
+
+
+def test_bus_names_that_sanitize_to_nothing_are_omitted():
+    graph = TopologyGraph()
+    graph.add_node(TopologyNode("1", "Breaker", "--", 0.48))
+    graph.add_node(TopologyNode("2", "Cable", "", 0.48))
+    graph.add_node(TopologyNode("3", "Breaker", "M-1", 0.48))
+    graph.add_edge(TopologyEdge("e1", "1", "2", None))
+    graph.add_edge(TopologyEdge("e2", "2", "3", None))
+    
+    tag = generate_topology_aware_tag(graph.nodes["2"], graph)
+    
+    assert tag == "C-0.48-M1-01"
+    assert tag == generate_tag("Cable", 0.48, "--", "M-1", 1)
+
+
+# ---------------------------------------------------------------------------
+# Regression: parallel index and prefix cache against the original per-node scan
+# ---------------------------------------------------------------------------
+
+def _reference_sequence(node: TopologyNode, graph: TopologyGraph) -> int:
+    """Original sequence number: count earlier parallel components."""
+    sequence = 1
+    for other_id, other in graph.nodes.items():
+        if (other_id != node.id and other.type == node.type and
+                set(other.upstream_nodes) == set(node.upstream_nodes) and
+                set(other.downstream_nodes) == set(node.downstream_nodes) and
+                other_id < node.id):
+            sequence += 1
+    return sequence
+
+
+def _reference_update_all_tags(graph: TopologyGraph) -> Dict[str, str]:
+    """Original update_all_tags: no parallel index, no prefix cache."""
+    graph.calculate_network_levels()
+    graph.identify_buses()
+    
+    tag_updates = {}
+    for node_id, node in graph.nodes.items():
+        new_tag = generate_topology_aware_tag(node, graph, sequence=_reference_sequence(node, graph))
+        if node.tag != new_tag:
+            node.tag = new_tag
+            tag_updates[node_id] = new_tag
+    return tag_updates
+
+
+def _parallel_graph(seed: int) -> TopologyGraph:
+    """Panels feeding groups of parallel cables and breakers into motors."""
+    rng = random.Random(seed)
+    graph = TopologyGraph()
+    graph.add_node(TopologyNode("src", "Source", "", 11.0))
+    graph.add_node(TopologyNode("mdp", "Bus", "MDP-1", 0.4))
+    graph.add_edge(TopologyEdge("e-src", "src", "mdp", None))
+    
+    for panel in range(6):
+        panel_id = f"pnl{panel}"
+        graph.add_node(TopologyNode(panel_id, rng.choice(["Bus", "Panel"]), f"Panel {panel}", 0.4))
+        graph.add_edge(TopologyEdge(f"e-{panel_id}", "mdp", panel_id, None))
+        
+        for motor in range(rng.randint(1, 3)):
+            motor_id = f"m{panel}-{motor}"
+            graph.add_node(TopologyNode(motor_id, "Motor", "", 0.4))
+            
+            # IDs are strings, so "c10" sorts before "c2"
+            for k in range(rng.randint(1, 12)):
+                for node_type in ("Cable", "Breaker"):
+                    node_id = f"{node_type[0].lower()}{panel}{motor}{k}"
+                    graph.add_node(TopologyNode(node_id, node_type, rng.choice(["", "--", "old tag"]), 0.4))
+                    graph.add_edge(TopologyEdge(f"e-{node_id}-a", panel_id, node_id, None))
+                    graph.add_edge(TopologyEdge(f"e-{node_id}-b", node_id, motor_id, None))
+    
+    return graph
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sequence_numbers_match_original_scan(seed):
+    graph = _parallel_graph(seed)
+    parallel_index = _build_parallel_index(graph)
+    
+    for node in graph.nodes.values():
+        expected = _reference_sequence(node, graph)
+        assert _calculate_sequence_number(node, graph) == expected
+        assert _calculate_sequence_number(node, graph, parallel_index) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_update_all_tags_matches_original(seed):
+    graph = _parallel_graph(seed)
+    reference = _parallel_graph(seed)
+    
+    assert update_all_tags(graph) == _reference_update_all_tags(reference)
+    assert {k: n.tag for k, n in graph.nodes.items()} == {k: n.tag for k, n in reference.nodes.items()}
+    assert validate_tag_uniqueness(graph) == validate_tag_uniqueness(reference)
@@ -0,0 +1,256 @@
+"""
+Topology graph engine: traversal results and the frozen shared graph.
+"""
+
+import random
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+from utils.phase2.topology import TopologyEdge, TopologyGraph, TopologyNode
+
+
+def _sample_graph() -> TopologyGraph:
+    graph = TopologyGraph()
+    for node in (
+        TopologyNode("1", "Source", "SRC-11-01", 11.0),
+        TopologyNode("2", "Transformer", "T-11-SRC-MDP-01", 11.0),
+        TopologyNode("3", "Bus", "BUS-0.4-MDP-01", 0.4),
+        TopologyNode("4", "Cable", "C-0.4-MDP-M1-01", 0.4),
+        TopologyNode("5", "Motor", "M-0.4-M1-01", 0.4),
+        TopologyNode("6", "Cable", "C-0.4-MDP-M2-01", 0.4),
+        TopologyNode("7", "Motor", "M-0.4-M2-01", 0.4),
+    ):
+        graph.add_node(node)
+    for edge in (
+        TopologyEdge("e1", "1", "2", None, 0.05 + 0.15j),
+        TopologyEdge("e2", "2", "3", None, 0.01 + 0.03j),
+        TopologyEdge("e3", "3", "4", "cable1", 0.008 + 0.004j, 50.0),
+        TopologyEdge("e4", "4", "5", None),
+        TopologyEdge("e5", "3", "6", "cable2", 0.012 + 0.006j, 75.0),
+        TopologyEdge("e6", "6", "7", None),
+    ):
+        graph.add_edge(edge)
+    return graph
+
+
+def test_freeze_builds_analyses_and_rejects_mutation():
+    graph = _sample_graph()
+    graph.freeze()
+    
+    assert [node.level for node in graph.nodes.values()] == [0, 1, 2, 3, 4, 3, 4]
+    assert graph.buses == {"BUS-0.4kV-01": {"3"}}
+    
+    with pytest.raises(RuntimeError):
+        graph.add_node(TopologyNode("8", "Load", "", 0.4))
+    with pytest.raises(RuntimeError):
+        graph.add_edge(TopologyEdge("e7", "3", "8", None))
+    with pytest.raises(RuntimeError):
+        graph.remove_edge("e6")
+    with pytest.raises(RuntimeError):
+        graph.invalidate_analysis()
+    
+    # Analyses on the frozen graph are served from what freeze() built
+    graph.calculate_network_levels()
+    assert graph.identify_buses() == {"BUS-0.4kV-01": {"3"}}
+    assert graph.find_path("1", "5") == ["1", "2", "3", "4", "5"]
+    assert graph.calculate_path_impedance(["1", "2", "3", "4", "5"]) == pytest.approx(0.068 + 0.184j)
+
+
+# ---------------------------------------------------------------------------
+# Regression: the CSR/iterative traversals against the original algorithms
+# ---------------------------------------------------------------------------
+
+def _random_graph(seed: int, n: int = 200, m: int = 350, n_sources: int = 3) -> TopologyGraph:
+    """Random network with parallel edges, cycles and edges to node-less IDs."""
+    rng = random.Random(seed)
+    types = ["Bus", "Cable", "Motor", "Load", "Breaker", "Busbar", "Transformer"]
+    graph = TopologyGraph()
+    
+    for i in range(n):
+        node_type = "Source" if i < n_sources else rng.choice(types)
+        graph.add_node(TopologyNode(str(i), node_type, "", rng.choice([0.4, 11.0])))
+    
+    for j in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            impedance = complex(rng.random(), rng.random())
+            graph.add_edge(TopologyEdge(f"e{j}", str(a), str(b), None, impedance, 1.0))
+    
+    # Parallel cables between the same pair of nodes
+    for k in range(20):
+        node_id = str(n + k)
+        graph.add_node(TopologyNode(node_id, "Cable", "", 0.4))
+        graph.add_edge(TopologyEdge(f"p{k}a", "5", node_id, None))
+        graph.add_edge(TopologyEdge(f"p{k}b", node_id, "7", None))
+    
+    # Edges through IDs that have no node
+    for k in range(5):
+        graph.add_edge(TopologyEdge(f"g{k}a", str(rng.randrange(n)), f"ghost{k}", None, 1 + 1j))
+        graph.add_edge(TopologyEdge(f"g{k}b", f"ghost{k}", str(rng.randrange(n)), None, 1 + 1j))
+    
+    return graph
+
+
+def _reference_levels(graph: TopologyGraph) -> Dict[str, int]:
+    """Original per-source BFS keeping the shortest level."""
+    levels = {node_id: (0 if node.type == "Source" else -1) for node_id, node in graph.nodes.items()}
+    
+    for source_id in graph.sources:
+        queue = deque([(source_id, 0)])
+        visited = {source_id}
+        while queue:
+            node_id, level = queue.popleft()
+            if node_id in levels and (levels[node_id] == -1 or level < levels[node_id]):
+                levels[node_id] = level
+            for downstream_id in graph.adjacency.get(node_id, []):
+                if downstream_id not in visited:
+                    visited.add(downstream_id)
+                    queue.append((downstream_id, level + 1))
+    
+    return levels
+
+
+def _reference_buses(graph: TopologyGraph) -> Dict[str, Set[str]]:
+    """Original bus identification with a fresh search per bus."""
+    bus_types = ["Bus", "Busbar", "Switchgear"]
+    buses = {}
+    processed = set()
+    
+    for node_id, node in graph.nodes.items():
+        if node_id in processed or node.type not in bus_types:
+            continue
+        
+        connected = {node_id}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            for adj_id in graph.adjacency.get(current, []) + graph.reverse_adjacency.get(current, []):
+                adj_node = graph.nodes.get(adj_id)
+                if (adj_id not in connected and adj_node is not None and
+                        adj_node.voltage_level == node.voltage_level and adj_node.type in bus_types):
+                    connected.add(adj_id)
+                    queue.append(adj_id)
+        
+        buses[f"BUS-{node.voltage_level}kV-{len(buses) + 1:02d}"] = connected
+        processed |= connected
+    
+    return buses
+
+
+def _reference_loops(graph: TopologyGraph) -> List[List[str]]:
+    """Original recursive DFS cycle detection."""
+    loops = []
+    visited = set()
+    path = []
+    
+    def dfs_cycle(node_id, parent=None):
+        visited.add(node_id)
+        path.append(node_id)
+        for neighbor in graph.adjacency.get(node_id, []):
+            if neighbor not in visited:
+                dfs_cycle(neighbor, node_id)
+            elif neighbor != parent and neighbor in path:
+                loops.append(path[path.index(neighbor):] + [neighbor])
+        path.pop()
+    
+    for source_id in graph.sources:
+        if source_id not in visited:
+            dfs_cycle(source_id)
+    
+    return loops
+
+
+def _reference_path(graph: TopologyGraph, from_id: str, to_id: str) -> Optional[List[str]]:
+    """Original BFS carrying a copy of the path in every queue entry."""
+    if from_id not in graph.nodes or to_id not in graph.nodes:
+        return None
+    
+    queue = deque([(from_id, [from_id])])
+    visited = {from_id}
+    while queue:
+        node_id, path = queue.popleft()
+        if node_id == to_id:
+            return path
+        for neighbor in graph.adjacency.get(node_id, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [neighbor]))
+    
+    return None
+
+
+def _reference_path_impedance(graph: TopologyGraph, path: List[str]) -> complex:
+    """Original linear scan for the first edge of each hop."""
+    total = 0j
+    for source, target in zip(path, path[1:]):
+        for edge in graph.edges.values():
+            if edge.source_id == source and edge.target_id == target:
+                total += edge.impedance
+                break
+    return total
+
+
+@pytest.fixture(params=range(5))
+def random_graph(request) -> TopologyGraph:
+    return _random_graph(request.param)
+
+
+def test_levels_match_original(random_graph):
+    expected = _reference_levels(random_graph)
+    
+    random_graph.calculate_network_levels()
+    
+    assert {node_id: node.level for node_id, node in random_graph.nodes.items()} == expected
+
+
+def test_buses_match_original(random_graph):
+    expected = _reference_buses(random_graph)
+    
+    assert random_graph.identify_buses() == expected
+    for bus_name, node_ids in expected.items():
+        assert all(random_graph.nodes[node_id].bus_name == bus_name for node_id in node_ids)
+
+
+def test_loops_match_original(random_graph):
+    assert random_graph.detect_loops() == _reference_loops(random_graph)
+
+
+def test_paths_and_impedance_match_original(random_graph):
+    for target in range(0, 220, 3):
+        path = random_graph.find_path("0", str(target))
+        
+        assert path == _reference_path(random_graph, "0", str(target))
+        if path:
+            assert random_graph.calculate_path_impedance(path) == pytest.approx(
+                _reference_path_impedance(random_graph, path)
+            )
+
+
+def test_path_impedance_follows_edge_updates_and_removal(random_graph):
+    # Parallel cables 5 -> 200 -> 7: the first added edge of each hop counts
+    path = ["5", "200", "7"]
+    random_graph.edges["p0a"].impedance = 0.1 + 0.2j
+    random_graph.edges["p0b"].impedance = 0.3 + 0.4j
+    assert random_graph.calculate_path_impedance(path) == pytest.approx(0.4 + 0.6j)
+    
+    random_graph.remove_edge("p0b")
+    assert random_graph.calculate_path_impedance(path) == pytest.approx(0.1 + 0.2j)
+    
+    random_graph.remove_edge("e0")
+    assert random_graph.find_path("0", "7") == _reference_path(random_graph, "0", "7")
+
+
+def test_analyses_recompute_after_mutation(random_graph):
+    random_graph.calculate_network_levels()
+    random_graph.identify_buses()
+    
+    for edge_id in list(random_graph.edges)[::4]:
+        random_graph.remove_edge(edge_id)
+    random_graph.add_edge(TopologyEdge("extra", "0", "150", None))
+    
+    random_graph.calculate_network_levels()
+    assert {node_id: node.level for node_id, node in random_graph.nodes.items()} == _reference_levels(random_graph)
+    assert random_graph.identify_buses() == _reference_buses(random_graph)
+    assert random_graph.detect_loops() == _reference_loops(random_graph)
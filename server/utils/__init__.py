@@ -3,50 +3,87 @@ PwrSysPro Analysis Suite - Utilities Package
 All calculation modules organized by implementation phase
 """
 
-# Phase 1: Foundation
-from .phase1.calculations import (
-    calculate_voltage_drop_three_phase,
-    calculate_cable_derating_factor,
-    CableParameters,
-    LoadParameters
-)
-from .phase1.tagging import generate_tag
+import importlib
 
-# Phase 2: Topology & Files
-from .phase2.topology import TopologyGraph, build_topology_from_database
-from .phase2.serialization import PSPFileFormat
-from .phase2.tagging_enhanced import SmartTagManager, update_all_tags
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing one helper doesn't load numpy, reportlab, openpyxl, ... for
+# every phase. Maps submodule -> exported names.
+_LAZY_EXPORTS = {
+    # Phase 1: Foundation
+    ".phase1.calculations": (
+        "calculate_voltage_drop_three_phase",
+        "calculate_cable_derating_factor",
+        "CableParameters",
+        "LoadParameters",
+    ),
+    ".phase1.calculations_batch": (
+        "calculate_voltage_drop_three_phase_batch",
+        "calculate_cable_derating_factor_batch",
+        "CableArray",
+    ),
+    ".phase1.tagging": ("generate_tag", "tag_builder"),
 
-# Phase 3: Calculation Core
-from .phase3.per_unit import PerUnitSystem
-from .phase3.short_circuit import IEC60909Calculator, ShortCircuitParameters
-from .phase3.load_flow import NewtonRaphsonLoadFlow, BusType
-from .phase3.integrated_calc import IntegratedCalculationService
+    # Phase 2: Topology & Files
+    ".phase2.topology": ("TopologyGraph", "build_topology_from_database", "build_topology_from_rows"),
+    ".phase2.serialization": ("PSPFileFormat",),
+    ".phase2.tagging_enhanced": ("SmartTagManager", "update_all_tags"),
 
-# Phase 4: Bonus Features
-from .phase4.arc_flash import IEEE1584ArcFlashCalculator, calculate_arc_flash_for_bus
-from .phase4.report_generator import PwrSysProReportGenerator, generate_analysis_report
-from .phase4.protection import ProtectionCoordinator, ProtectiveDeviceSettings
+    # Phase 3: Calculation Core
+    ".phase3.per_unit": ("PerUnitSystem",),
+    ".phase3.short_circuit": ("IEC60909Calculator", "ShortCircuitParameters"),
+    ".phase3.load_flow": ("NewtonRaphsonLoadFlow", "BusType"),
+    ".phase3.integrated_calc": ("IntegratedCalculationService",),
+
+    # Phase 4: Bonus Features
+    ".phase4.arc_flash": ("IEEE1584ArcFlashCalculator", "calculate_arc_flash_for_bus", "calculate_arc_flash_batch"),
+    ".phase4.report_generator": ("PwrSysProReportGenerator", "generate_analysis_report"),
+    ".phase4.protection": ("ProtectionCoordinator", "ProtectiveDeviceSettings"),
+
+    # Phase 5: Advanced Features
+    ".phase5.rx_diagram": ("RXDiagramGenerator", "generate_rx_diagram_from_project"),
+    ".phase5.bus_tie": ("BusTieController", "BusParameters", "BusTieParameters", "TransferMode"),
+    ".phase5.loop_analysis": ("LoopFlowAnalyzer", "LoopAnalysisResult"),
+    ".phase5.validation": ("ValidationEngine", "ValidationIssue", "ValidationSeverity"),
+    ".phase5.narrative_generator": ("NarrativeGenerator",),
+    ".phase5.excel_export": ("ExcelExporter",),
+}
+
+_LAZY_ATTRS = {
+    name: module
+    for module, names in _LAZY_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Phase 5: Advanced Features
-from .phase5.rx_diagram import RXDiagramGenerator, generate_rx_diagram_from_project
-from .phase5.bus_tie import BusTieController, BusParameters, BusTieParameters, TransferMode
-from .phase5.loop_analysis import LoopFlowAnalyzer, LoopAnalysisResult
-from .phase5.validation import ValidationEngine, ValidationIssue, ValidationSeverity
-from .phase5.narrative_generator import NarrativeGenerator
-from .phase5.excel_export import ExcelExporter
 
 __all__ = [
     # Phase 1
     'calculate_voltage_drop_three_phase',
+    'calculate_voltage_drop_three_phase_batch',
     'calculate_cable_derating_factor',
+    'calculate_cable_derating_factor_batch',
     'CableParameters',
+    'CableArray',
     'LoadParameters',
     'generate_tag',
+    'tag_builder',
     
     # Phase 2
     'TopologyGraph',
     'build_topology_from_database',
+    'build_topology_from_rows',
     'PSPFileFormat',
     'SmartTagManager',
     'update_all_tags',
@@ -62,6 +99,7 @@ __all__ = [
     # Phase 4
     'IEEE1584ArcFlashCalculator',
     'calculate_arc_flash_for_bus',
+    'calculate_arc_flash_batch',
     'PwrSysProReportGenerator',
     'generate_analysis_report',
     'ProtectionCoordinator',
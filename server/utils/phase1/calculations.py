@@ -10,12 +10,33 @@ Standards Reference:
 
 import math
 from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+SQRT3: float = math.sqrt(3.0)
+
+# Grouping factor by number of cables (IEC 60364-5-52, Table 52-19);
+# index 0 is unused so the cable count indexes directly.
+GROUPING_FACTORS: Tuple[float, ...] = (1.0, 1.00, 0.80, 0.70, 0.65, 0.60, 0.57)
+
+# Installation method factor (simplified)
+INSTALLATION_FACTORS: Dict[str, float] = {
+    "E": 1.00,  # Cables on perforated tray (reference)
+    "F": 0.95,  # Cables on ladder/solid tray
+    "C": 0.90,  # Cables in conduit/trunking
+    "D": 0.85   # Cables directly buried underground
+}
+
+
+@dataclass(frozen=True, slots=True)
 class CableParameters:
-    """Cable electrical and physical parameters."""
+    """
+    Cable electrical and physical parameters.
+    
+    Derived totals are computed once at construction. Instances are
+    frozen so the totals cannot go stale; build a new instance
+    (dataclasses.replace) to change a cable.
+    """
     resistance_per_km: float  # Ohms/km
     reactance_per_km: float   # Ohms/km
     length_km: float          # km
@@ -26,55 +47,58 @@ class CableParameters:
     grouping_factor: float = 1.0
     installation_factor: float = 1.0
     
-    @property
-    def total_resistance(self) -> float:
-        """Total resistance (R) in Ohms."""
-        return self.resistance_per_km * self.length_km
-    
-    @property
-    def total_reactance(self) -> float:
-        """Total reactance (X) in Ohms."""
-        return self.reactance_per_km * self.length_km
-    
-    @property
-    def total_impedance(self) -> float:
-        """Total impedance |Z| in Ohms."""
-        return math.sqrt(self.total_resistance**2 + self.total_reactance**2)
-    
-    @property
-    def effective_ampacity(self) -> float:
-        """
-        Effective ampacity after applying derating factors.
-        Per IEC 60364-5-52, I_z = I_base Ã— k1 Ã— k2 Ã— k3
-        """
-        return (self.ampacity_base * 
-                self.ambient_temp_factor * 
-                self.grouping_factor * 
-                self.installation_factor)
+    # Derived totals, computed in __post_init__
+    total_resistance: float = field(init=False, repr=False, compare=False)    # R in Ohms
+    total_reactance: float = field(init=False, repr=False, compare=False)     # X in Ohms
+    total_impedance: float = field(init=False, repr=False, compare=False)     # |Z| in Ohms
+    effective_ampacity: float = field(init=False, repr=False, compare=False)  # I_z in Amps
+    
+    def __post_init__(self):
+        total_resistance = self.resistance_per_km * self.length_km
+        total_reactance = self.reactance_per_km * self.length_km
+        object.__setattr__(self, "total_resistance", total_resistance)
+        object.__setattr__(self, "total_reactance", total_reactance)
+        object.__setattr__(self, "total_impedance", math.sqrt(total_resistance**2 + total_reactance**2))
+        # Per IEC 60364-5-52, I_z = I_base × k1 × k2 × k3
+        effective_ampacity = (self.ampacity_base * 
+                              self.ambient_temp_factor * 
+                              self.grouping_factor * 
+                              self.installation_factor)
+        object.__setattr__(self, "effective_ampacity", effective_ampacity)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoadParameters:
-    """Load current and power factor parameters."""
+    """
+    Load current and power factor parameters.
+    
+    Frozen so the derived sin_phi always matches power_factor; build a
+    new instance (dataclasses.replace) to change the load.
+    """
     current_amps: float       # Load current in Amps
-    power_factor: float       # cos(Ï†), range [0, 1]
+    power_factor: float       # cos(φ), range (0, 1]
     voltage_nominal: float    # Nominal voltage in Volts
+    sin_phi: float = field(init=False)  # sin(φ), derived from power_factor
+    
+    def __post_init__(self):
+        if not 0.0 < self.power_factor <= 1.0:
+            raise ValueError(f"power_factor must be in (0, 1], got {self.power_factor}")
+        object.__setattr__(self, "sin_phi", math.sqrt(1.0 - self.power_factor * self.power_factor))
     
     @property
     def power_factor_angle(self) -> float:
-        """Power factor angle Ï† in radians."""
+        """Power factor angle φ in radians."""
         return math.acos(self.power_factor)
     
     @property
     def active_power_kw(self) -> float:
         """Active power P in kW (for 3-phase)."""
-        return math.sqrt(3) * self.voltage_nominal * self.current_amps * self.power_factor / 1000
+        return SQRT3 * self.voltage_nominal * self.current_amps * self.power_factor / 1000
     
     @property
     def reactive_power_kvar(self) -> float:
         """Reactive power Q in kVAR (for 3-phase)."""
-        sin_phi = math.sqrt(1 - self.power_factor**2)
-        return math.sqrt(3) * self.voltage_nominal * self.current_amps * sin_phi / 1000
+        return SQRT3 * self.voltage_nominal * self.current_amps * self.sin_phi / 1000
 
 
 def calculate_voltage_drop_three_phase(
@@ -85,14 +109,14 @@ def calculate_voltage_drop_three_phase(
     Calculate voltage drop for a three-phase AC system.
     
     Formula (IEC 60364-5-52):
-        Î”V = âˆš3 Ã— I Ã— (R Ã— cos(Ï†) + X Ã— sin(Ï†)) Ã— L
+        ΔV = √3 × I × (R × cos(φ) + X × sin(φ)) × L
     
     Where:
         I = Load current (A)
-        R = Cable resistance per unit length (Î©/km)
-        X = Cable reactance per unit length (Î©/km)
+        R = Cable resistance per unit length (Ω/km)
+        X = Cable reactance per unit length (Ω/km)
         L = Cable length (km)
-        Ï† = Power factor angle
+        φ = Power factor angle
     
     Args:
         cable: Cable parameters including R, X, and length
@@ -103,16 +127,18 @@ def calculate_voltage_drop_three_phase(
             - voltage_drop_volts: Voltage drop in Volts
             - voltage_drop_percent: Voltage drop as percentage
             - voltage_at_load: Voltage at load end in Volts
-            - power_loss_watts: Power loss in the cable (IÂ²R loss)
+            - power_loss_watts: Power loss in the cable (I²R loss)
     """
-    # Calculate sin(Ï†) from cos(Ï†)
     cos_phi = load.power_factor
-    sin_phi = math.sqrt(1 - cos_phi**2)
+    sin_phi = load.sin_phi
+    
+    R = cable.total_resistance
+    X = cable.total_reactance
     
     # Voltage drop formula
-    voltage_drop_volts = (math.sqrt(3) * 
+    voltage_drop_volts = (SQRT3 * 
                           load.current_amps * 
-                          (cable.total_resistance * cos_phi + cable.total_reactance * sin_phi))
+                          (R * cos_phi + X * sin_phi))
     
     # Percentage drop
     voltage_drop_percent = (voltage_drop_volts / load.voltage_nominal) * 100
@@ -120,19 +146,19 @@ def calculate_voltage_drop_three_phase(
     # Voltage at load
     voltage_at_load = load.voltage_nominal - voltage_drop_volts
     
-    # Power loss (3-phase): P_loss = 3 Ã— IÂ² Ã— R
-    power_loss_watts = 3 * (load.current_amps**2) * cable.total_resistance
+    # Power loss (3-phase): P_loss = 3 × I² × R
+    power_loss_watts = 3 * (load.current_amps**2) * R
     
     # Check against IEC limit (typically 5% for final circuits, 3% for distribution)
     within_limit_5_percent = voltage_drop_percent <= 5.0
     within_limit_3_percent = voltage_drop_percent <= 3.0
     
     return {
-        "voltage_drop_volts": round(voltage_drop_volts, 2),
-        "voltage_drop_percent": round(voltage_drop_percent, 2),
-        "voltage_at_load": round(voltage_at_load, 2),
-        "power_loss_watts": round(power_loss_watts, 2),
-        "power_loss_kw": round(power_loss_watts / 1000, 3),
+        "voltage_drop_volts": voltage_drop_volts,
+        "voltage_drop_percent": voltage_drop_percent,
+        "voltage_at_load": voltage_at_load,
+        "power_loss_watts": power_loss_watts,
+        "power_loss_kw": power_loss_watts / 1000,
         "within_5_percent_limit": within_limit_5_percent,
         "within_3_percent_limit": within_limit_3_percent,
         "status": "PASS" if within_limit_5_percent else "FAIL"
@@ -147,7 +173,7 @@ def calculate_voltage_drop_single_phase(
     Calculate voltage drop for a single-phase AC system.
     
     Formula:
-        Î”V = 2 Ã— I Ã— (R Ã— cos(Ï†) + X Ã— sin(Ï†)) Ã— L
+        ΔV = 2 × I × (R × cos(φ) + X × sin(φ)) × L
     
     The factor of 2 accounts for both go and return conductors.
     
@@ -159,7 +185,7 @@ def calculate_voltage_drop_single_phase(
         Voltage drop results dictionary
     """
     cos_phi = load.power_factor
-    sin_phi = math.sqrt(1 - cos_phi**2)
+    sin_phi = load.sin_phi
     
     voltage_drop_volts = (2 * 
                           load.current_amps * 
@@ -168,18 +194,18 @@ def calculate_voltage_drop_single_phase(
     voltage_drop_percent = (voltage_drop_volts / load.voltage_nominal) * 100
     voltage_at_load = load.voltage_nominal - voltage_drop_volts
     
-    # Power loss (single-phase): P_loss = 2 Ã— IÂ² Ã— R
+    # Power loss (single-phase): P_loss = 2 × I² × R
     power_loss_watts = 2 * (load.current_amps**2) * cable.total_resistance
     
     within_limit_5_percent = voltage_drop_percent <= 5.0
     within_limit_3_percent = voltage_drop_percent <= 3.0
     
     return {
-        "voltage_drop_volts": round(voltage_drop_volts, 2),
-        "voltage_drop_percent": round(voltage_drop_percent, 2),
-        "voltage_at_load": round(voltage_at_load, 2),
-        "power_loss_watts": round(power_loss_watts, 2),
-        "power_loss_kw": round(power_loss_watts / 1000, 3),
+        "voltage_drop_volts": voltage_drop_volts,
+        "voltage_drop_percent": voltage_drop_percent,
+        "voltage_at_load": voltage_at_load,
+        "power_loss_watts": power_loss_watts,
+        "power_loss_kw": power_loss_watts / 1000,
         "within_5_percent_limit": within_limit_5_percent,
         "within_3_percent_limit": within_limit_3_percent,
         "status": "PASS" if within_limit_5_percent else "FAIL"
@@ -197,7 +223,7 @@ def calculate_cable_derating_factor(
     
     Args:
         ambient_temp_celsius: Actual ambient temperature
-        reference_temp_celsius: Reference temperature for base rating (typically 30Â°C)
+        reference_temp_celsius: Reference temperature for base rating (typically 30°C)
         number_of_cables_grouped: Number of cables in the same group
         installation_method: Installation method code (E, F, etc.)
     
@@ -205,41 +231,25 @@ def calculate_cable_derating_factor(
         Dictionary with individual derating factors
     """
     # Temperature derating factor (IEC 60364-5-52, Table 52-14)
-    # Linear approximation: k = 1 - 0.02 Ã— (T_ambient - T_reference)
+    # Linear approximation: k = 1 - 0.02 × (T_ambient - T_reference)
     temp_delta = ambient_temp_celsius - reference_temp_celsius
     temp_factor = max(0.5, 1.0 - 0.02 * temp_delta)  # Min 0.5 for safety
     
-    # Grouping factor (IEC 60364-5-52, Table 52-19)
-    grouping_factors = {
-        1: 1.00,
-        2: 0.80,
-        3: 0.70,
-        4: 0.65,
-        5: 0.60,
-        6: 0.57
-    }
-    grouping_factor = grouping_factors.get(
-        min(number_of_cables_grouped, 6), 
-        0.50  # Conservative for >6 cables
-    )
+    # Grouping factor (IEC 60364-5-52, Table 52-19); >6 cables use the 6-cable value
+    n = number_of_cables_grouped
+    grouping_factor = GROUPING_FACTORS[min(n, 6)] if n >= 1 else 0.50
     
     # Installation method factor (simplified)
-    installation_factors = {
-        "E": 1.00,  # Cables on perforated tray (reference)
-        "F": 0.95,  # Cables on ladder/solid tray
-        "C": 0.90,  # Cables in conduit/trunking
-        "D": 0.85   # Cables directly buried underground
-    }
-    installation_factor = installation_factors.get(installation_method, 0.90)
+    installation_factor = INSTALLATION_FACTORS.get(installation_method, 0.90)
     
     # Overall derating factor
     overall_factor = temp_factor * grouping_factor * installation_factor
     
     return {
-        "temperature_factor": round(temp_factor, 3),
+        "temperature_factor": temp_factor,
         "grouping_factor": grouping_factor,
         "installation_factor": installation_factor,
-        "overall_factor": round(overall_factor, 3)
+        "overall_factor": overall_factor
     }
 
 
@@ -252,7 +262,7 @@ def check_cable_sizing(
     Check if cable is properly sized for the load.
     
     Per IEC 60364-5-52:
-        I_z â‰¥ I_b
+        I_z ≥ I_b
     Where:
         I_z = Effective ampacity after derating
         I_b = Design current (load current)
@@ -273,12 +283,12 @@ def check_cable_sizing(
     margin_percent = (margin_amps / effective_ampacity) * 100
     
     return {
-        "load_current": round(load_current, 1),
-        "cable_ampacity_base": round(cable_ampacity_base, 1),
-        "cable_ampacity_effective": round(effective_ampacity, 1),
-        "utilization_percent": round(utilization_percent, 1),
-        "margin_amps": round(margin_amps, 1),
-        "margin_percent": round(margin_percent, 1),
+        "load_current": load_current,
+        "cable_ampacity_base": cable_ampacity_base,
+        "cable_ampacity_effective": effective_ampacity,
+        "utilization_percent": utilization_percent,
+        "margin_amps": margin_amps,
+        "margin_percent": margin_percent,
         "is_adequate": is_adequate,
         "status": "PASS" if is_adequate else "FAIL - UNDERSIZED"
     }
@@ -318,20 +328,20 @@ def calculate_short_circuit_simplified(
         Z_total += cable_impedance_ohms
     
     # Short circuit current (3-phase)
-    I_sc_ka = (V_secondary_kv * 1000) / (math.sqrt(3) * Z_total * 1000)
+    I_sc_ka = (V_secondary_kv * 1000) / (SQRT3 * Z_total * 1000)
     
     return {
-        "fault_current_ka": round(I_sc_ka, 2),
-        "source_impedance_ohms": round(Z_source, 4),
-        "transformer_impedance_ohms": round(Z_transformer, 4),
-        "total_impedance_ohms": round(Z_total, 4),
+        "fault_current_ka": I_sc_ka,
+        "source_impedance_ohms": Z_source,
+        "transformer_impedance_ohms": Z_transformer,
+        "total_impedance_ohms": Z_total,
         "calculation_method": "IEC 60909 (Simplified)"
     }
 
 
 # Example usage
 if __name__ == "__main__":
-    print("âš¡ PwrSysPro Calculation Engine Test")
+    print("⚡ PwrSysPro Calculation Engine Test")
     print("=" * 70)
     
     # Test Case: 400V feeder to a motor
@@ -340,7 +350,7 @@ if __name__ == "__main__":
         reactance_per_km=0.086,
         length_km=0.050,  # 50 meters
         ampacity_base=285,
-        ambient_temp_factor=0.91,  # 40Â°C ambient
+        ambient_temp_factor=0.91,  # 40°C ambient
         grouping_factor=0.80,  # 2 cables grouped
         installation_factor=1.0
     )
@@ -351,13 +361,13 @@ if __name__ == "__main__":
         voltage_nominal=400
     )
     
-    print("\nðŸ“Š Voltage Drop Calculation (3-Phase)")
+    print("\n📊 Voltage Drop Calculation (3-Phase)")
     print("-" * 70)
     results = calculate_voltage_drop_three_phase(cable, load)
     for key, value in results.items():
         print(f"   {key:25}: {value}")
     
-    print("\nðŸ“Š Cable Derating Factors")
+    print("\n📊 Cable Derating Factors")
     print("-" * 70)
     derating = calculate_cable_derating_factor(
         ambient_temp_celsius=40,
@@ -367,10 +377,10 @@ if __name__ == "__main__":
     for key, value in derating.items():
         print(f"   {key:25}: {value}")
     
-    print("\nðŸ“Š Cable Sizing Check")
+    print("\n📊 Cable Sizing Check")
     print("-" * 70)
     sizing = check_cable_sizing(200, 285, derating)
     for key, value in sizing.items():
         print(f"   {key:25}: {value}")
     
-    print("\nâœ… Calculation engine test complete!")
+    print("\n✅ Calculation engine test complete!")
@@ -0,0 +1,172 @@
+"""
+PwrSysPro Analysis Suite - Batch Calculation Engine
+Vectorized (NumPy) versions of the calculations.py feeder formulas for
+evaluating many cables in one pass.
+
+Kept separate from calculations.py so the scalar engine used by the
+API endpoints does not pull in NumPy at import time.
+"""
+
+from typing import Dict, Iterable
+
+import numpy as np
+
+from utils.calculations import (
+    GROUPING_FACTORS,
+    INSTALLATION_FACTORS,
+    SQRT3,
+    CableParameters,
+)
+
+
+# Array form for the batch path; counts below 1 fall back to 0.50
+_GROUPING_FACTORS_BY_COUNT = np.array((0.50,) + GROUPING_FACTORS[1:])
+
+
+class CableArray:
+    """
+    Column-oriented (structure-of-arrays) storage for many cables.
+    
+    Each CableParameters field is held as a contiguous NumPy array so
+    derived quantities for a whole batch are computed in one pass.
+    Columns default to float32: datasheet R/X/ampacity values carry 3-4
+    significant digits, and float32 keeps relative error around 1e-6,
+    far inside the 3%/5% voltage-drop limits. Pass dtype=np.float64
+    where full precision matters.
+    """
+    
+    _COLUMNS = (
+        "resistance_per_km",
+        "reactance_per_km",
+        "length_km",
+        "ampacity_base",
+        "ambient_temp_factor",
+        "grouping_factor",
+        "installation_factor",
+    )
+    
+    def __init__(self, n: int, dtype=np.float32):
+        self.resistance_per_km = np.empty(n, dtype=dtype)
+        self.reactance_per_km = np.empty(n, dtype=dtype)
+        self.length_km = np.empty(n, dtype=dtype)
+        self.ampacity_base = np.empty(n, dtype=dtype)
+        self.ambient_temp_factor = np.ones(n, dtype=dtype)
+        self.grouping_factor = np.ones(n, dtype=dtype)
+        self.installation_factor = np.ones(n, dtype=dtype)
+    
+    @classmethod
+    def from_dataclasses(cls, cables: Iterable[CableParameters], dtype=np.float32) -> "CableArray":
+        """Build a CableArray from CableParameters instances."""
+        cables = list(cables)
+        array = cls(len(cables), dtype)
+        for column in cls._COLUMNS:
+            getattr(array, column)[:] = [getattr(cable, column) for cable in cables]
+        return array
+    
+    def __len__(self) -> int:
+        return len(self.length_km)
+    
+    def total_resistance(self) -> np.ndarray:
+        """Total resistance (R) in Ohms for each cable."""
+        return self.resistance_per_km * self.length_km
+    
+    def total_reactance(self) -> np.ndarray:
+        """Total reactance (X) in Ohms for each cable."""
+        return self.reactance_per_km * self.length_km
+    
+    def total_impedance(self) -> np.ndarray:
+        """Total impedance |Z| in Ohms for each cable."""
+        return np.hypot(self.total_resistance(), self.total_reactance())
+    
+    def effective_ampacity(self) -> np.ndarray:
+        """Derated ampacity I_z for each cable (IEC 60364-5-52)."""
+        return (self.ampacity_base * 
+                self.ambient_temp_factor * 
+                self.grouping_factor * 
+                self.installation_factor)
+
+
+def _as_float_array(values) -> np.ndarray:
+    """View values as a float32/float64 array, promoting anything else to float64."""
+    array = np.asarray(values)
+    if array.dtype in (np.float32, np.float64):
+        return array
+    return array.astype(np.float64)
+
+
+def calculate_voltage_drop_three_phase_batch(
+    resistance_per_km: np.ndarray,
+    reactance_per_km: np.ndarray,
+    length_km: np.ndarray,
+    current_amps: np.ndarray,
+    power_factor: np.ndarray,
+    voltage_nominal: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized three-phase voltage drop for many feeders at once.
+    
+    Same formula as calculate_voltage_drop_three_phase, evaluated over
+    1-D arrays (one element per feeder). float32 inputs (e.g. CableArray
+    columns) are computed in float32; anything else is promoted to
+    float64. Values are left unrounded; round once when serializing the
+    response.
+    
+    Returns:
+        Dictionary of arrays with the same keys as the scalar function
+    """
+    R = _as_float_array(resistance_per_km)
+    X = _as_float_array(reactance_per_km)
+    L = _as_float_array(length_km)
+    I = _as_float_array(current_amps)
+    pf = _as_float_array(power_factor)
+    V = _as_float_array(voltage_nominal)
+    
+    if not np.all((pf > 0.0) & (pf <= 1.0)):
+        raise ValueError("power_factor values must be in (0, 1]")
+    
+    sin_phi = np.sqrt(1.0 - pf * pf)
+    voltage_drop_volts = SQRT3 * I * (R * L * pf + X * L * sin_phi)
+    voltage_drop_percent = voltage_drop_volts / V * 100.0
+    power_loss_watts = 3.0 * I * I * R * L
+    within_limit_5_percent = voltage_drop_percent <= 5.0
+    
+    return {
+        "voltage_drop_volts": voltage_drop_volts,
+        "voltage_drop_percent": voltage_drop_percent,
+        "voltage_at_load": V - voltage_drop_volts,
+        "power_loss_watts": power_loss_watts,
+        "power_loss_kw": power_loss_watts / 1000.0,
+        "within_5_percent_limit": within_limit_5_percent,
+        "within_3_percent_limit": voltage_drop_percent <= 3.0,
+        "status": np.where(within_limit_5_percent, "PASS", "FAIL")
+    }
+
+
+def calculate_cable_derating_factor_batch(
+    ambient_temps_celsius: np.ndarray,
+    numbers_of_cables_grouped: np.ndarray,
+    installation_methods: Iterable[str],
+    reference_temp_celsius: float = 30.0
+) -> np.ndarray:
+    """
+    Vectorized calculate_cable_derating_factor for many feeders.
+    
+    Returns:
+        (N, 4) float array with columns temperature_factor,
+        grouping_factor, installation_factor, overall_factor (unrounded)
+    """
+    ambient = np.asarray(ambient_temps_celsius, dtype=np.float64)
+    grouped = np.asarray(numbers_of_cables_grouped, dtype=np.int64)
+    n = len(ambient)
+    
+    factors = np.empty((n, 4), dtype=np.float64)
+    np.clip(1.0 - 0.02 * (ambient - reference_temp_celsius), 0.5, None, out=factors[:, 0])
+    factors[:, 1] = _GROUPING_FACTORS_BY_COUNT[np.clip(grouped, 0, 6)]
+    factors[:, 2] = np.fromiter(
+        (INSTALLATION_FACTORS.get(method, 0.90) for method in installation_methods),
+        dtype=np.float64,
+        count=n
+    )
+    np.multiply(factors[:, 0], factors[:, 1], out=factors[:, 3])
+    factors[:, 3] *= factors[:, 2]
+    return factors
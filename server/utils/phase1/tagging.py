@@ -9,7 +9,8 @@ This is a critical feature that ensures consistent naming and traceability.
 """
 
 import re
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
 
 # Type code mapping
 TYPE_CODES = {
@@ -27,6 +28,24 @@ TYPE_CODES = {
     "Capacitor": "CAP"
 }
 
+# Reverse mapping: type code -> component type
+_CODE_TO_TYPE = {code: name for name, code in TYPE_CODES.items()}
+
+# ASCII bytes stripped from bus names by sanitize_bus_name (everything
+# except A-Z, a-z, 0-9); non-ASCII characters are dropped when encoding
+_BUS_DELETE_BYTES = bytes(c for c in range(128) if not chr(c).isalnum())
+
+
+class ParsedTag(NamedTuple):
+    """Components of a parsed tag."""
+    type_code: str
+    voltage: float
+    from_bus: Optional[str] = None
+    to_bus: Optional[str] = None
+    sequence: Optional[int] = None
+
+
+@lru_cache(maxsize=1024)
 def sanitize_bus_name(bus_name: str) -> str:
     """
     Sanitizes a bus name for use in tags.
@@ -39,10 +58,13 @@ def sanitize_bus_name(bus_name: str) -> str:
         Sanitized name (e.g., "MDP1", "MOTOR01")
     """
     # Remove hyphens, spaces, and special characters
-    sanitized = re.sub(r'[^A-Za-z0-9]', '', bus_name)
-    return sanitized.upper()
+    return (bus_name.encode('ascii', 'ignore')
+            .translate(None, _BUS_DELETE_BYTES)
+            .decode('ascii')
+            .upper())
 
 
+@lru_cache(maxsize=1024)
 def format_voltage(voltage_kv: float) -> str:
     """
     Formats voltage for tag display.
@@ -63,6 +85,38 @@ def format_voltage(voltage_kv: float) -> str:
         return f"{voltage_kv:.1f}"
 
 
+def _assemble_tag_prefix(
+    prefix: str,
+    from_bus: Optional[str],
+    to_bus: Optional[str]
+) -> str:
+    """
+    Joins TYPE-VOLTAGE prefix and sanitized bus names.
+    Bus names that sanitize to nothing are omitted.
+    """
+    from_bus = sanitize_bus_name(from_bus) if from_bus else ""
+    to_bus = sanitize_bus_name(to_bus) if to_bus else ""
+    
+    if from_bus and to_bus:
+        return f"{prefix}-{from_bus}-{to_bus}"
+    if from_bus:
+        return f"{prefix}-{from_bus}"
+    if to_bus:
+        return f"{prefix}-{to_bus}"
+    return prefix
+
+
+def _assemble_tag(
+    prefix: str,
+    from_bus: Optional[str],
+    to_bus: Optional[str],
+    sequence: int
+) -> str:
+    """Joins TYPE-VOLTAGE prefix, sanitized bus names and 2-digit sequence."""
+    return f"{_assemble_tag_prefix(prefix, from_bus, to_bus)}-{sequence:02d}"
+
+
+@lru_cache(maxsize=4096)
 def generate_tag(
     component_type: str,
     voltage_kv: float,
@@ -72,6 +126,7 @@ def generate_tag(
 ) -> str:
     """
     Generates an automatic tag for a component based on the PwrSysPro standard.
+    The function is pure, so results are memoized.
     
     Tag Format: [TYPE]-[VOLTAGE]-[FROM]-[TO]-[SEQ]
     
@@ -101,23 +156,35 @@ def generate_tag(
     # Format voltage
     voltage_str = format_voltage(voltage_kv)
     
-    # Build tag components
-    tag_parts = [type_code, voltage_str]
-    
-    # Add bus names if provided
-    if from_bus:
-        tag_parts.append(sanitize_bus_name(from_bus))
+    return _assemble_tag(f"{type_code}-{voltage_str}", from_bus, to_bus, sequence)
+
+
+def tag_builder(component_type: str, voltage_kv: float) -> Callable[..., str]:
+    """
+    Returns a tag generator with the TYPE-VOLTAGE prefix precomputed.
+    Use when generating many tags for one component type and voltage level;
+    the returned function takes (from_bus, to_bus, sequence) like generate_tag.
     
-    if to_bus:
-        tag_parts.append(sanitize_bus_name(to_bus))
+    Example:
+        >>> cable_tag = tag_builder("Cable", 0.48)
+        >>> cable_tag("MDP-1", "Motor-1", 1)
+        'C-0.48-MDP1-MOTOR1-01'
+    """
+    type_code = TYPE_CODES.get(component_type, component_type[:3].upper())
+    prefix = f"{type_code}-{format_voltage(voltage_kv)}"
     
-    # Add sequence number (always 2 digits)
-    tag_parts.append(f"{sequence:02d}")
+    def build(
+        from_bus: Optional[str] = None,
+        to_bus: Optional[str] = None,
+        sequence: int = 1
+    ) -> str:
+        return _assemble_tag(prefix, from_bus, to_bus, sequence)
     
-    return "-".join(tag_parts)
+    return build
 
 
-def parse_tag(tag: str) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def parse_tag(tag: str) -> ParsedTag:
     """
     Parses an existing tag back into its components.
     Useful for validation and editing operations.
@@ -126,43 +193,31 @@ def parse_tag(tag: str) -> Dict[str, Any]:
         tag: Tag string to parse (e.g., "C-0.48-MDP1-M1-01")
     
     Returns:
-        Dictionary with tag components
+        ParsedTag with the tag components
     
     Example:
         >>> parse_tag("C-0.48-MDP1-M1-01")
-        {
-            'type_code': 'C',
-            'voltage': 0.48,
-            'from_bus': 'MDP1',
-            'to_bus': 'M1',
-            'sequence': 1
-        }
+        ParsedTag(type_code='C', voltage=0.48, from_bus='MDP1', to_bus='M1', sequence=1)
     """
     parts = tag.split("-")
     
     if len(parts) < 3:
         raise ValueError(f"Invalid tag format: {tag}")
     
-    result = {
-        "type_code": parts[0],
-        "voltage": float(parts[1]),
-        "sequence": None,
-        "from_bus": None,
-        "to_bus": None
-    }
-    
     # Last part is always sequence if it's numeric
+    sequence = None
     if parts[-1].isdigit():
-        result["sequence"] = int(parts[-1])
+        sequence = int(parts[-1])
         parts = parts[:-1]
     
     # Remaining parts are bus names
-    if len(parts) > 2:
-        result["from_bus"] = parts[2]
-    if len(parts) > 3:
-        result["to_bus"] = parts[3]
-    
-    return result
+    return ParsedTag(
+        parts[0],
+        float(parts[1]),
+        parts[2] if len(parts) > 2 else None,
+        parts[3] if len(parts) > 3 else None,
+        sequence
+    )
 
 
 def update_tag_on_move(
@@ -189,38 +244,23 @@ def update_tag_on_move(
     parsed = parse_tag(current_tag)
     
     # Reverse lookup type from code
-    type_name = None
-    for name, code in TYPE_CODES.items():
-        if code == parsed["type_code"]:
-            type_name = name
-            break
-    
-    if not type_name:
-        type_name = "Unknown"
+    type_name = _CODE_TO_TYPE.get(parsed.type_code, "Unknown")
     
     # Use new bus names if provided, otherwise keep existing
-    from_bus = new_from_bus if new_from_bus else parsed.get("from_bus")
-    to_bus = new_to_bus if new_to_bus else parsed.get("to_bus")
+    from_bus = new_from_bus if new_from_bus else parsed.from_bus
+    to_bus = new_to_bus if new_to_bus else parsed.to_bus
     
     return generate_tag(
         component_type=type_name,
-        voltage_kv=parsed["voltage"],
+        voltage_kv=parsed.voltage,
         from_bus=from_bus,
         to_bus=to_bus,
-        sequence=parsed.get("sequence", 1)
+        sequence=parsed.sequence if parsed.sequence is not None else 1
     )
 
 
-def validate_tag(tag: str) -> tuple[bool, str]:
-    """
-    Validates a tag against the PwrSysPro standard format.
-    
-    Args:
-        tag: Tag string to validate
-    
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
+def _check_tag(tag: str) -> tuple[bool, str]:
+    """Uncached body of validate_tag."""
     try:
         parts = tag.split("-")
         
@@ -228,7 +268,7 @@ def validate_tag(tag: str) -> tuple[bool, str]:
             return False, "Tag must have at least 3 parts: TYPE-VOLTAGE-SEQUENCE"
         
         # Validate type code
-        if parts[0] not in TYPE_CODES.values():
+        if parts[0] not in _CODE_TO_TYPE:
             return False, f"Invalid type code: {parts[0]}"
         
         # Validate voltage
@@ -251,9 +291,30 @@ def validate_tag(tag: str) -> tuple[bool, str]:
         return False, f"Tag parsing error: {str(e)}"
 
 
+_check_tag_cached = lru_cache(maxsize=4096)(_check_tag)
+
+
+def validate_tag(tag: str) -> tuple[bool, str]:
+    """
+    Validates a tag against the PwrSysPro standard format.
+    Results for string tags are memoized.
+    
+    Args:
+        tag: Tag string to validate
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # Non-strings (possibly unhashable) skip the cache and are reported
+    # as parsing errors rather than raising
+    if isinstance(tag, str):
+        return _check_tag_cached(tag)
+    return _check_tag(tag)
+
+
 # Example usage and testing
 if __name__ == "__main__":
-    print("ðŸ·ï¸  PwrSysPro Auto-Tagging Engine Test")
+    print("🏷️  PwrSysPro Auto-Tagging Engine Test")
     print("=" * 60)
     
     # Test tag generation
@@ -266,20 +327,20 @@ if __name__ == "__main__":
     
     for test in tests:
         tag = generate_tag(*test)
-        print(f"âœ“ {test[0]:12} â†’ {tag}")
+        print(f"✓ {test[0]:12} → {tag}")
     
     print("\n" + "=" * 60)
     
     # Test tag parsing
     test_tag = "C-0.48-MDP1-M1-01"
     parsed = parse_tag(test_tag)
-    print(f"ðŸ“– Parsing: {test_tag}")
-    print(f"   Type: {parsed['type_code']}, Voltage: {parsed['voltage']}kV")
-    print(f"   From: {parsed['from_bus']}, To: {parsed['to_bus']}")
-    print(f"   Sequence: {parsed['sequence']}")
+    print(f"📖 Parsing: {test_tag}")
+    print(f"   Type: {parsed.type_code}, Voltage: {parsed.voltage}kV")
+    print(f"   From: {parsed.from_bus}, To: {parsed.to_bus}")
+    print(f"   Sequence: {parsed.sequence}")
     
     print("\n" + "=" * 60)
     
     # Test tag update
     updated = update_tag_on_move(test_tag, new_to_bus="Motor-2")
-    print(f"ðŸ”„ Update: {test_tag} â†’ {updated}")
+    print(f"🔄 Update: {test_tag} → {updated}")
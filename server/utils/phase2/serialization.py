@@ -10,6 +10,11 @@ The .psp (PwrSysPro Project) file format is a JSON-based format that contains:
 - Calculation results
 - Design basis and standards
 
+The payload is JSON by default; MessagePack (binary=True) is opt-in for
+server-side files that never go through the client importer. Files are
+gzip-compressed by default; zstd (zstd=True) is likewise opt-in. The
+loader accepts every combination.
+
 File Structure:
 {
     "format_version": "2.0",
@@ -22,12 +27,39 @@ File Structure:
 }
 """
 
-import json
 import gzip
-from datetime import datetime
+import shutil
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from pathlib import Path
 
+import orjson
+
+try:
+    import ormsgpack
+    ORMSGPACK_AVAILABLE = True
+except ImportError:
+    ORMSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# orjson rejects non-str dict keys by default; calculation results can be
+# keyed by bus id
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+_REQUIRED_KEYS_ORDER = ("format_version", "project", "nodes", "connections")
+_REQUIRED_KEYS = frozenset(_REQUIRED_KEYS_ORDER)
+
+# Shared default for chained .get() lookups; never mutated or returned
+_EMPTY: Dict = {}
+
 
 class PSPFileFormat:
     """
@@ -38,7 +70,12 @@ class PSPFileFormat:
     FILE_EXTENSION = ".psp"
     
     def __init__(self):
-        self.compress = True  # Use gzip compression by default
+        self.compress = True  # gzip unless zstd is set
+        self.compresslevel = 6  # gzip: ~2x faster than the default 9, slightly larger files
+        self.zstd = False  # Compress with zstd instead of gzip (opt-in)
+        self.zstd_level = 3
+        self.pretty = False  # Indent JSON output (debugging only)
+        self.binary = False  # MessagePack payload (opt-in; the client importer reads JSON only)
     
     def serialize_project(
         self,
@@ -61,9 +98,11 @@ class PSPFileFormat:
         Returns:
             Complete project data as dictionary
         """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
         psp_data = {
             "format_version": self.FORMAT_VERSION,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now_iso,
             "application": "PwrSysPro Analysis Suite",
             
             "project": {
@@ -75,18 +114,13 @@ class PSPFileFormat:
                 "standard_short_circuit": project_data.get("standard_short_circuit", "IEC 60909"),
                 "standard_cable": project_data.get("standard_cable", "IEC 60364-5-52"),
                 "created_at": project_data.get("created_at"),
-                "updated_at": datetime.utcnow().isoformat()
+                "updated_at": now_iso
             },
             
             "nodes": self._serialize_nodes(nodes_data),
             "connections": self._serialize_connections(connections_data),
             
-            "metadata": {
-                "node_count": len(nodes_data),
-                "connection_count": len(connections_data),
-                "saved_by": "PwrSysPro v2.0",
-                "schema_version": "2.0"
-            }
+            "metadata": self._build_metadata(len(nodes_data), len(connections_data))
         }
         
         # Add optional data
@@ -98,12 +132,19 @@ class PSPFileFormat:
         
         return psp_data
     
+    def _build_metadata(self, node_count: int, connection_count: int) -> Dict:
+        """Metadata block written with every .psp file."""
+        return {
+            "node_count": node_count,
+            "connection_count": connection_count,
+            "saved_by": "PwrSysPro v2.0",
+            "schema_version": "2.0"
+        }
+    
     def _serialize_nodes(self, nodes_data: List[Dict]) -> List[Dict]:
         """Serialize node data with proper formatting."""
-        serialized_nodes = []
-        
-        for node in nodes_data:
-            serialized_node = {
+        return [
+            {
                 "id": node.get("id"),
                 "type": node.get("type"),
                 "position": {
@@ -120,16 +161,13 @@ class PSPFileFormat:
                 },
                 "results": node.get("results", {})
             }
-            serialized_nodes.append(serialized_node)
-        
-        return serialized_nodes
+            for node in nodes_data
+        ]
     
     def _serialize_connections(self, connections_data: List[Dict]) -> List[Dict]:
         """Serialize connection data."""
-        serialized_connections = []
-        
-        for conn in connections_data:
-            serialized_conn = {
+        return [
+            {
                 "id": conn.get("id"),
                 "source_node_id": conn.get("source_node_id"),
                 "target_node_id": conn.get("target_node_id"),
@@ -142,9 +180,8 @@ class PSPFileFormat:
                 },
                 "properties": conn.get("properties", {})
             }
-            serialized_connections.append(serialized_conn)
-        
-        return serialized_connections
+            for conn in connections_data
+        ]
     
     def save_to_file(self, psp_data: Dict, file_path: str) -> bool:
         """
@@ -163,16 +200,16 @@ class PSPFileFormat:
             if path.suffix != self.FILE_EXTENSION:
                 path = path.with_suffix(self.FILE_EXTENSION)
             
-            # Convert to JSON
-            json_str = json.dumps(psp_data, indent=2, ensure_ascii=False)
+            payload = self._encode(psp_data)
             
             # Save with or without compression
-            if self.compress:
-                with gzip.open(path, 'wt', encoding='utf-8') as f:
-                    f.write(json_str)
-            else:
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
+            if self.compress and self.zstd:
+                if not ZSTD_AVAILABLE:
+                    raise ValueError("zstd-compressed .psp output requires the zstandard package")
+                payload = zstandard.ZstdCompressor(level=self.zstd_level).compress(payload)
+            elif self.compress:
+                payload = gzip.compress(payload, compresslevel=self.compresslevel)
+            path.write_bytes(payload)
             
             return True
             
@@ -180,6 +217,40 @@ class PSPFileFormat:
             print(f"Error saving .psp file: {e}")
             return False
     
+    def export_json(self, psp_data: Dict, file_path: str) -> bool:
+        """
+        Write project data as plain, uncompressed JSON (for interchange).
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            Path(file_path).write_bytes(self._encode_json(psp_data))
+            return True
+        except Exception as e:
+            print(f"Error exporting JSON file: {e}")
+            return False
+    
+    def _encode(self, psp_data: Dict) -> bytes:
+        """Encode the .psp payload (MessagePack or JSON)."""
+        if self.binary:
+            if not ORMSGPACK_AVAILABLE:
+                raise ValueError("MessagePack .psp output requires the ormsgpack package")
+            return ormsgpack.packb(psp_data, option=ormsgpack.OPT_NON_STR_KEYS)
+        return self._encode_json(psp_data)
+    
+    def _encode_json(self, psp_data: Dict) -> bytes:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if self.pretty else _ORJSON_OPTIONS
+        return orjson.dumps(psp_data, option=options)
+    
+    def _decode(self, raw: bytes) -> Dict:
+        """Decode a payload; JSON files start with '{' (after any whitespace)."""
+        if raw.lstrip()[:1] == b'{':
+            return orjson.loads(raw)
+        if not ORMSGPACK_AVAILABLE:
+            raise ValueError("MessagePack .psp file requires the ormsgpack package")
+        return ormsgpack.unpackb(raw, option=ormsgpack.OPT_NON_STR_KEYS)
+    
     def load_from_file(self, file_path: str) -> Optional[Dict]:
         """
         Load project data from .psp file.
@@ -197,14 +268,15 @@ class PSPFileFormat:
                 print(f"File not found: {file_path}")
                 return None
             
-            # Try to load as compressed first
-            try:
-                with gzip.open(path, 'rt', encoding='utf-8') as f:
-                    psp_data = json.load(f)
-            except (gzip.BadGzipFile, OSError):
-                # Not compressed, load as regular JSON
-                with open(path, 'r', encoding='utf-8') as f:
-                    psp_data = json.load(f)
+            # Compressed files are recognised by their magic bytes
+            raw = path.read_bytes()
+            if raw[:4] == _ZSTD_MAGIC:
+                if not ZSTD_AVAILABLE:
+                    raise ValueError("zstd-compressed .psp file requires the zstandard package")
+                raw = zstandard.ZstdDecompressor().decompress(raw)
+            elif raw[:2] == _GZIP_MAGIC:
+                raw = gzip.decompress(raw)
+            psp_data = self._decode(raw)
             
             # Validate format version
             if not self._validate_format(psp_data):
@@ -219,18 +291,15 @@ class PSPFileFormat:
     
     def _validate_format(self, psp_data: Dict) -> bool:
         """Validate .psp file format."""
-        required_keys = ["format_version", "project", "nodes", "connections"]
-        
-        for key in required_keys:
-            if key not in psp_data:
-                print(f"Missing required key: {key}")
-                return False
+        if not _REQUIRED_KEYS.issubset(psp_data.keys()):
+            missing = [key for key in _REQUIRED_KEYS_ORDER if key not in psp_data]
+            print(f"Missing required key: {missing[0]}")
+            return False
         
-        # Check version compatibility
+        # Check version compatibility (major version 2)
         version = psp_data.get("format_version", "")
-        major_version = version.split(".")[0] if "." in version else version
         
-        if major_version != "2":
+        if not (version.startswith("2.") or version == "2"):
             print(f"Unsupported format version: {version}")
             return False
         
@@ -254,45 +323,39 @@ class PSPFileFormat:
     
     def _deserialize_nodes(self, nodes_data: List[Dict]) -> List[Dict]:
         """Convert .psp node format back to database format."""
-        db_nodes = []
-        
-        for node in nodes_data:
-            db_node = {
+        return [
+            {
                 "id": node.get("id"),
                 "type": node.get("type"),
-                "position_x": node.get("position", {}).get("x", 0),
-                "position_y": node.get("position", {}).get("y", 0),
+                "position_x": node.get("position", _EMPTY).get("x", 0),
+                "position_y": node.get("position", _EMPTY).get("y", 0),
                 "custom_tag": node.get("tag", ""),
                 "component_library_id": node.get("component_library_id"),
                 "properties": node.get("properties", {}),
-                "location_site": node.get("location", {}).get("site"),
-                "location_building": node.get("location", {}).get("building"),
-                "location_room": node.get("location", {}).get("room"),
+                "location_site": node.get("location", _EMPTY).get("site"),
+                "location_building": node.get("location", _EMPTY).get("building"),
+                "location_room": node.get("location", _EMPTY).get("room"),
                 "results": node.get("results", {})
             }
-            db_nodes.append(db_node)
-        
-        return db_nodes
+            for node in nodes_data
+        ]
     
     def _deserialize_connections(self, connections_data: List[Dict]) -> List[Dict]:
         """Convert .psp connection format back to database format."""
-        db_connections = []
-        
-        for conn in connections_data:
-            db_conn = {
+        return [
+            {
                 "id": conn.get("id"),
                 "source_node_id": conn.get("source_node_id"),
                 "target_node_id": conn.get("target_node_id"),
                 "cable_library_id": conn.get("cable_library_id"),
                 "length": conn.get("length", 0),
-                "installation_method": conn.get("installation", {}).get("method", "E"),
-                "grouping_factor": conn.get("installation", {}).get("grouping_factor", 1.0),
-                "ambient_temp": conn.get("installation", {}).get("ambient_temp", 30.0),
+                "installation_method": conn.get("installation", _EMPTY).get("method", "E"),
+                "grouping_factor": conn.get("installation", _EMPTY).get("grouping_factor", 1.0),
+                "ambient_temp": conn.get("installation", _EMPTY).get("ambient_temp", 30.0),
                 "properties": conn.get("properties", {})
             }
-            db_connections.append(db_conn)
-        
-        return db_connections
+            for conn in connections_data
+        ]
     
     def export_summary(self, psp_data: Dict) -> str:
         """
@@ -302,19 +365,19 @@ class PSPFileFormat:
         metadata = psp_data.get("metadata", {})
         
         summary = f"""
-â•”â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•—
-â•‘         PwrSysPro Project Summary                              â•‘
-â• â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•£
-â•‘                                                                â•‘
-â•‘  Project: {project.get('name', 'Unknown'):<48} â•‘
-â•‘  Format Version: {psp_data.get('format_version', 'Unknown'):<43} â•‘
-â•‘  Components: {metadata.get('node_count', 0):<48} â•‘
-â•‘  Connections: {metadata.get('connection_count', 0):<47} â•‘
-â•‘  Standards: {project.get('standard_short_circuit', 'Unknown'):<48} â•‘
-â•‘  Base MVA: {project.get('base_mva', 0):<49} â•‘
-â•‘  Frequency: {project.get('system_frequency', 0)} Hz{' ' * 43} â•‘
-â•‘                                                                â•‘
-â•šâ•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
+╔═══════════════════════════════════════════════════════════════╗
+║         PwrSysPro Project Summary                              ║
+╠═══════════════════════════════════════════════════════════════╣
+║                                                                ║
+║  Project: {project.get('name', 'Unknown'):<48} ║
+║  Format Version: {psp_data.get('format_version', 'Unknown'):<43} ║
+║  Components: {metadata.get('node_count', 0):<48} ║
+║  Connections: {metadata.get('connection_count', 0):<47} ║
+║  Standards: {project.get('standard_short_circuit', 'Unknown'):<48} ║
+║  Base MVA: {project.get('base_mva', 0):<49} ║
+║  Frequency: {project.get('system_frequency', 0)} Hz{' ' * 43} ║
+║                                                                ║
+╚═══════════════════════════════════════════════════════════════╝
         """
         
         return summary.strip()
@@ -335,10 +398,8 @@ def create_backup(file_path: str) -> Optional[str]:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = path.with_name(f"{path.stem}_backup_{timestamp}{path.suffix}")
         
-        # Copy file
-        with open(path, 'rb') as src:
-            with open(backup_path, 'wb') as dst:
-                dst.write(src.read())
+        # Copy file (kernel-side copy where the platform supports it)
+        shutil.copyfile(path, backup_path)
         
         return str(backup_path)
         
@@ -371,34 +432,46 @@ def merge_projects(file1: str, file2: str, output_file: str) -> bool:
             return False
         
         # Offset node IDs in second project to avoid conflicts
-        max_id1 = max([n["id"] for n in data1["nodes"]] + [0])
+        max_id1 = max((n["id"] for n in data1["nodes"]), default=0)
         id_offset = max_id1 + 1
         
-        # Merge nodes
-        merged_nodes = data1["nodes"].copy()
-        for node in data2["nodes"]:
-            node["id"] = node["id"] + id_offset
-            merged_nodes.append(node)
+        # Merge nodes (copies; the loaded dicts are left untouched)
+        merged_nodes = data1["nodes"] + [
+            {**node, "id": node["id"] + id_offset}
+            for node in data2["nodes"]
+        ]
         
         # Merge connections (update IDs)
-        merged_connections = data1["connections"].copy()
-        for conn in data2["connections"]:
-            conn["id"] = conn["id"] + id_offset
-            conn["source_node_id"] = conn["source_node_id"] + id_offset
-            conn["target_node_id"] = conn["target_node_id"] + id_offset
-            merged_connections.append(conn)
+        merged_connections = data1["connections"] + [
+            {
+                **conn,
+                "id": conn["id"] + id_offset,
+                "source_node_id": conn["source_node_id"] + id_offset,
+                "target_node_id": conn["target_node_id"] + id_offset
+            }
+            for conn in data2["connections"]
+        ]
         
         # Create merged project
-        merged_project = data1["project"].copy()
-        merged_project["name"] = f"{data1['project']['name']} + {data2['project']['name']}"
-        merged_project["description"] = "Merged project"
+        now_iso = datetime.now(timezone.utc).isoformat()
+        merged_project = {
+            **data1["project"],
+            "name": f"{data1['project']['name']} + {data2['project']['name']}",
+            "description": "Merged project",
+            "updated_at": now_iso
+        }
         
-        # Serialize and save
-        merged_data = psp.serialize_project(
-            merged_project,
-            merged_nodes,
-            merged_connections
-        )
+        # Nodes and connections are already in .psp shape, so assemble the
+        # file directly instead of round-tripping through serialize_project
+        merged_data = {
+            "format_version": psp.FORMAT_VERSION,
+            "created_at": now_iso,
+            "application": "PwrSysPro Analysis Suite",
+            "project": merged_project,
+            "nodes": merged_nodes,
+            "connections": merged_connections,
+            "metadata": psp._build_metadata(len(merged_nodes), len(merged_connections))
+        }
         
         return psp.save_to_file(merged_data, output_file)
         
@@ -409,7 +482,7 @@ def merge_projects(file1: str, file2: str, output_file: str) -> bool:
 
 # Example usage
 if __name__ == "__main__":
-    print("ðŸ’¾ PwrSysPro File Serialization Test")
+    print("💾 PwrSysPro File Serialization Test")
     print("=" * 70)
     
     # Create test data
@@ -459,7 +532,7 @@ if __name__ == "__main__":
     psp = PSPFileFormat()
     psp_data = psp.serialize_project(project_data, nodes_data, connections_data)
     
-    print("\nðŸ“Š Serialized Data:")
+    print("\n📊 Serialized Data:")
     print("-" * 70)
     print(f"Format Version: {psp_data['format_version']}")
     print(f"Project: {psp_data['project']['name']}")
@@ -469,16 +542,16 @@ if __name__ == "__main__":
     # Test file save/load
     test_file = "/tmp/test_project.psp"
     
-    print(f"\nðŸ’¾ Saving to: {test_file}")
+    print(f"\n💾 Saving to: {test_file}")
     success = psp.save_to_file(psp_data, test_file)
-    print(f"   {'âœ… Success' if success else 'âŒ Failed'}")
+    print(f"   {'✅ Success' if success else '❌ Failed'}")
     
-    print(f"\nðŸ“‚ Loading from: {test_file}")
+    print(f"\n📂 Loading from: {test_file}")
     loaded_data = psp.load_from_file(test_file)
     if loaded_data:
-        print("   âœ… Success")
+        print("   ✅ Success")
         print(psp.export_summary(loaded_data))
     else:
-        print("   âŒ Failed")
+        print("   ❌ Failed")
     
-    print("\nâœ… Serialization test complete!")
+    print("\n✅ Serialization test complete!")
@@ -10,12 +10,14 @@ Tags now update automatically when:
 Tag Format: [TYPE]-[VOLTAGE]-[FROM_BUS]-[TO_BUS]-[SEQUENCE]
 """
 
+from bisect import bisect_left
+from collections import Counter
 from typing import Optional, Dict, List, Tuple
 from utils.tagging import (
     TYPE_CODES, 
-    sanitize_bus_name, 
     format_voltage,
-    parse_tag as parse_tag_basic
+    parse_tag as parse_tag_basic,
+    _assemble_tag_prefix
 )
 from utils.topology import TopologyGraph, TopologyNode
 
@@ -23,7 +25,9 @@ from utils.topology import TopologyGraph, TopologyNode
 def generate_topology_aware_tag(
     node: TopologyNode,
     graph: TopologyGraph,
-    sequence: Optional[int] = None
+    sequence: Optional[int] = None,
+    parallel_index: Optional[Dict[Tuple[str, frozenset, frozenset], List[str]]] = None,
+    prefix_cache: Optional[Dict[Tuple, str]] = None
 ) -> str:
     """
     Generate tag based on actual network topology.
@@ -32,16 +36,37 @@ def generate_topology_aware_tag(
         node: The node to generate tag for
         graph: Current topology graph
         sequence: Optional sequence number (auto-assigned if None)
+        parallel_index: Optional index from _build_parallel_index, reused
+            when tagging many nodes of the same graph
+        prefix_cache: Optional dict memoizing tag prefixes by topology context
     
     Returns:
         Generated tag string
     """
-    # Get type code
-    type_code = TYPE_CODES.get(node.type, node.type[:3].upper())
+    context = _resolve_tag_context(node, graph)
+    
+    if prefix_cache is None:
+        prefix = _build_tag_prefix(context)
+    else:
+        prefix = prefix_cache.get(context)
+        if prefix is None:
+            prefix = prefix_cache[context] = _build_tag_prefix(context)
     
-    # Format voltage
-    voltage_str = format_voltage(node.voltage_level)
+    # Determine sequence number
+    if sequence is None:
+        sequence = _calculate_sequence_number(node, graph, parallel_index)
     
+    return f"{prefix}-{sequence:02d}"
+
+
+def _resolve_tag_context(
+    node: TopologyNode,
+    graph: TopologyGraph
+) -> Tuple[str, float, Optional[str], Optional[str]]:
+    """
+    Resolve the topology context a tag is built from.
+    Returns (type, voltage_level, from_bus, to_bus).
+    """
     # Determine FROM and TO based on topology
     from_bus = None
     to_bus = None
@@ -78,47 +103,58 @@ def generate_topology_aware_tag(
             from_bus = node.bus_name
             to_bus = None
     
-    # Determine sequence number
-    if sequence is None:
-        sequence = _calculate_sequence_number(node, graph)
+    return (node.type, node.voltage_level, from_bus, to_bus)
+
+
+def _build_tag_prefix(context: Tuple[str, float, Optional[str], Optional[str]]) -> str:
+    """
+    Build the TYPE-VOLTAGE[-FROM][-TO] part of a tag from its context,
+    with the same assembly rules as generate_tag.
+    """
+    node_type, voltage_level, from_bus, to_bus = context
     
-    # Build tag
-    tag_parts = [type_code, voltage_str]
+    # Get type code
+    type_code = TYPE_CODES.get(node_type, node_type[:3].upper())
     
-    if from_bus:
-        tag_parts.append(sanitize_bus_name(from_bus))
+    return _assemble_tag_prefix(f"{type_code}-{format_voltage(voltage_level)}", from_bus, to_bus)
+
+
+def _parallel_key(node: TopologyNode) -> Tuple[str, frozenset, frozenset]:
+    """Key shared by parallel components: same type and same connections."""
+    return (node.type, frozenset(node.upstream_nodes), frozenset(node.downstream_nodes))
+
+
+def _build_parallel_index(graph: TopologyGraph) -> Dict[Tuple[str, frozenset, frozenset], List[str]]:
+    """
+    Group nodes into parallel components.
+    Returns mapping of (type, upstream, downstream) -> sorted node IDs.
+    """
+    index: Dict[Tuple[str, frozenset, frozenset], List[str]] = {}
     
-    if to_bus:
-        tag_parts.append(sanitize_bus_name(to_bus))
+    for node_id, node in graph.nodes.items():
+        index.setdefault(_parallel_key(node), []).append(node_id)
     
-    tag_parts.append(f"{sequence:02d}")
+    for ids in index.values():
+        ids.sort()
     
-    return "-".join(tag_parts)
+    return index
 
 
-def _calculate_sequence_number(node: TopologyNode, graph: TopologyGraph) -> int:
+def _calculate_sequence_number(
+    node: TopologyNode,
+    graph: TopologyGraph,
+    parallel_index: Optional[Dict[Tuple[str, frozenset, frozenset], List[str]]] = None
+) -> int:
     """
     Calculate sequence number for parallel components.
     Counts components of same type at same location.
     """
-    sequence = 1
-    
-    # Find similar components
-    for other_id, other_node in graph.nodes.items():
-        if other_id == node.id:
-            continue
-        
-        if other_node.type == node.type:
-            # Check if connected to same buses
-            same_upstream = set(node.upstream_nodes) == set(other_node.upstream_nodes)
-            same_downstream = set(node.downstream_nodes) == set(other_node.downstream_nodes)
-            
-            if same_upstream and same_downstream:
-                # This is a parallel component
-                if other_id < node.id:  # Earlier ID gets lower sequence
-                    sequence += 1
+    if parallel_index is None:
+        parallel_index = _build_parallel_index(graph)
     
-    return sequence
+    # Earlier ID gets lower sequence
+    ids = parallel_index.get(_parallel_key(node), ())
+    return bisect_left(ids, node.id) + 1
 
 
 def update_all_tags(graph: TopologyGraph) -> Dict[str, str]:
@@ -138,10 +174,15 @@ def update_all_tags(graph: TopologyGraph) -> Dict[str, str]:
     graph.calculate_network_levels()
     graph.identify_buses()
     
+    parallel_index = _build_parallel_index(graph)
+    prefix_cache: Dict[Tuple, str] = {}
+    
     # Generate new tags for all nodes
     for node_id, node in graph.nodes.items():
         old_tag = node.tag
-        new_tag = generate_topology_aware_tag(node, graph)
+        new_tag = generate_topology_aware_tag(
+            node, graph, parallel_index=parallel_index, prefix_cache=prefix_cache
+        )
         
         if old_tag != new_tag:
             node.tag = new_tag
@@ -212,7 +253,7 @@ def generate_connection_label(
     # Route
     from_name = source_node.bus_name or source_node.tag or source_node.type
     to_name = target_node.bus_name or target_node.tag or target_node.type
-    label_parts.append(f"{from_name} â†’ {to_name}")
+    label_parts.append(f"{from_name} → {to_name}")
     
     return " - ".join(label_parts)
 
@@ -222,18 +263,13 @@ def validate_tag_uniqueness(graph: TopologyGraph) -> List[str]:
     Check for duplicate tags in the network.
     Returns list of duplicate tags.
     """
-    tag_counts = {}
-    duplicates = []
-    
-    for node in graph.nodes.values():
-        if node.tag:
-            tag_counts[node.tag] = tag_counts.get(node.tag, 0) + 1
+    tag_counts = Counter(node.tag for node in graph.nodes.values() if node.tag)
     
-    for tag, count in tag_counts.items():
-        if count > 1:
-            duplicates.append(f"Tag '{tag}' appears {count} times")
-    
-    return duplicates
+    return [
+        f"Tag '{tag}' appears {count} times"
+        for tag, count in tag_counts.items()
+        if count > 1
+    ]
 
 
 def suggest_tag_improvements(node: TopologyNode, graph: TopologyGraph) -> List[str]:
@@ -285,7 +321,7 @@ class SmartTagManager:
         if node_id not in self.tag_history:
             self.tag_history[node_id] = []
         
-        self.tag_history[node_id].append(f"{old_tag} â†’ {new_tag}")
+        self.tag_history[node_id].append(f"{old_tag} → {new_tag}")
     
     def queue_tag_update(self, node_id: str, new_tag: str):
         """Queue a tag update for batch processing."""
@@ -318,7 +354,8 @@ def auto_tag_on_connection_change(
     Returns:
         Dictionary of node_id -> new_tag for nodes that need updating
     """
-    # Recalculate topology
+    # Recalculate topology (affected nodes may have been edited in place)
+    graph.invalidate_analysis()
     graph.calculate_network_levels()
     graph.identify_buses()
     
@@ -334,11 +371,13 @@ def auto_tag_on_connection_change(
             nodes_to_update.update(node.upstream_nodes)
             nodes_to_update.update(node.downstream_nodes)
     
+    parallel_index = _build_parallel_index(graph)
+    
     # Generate new tags
     for node_id in nodes_to_update:
         if node_id in graph.nodes:
             node = graph.nodes[node_id]
-            new_tag = generate_topology_aware_tag(node, graph)
+            new_tag = generate_topology_aware_tag(node, graph, parallel_index=parallel_index)
             
             if new_tag != node.tag:
                 tag_updates[node_id] = new_tag
@@ -349,7 +388,7 @@ def auto_tag_on_connection_change(
 
 # Example usage
 if __name__ == "__main__":
-    print("ðŸ·ï¸  Enhanced Auto-Tagging Test (Phase 2)")
+    print("🏷️  Enhanced Auto-Tagging Test (Phase 2)")
     print("=" * 70)
     
     from utils.topology import TopologyGraph, TopologyNode, TopologyEdge
@@ -374,7 +413,7 @@ if __name__ == "__main__":
     graph.add_edge(TopologyEdge("e4", "4", "5", None))
     
     # Test tag generation
-    print("\nðŸ” Generating Topology-Aware Tags:")
+    print("\n🔍 Generating Topology-Aware Tags:")
     print("-" * 70)
     
     tag_updates = update_all_tags(graph)
@@ -384,6 +423,6 @@ if __name__ == "__main__":
         print(f"Node {node_id} ({node.type:12}): {node.tag}")
         print(f"  Level: {node.level}, Bus: {node.bus_name or 'N/A'}")
         if node_id in tag_updates:
-            print(f"  âœ¨ Tag updated!")
+            print(f"  ✨ Tag updated!")
     
-    print("\nâœ… Enhanced auto-tagging test complete!")
+    print("\n✅ Enhanced auto-tagging test complete!")
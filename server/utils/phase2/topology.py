@@ -10,7 +10,8 @@ This module provides:
 - Upstream/downstream relationships
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Optional
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 
@@ -44,6 +45,38 @@ class TopologyEdge:
     length: float = 0.0
 
 
+class CSRAdjacency(NamedTuple):
+    """
+    Compressed sparse row snapshot of the graph adjacency.
+    Neighbors of index i are indices[indptr[i]:indptr[i + 1]].
+    """
+    node_ids: List[str]                     # index -> node ID
+    index: Dict[str, int]                   # node ID -> index
+    nodes: List[Optional[TopologyNode]]     # index -> node (None for IDs only seen on edges)
+    indptr: array                           # array('i')[N + 1], downstream
+    indices: array                          # array('i')[E]
+    rev_indptr: array                       # array('i')[N + 1], upstream
+    rev_indices: array                      # array('i')[E]
+
+
+def _to_csr(
+    adjacency: Dict[str, List[str]],
+    node_ids: List[str],
+    index: Dict[str, int]
+) -> Tuple[array, array]:
+    """Flatten an adjacency dict into (indptr, indices) int arrays."""
+    indptr = array('i', [0])
+    indices = array('i')
+    
+    for node_id in node_ids:
+        neighbors = adjacency.get(node_id)
+        if neighbors:
+            indices.extend([index[n] for n in neighbors])
+        indptr.append(len(indices))
+    
+    return indptr, indices
+
+
 class TopologyGraph:
     """
     Main topology graph engine.
@@ -56,15 +89,36 @@ class TopologyGraph:
         self.adjacency: Dict[str, List[str]] = defaultdict(list)
         self.reverse_adjacency: Dict[str, List[str]] = defaultdict(list)
         
+        # First edge between each (source, target) pair
+        self._edge_by_endpoints: Dict[Tuple[str, str], TopologyEdge] = {}
+        
         # Buses (equipotential points)
         self.buses: Dict[str, Set[str]] = {}  # bus_name -> set of node_ids
         
         # Source nodes (starting points)
         self.sources: List[str] = []
         
+        # CSR adjacency, rebuilt lazily after mutations
+        self._csr: Optional[CSRAdjacency] = None
+        self._csr_dirty = True
+        
+        # Analyses ("levels", "buses") still valid for the current graph
+        self._analysis_cache: Set[str] = set()
+        
+        # Set by freeze(); shared graphs reject further mutation
+        self._frozen = False
+        
+    def _check_mutable(self) -> None:
+        """Raise if the graph has been frozen by freeze()."""
+        if self._frozen:
+            raise RuntimeError("TopologyGraph is frozen and shared read-only")
+    
     def add_node(self, node: TopologyNode) -> None:
         """Add a node to the topology."""
+        self._check_mutable()
         self.nodes[node.id] = node
+        self._csr_dirty = True
+        self._analysis_cache.clear()
         
         # Track sources
         if node.type == "Source":
@@ -73,7 +127,11 @@ class TopologyGraph:
     
     def add_edge(self, edge: TopologyEdge) -> None:
         """Add an edge (connection) to the topology."""
+        self._check_mutable()
         self.edges[edge.id] = edge
+        self._edge_by_endpoints.setdefault((edge.source_id, edge.target_id), edge)
+        self._csr_dirty = True
+        self._analysis_cache.clear()
         
         # Update adjacency lists
         self.adjacency[edge.source_id].append(edge.target_id)
@@ -86,6 +144,7 @@ class TopologyGraph:
     
     def remove_edge(self, edge_id: str) -> None:
         """Remove an edge from the topology."""
+        self._check_mutable()
         if edge_id not in self.edges:
             return
         
@@ -108,45 +167,128 @@ class TopologyGraph:
                 self.nodes[edge.target_id].upstream_nodes.remove(edge.source_id)
         
         del self.edges[edge_id]
+        
+        # Fall back to the next parallel edge between the same nodes, if any
+        endpoints = (edge.source_id, edge.target_id)
+        if self._edge_by_endpoints.get(endpoints) is edge:
+            del self._edge_by_endpoints[endpoints]
+            for other in self.edges.values():
+                if (other.source_id, other.target_id) == endpoints:
+                    self._edge_by_endpoints[endpoints] = other
+                    break
+        
+        self._csr_dirty = True
+        self._analysis_cache.clear()
+    
+    def invalidate_analysis(self) -> None:
+        """
+        Force calculate_network_levels and identify_buses to recompute.
+        Needed only after editing node attributes in place; graph mutations
+        through add_node/add_edge/remove_edge invalidate automatically.
+        """
+        self._check_mutable()
+        self._analysis_cache.clear()
+    
+    def freeze(self) -> None:
+        """
+        Build the CSR adjacency, network levels and buses now and reject
+        any later mutation, so the graph can be shared between requests.
+        Every lazily cached structure is populated here; afterwards the
+        analysis methods only read.
+        """
+        self._build_csr()
+        self.calculate_network_levels()
+        self.identify_buses()
+        self._frozen = True
+    
+    def _build_csr(self) -> CSRAdjacency:
+        """
+        Materialize forward and reverse adjacency as CSR arrays.
+        Cached until the next add_node/add_edge/remove_edge.
+        """
+        if not self._csr_dirty and self._csr is not None:
+            return self._csr
+        
+        node_ids = list(self.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        
+        # Edges may reference IDs without a node; traversals still pass through them
+        for source_id, targets in list(self.adjacency.items()):
+            for node_id in (source_id, *targets):
+                if node_id not in index:
+                    index[node_id] = len(node_ids)
+                    node_ids.append(node_id)
+        
+        indptr, indices = _to_csr(self.adjacency, node_ids, index)
+        rev_indptr, rev_indices = _to_csr(self.reverse_adjacency, node_ids, index)
+        
+        self._csr = CSRAdjacency(
+            node_ids=node_ids,
+            index=index,
+            nodes=[self.nodes.get(node_id) for node_id in node_ids],
+            indptr=indptr,
+            indices=indices,
+            rev_indptr=rev_indptr,
+            rev_indices=rev_indices
+        )
+        self._csr_dirty = False
+        
+        return self._csr
     
     def calculate_network_levels(self) -> None:
         """
         Calculate the level (distance from source) for each node.
-        Uses BFS from all source nodes.
+        Uses a single BFS seeded with all source nodes.
+        Skipped if the graph is unchanged since the last run.
         """
-        # Reset levels
-        for node in self.nodes.values():
-            if node.type != "Source":
-                node.level = -1
+        if "levels" in self._analysis_cache:
+            return
         
-        # BFS from each source
-        for source_id in self.sources:
-            queue = deque([(source_id, 0)])
-            visited = set([source_id])
+        csr = self._build_csr()
+        indptr = memoryview(csr.indptr)
+        indices = memoryview(csr.indices)
+        
+        levels = array('i', [-1]) * len(csr.node_ids)
+        level_of = memoryview(levels)
+        
+        # Multi-source BFS: each node is visited once, at its shortest level
+        starts = [csr.index[source_id] for source_id in self.sources]
+        queue = deque((start, 0) for start in starts)
+        visited = set(starts)
+        
+        while queue:
+            u, level = queue.popleft()
+            level_of[u] = level
             
-            while queue:
-                node_id, level = queue.popleft()
-                
-                # Update level if this is a shorter path
-                if node_id in self.nodes:
-                    if self.nodes[node_id].level == -1 or level < self.nodes[node_id].level:
-                        self.nodes[node_id].level = level
-                
-                # Process downstream nodes
-                for downstream_id in self.adjacency.get(node_id, []):
-                    if downstream_id not in visited:
-                        visited.add(downstream_id)
-                        queue.append((downstream_id, level + 1))
+            # Process downstream nodes
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if v not in visited:
+                    visited.add(v)
+                    queue.append((v, level + 1))
+        
+        # Node IDs come first in the CSR ordering
+        for node, level in zip(self.nodes.values(), levels.tolist()):
+            if node.type != "Source":
+                node.level = level
+        
+        self._analysis_cache.add("levels")
     
     def identify_buses(self) -> Dict[str, Set[str]]:
         """
         Identify buses (equipotential points) in the network.
         A bus is a set of directly connected nodes at the same voltage level.
+        Returns the cached result if the graph is unchanged since the last run.
         """
+        if "buses" in self._analysis_cache:
+            return self.buses
+        
         self.buses.clear()
         bus_counter = 1
         processed = set()
         
+        # Bus searches visit disjoint node sets, so one visited map serves them all
+        visited = bytearray(len(self._build_csr().node_ids))
+        
         for node_id, node in self.nodes.items():
             if node_id in processed:
                 continue
@@ -154,7 +296,7 @@ class TopologyGraph:
             # Components that form buses
             if node.type in ["Bus", "Busbar", "Switchgear"]:
                 bus_name = f"BUS-{node.voltage_level}kV-{bus_counter:02d}"
-                bus_nodes = self._find_connected_bus_nodes(node_id, node.voltage_level)
+                bus_nodes = self._find_connected_bus_nodes(node_id, node.voltage_level, visited)
                 
                 self.buses[bus_name] = bus_nodes
                 
@@ -166,34 +308,56 @@ class TopologyGraph:
                 
                 bus_counter += 1
         
+        self._analysis_cache.add("buses")
         return self.buses
     
-    def _find_connected_bus_nodes(self, start_id: str, voltage: float) -> Set[str]:
-        """Find all nodes connected to a bus at the same voltage level."""
-        connected = set([start_id])
-        queue = deque([start_id])
+    def _find_connected_bus_nodes(
+        self,
+        start_id: str,
+        voltage: float,
+        visited: Optional[bytearray] = None
+    ) -> Set[str]:
+        """
+        Find all nodes connected to a bus at the same voltage level.
+        visited is a per-index flag array that may be shared across calls.
+        """
+        csr = self._build_csr()
+        start = csr.index.get(start_id)
+        if start is None:
+            return {start_id}
+        
+        if visited is None:
+            visited = bytearray(len(csr.node_ids))
+        
+        indptr, indices = memoryview(csr.indptr), memoryview(csr.indices)
+        rev_indptr, rev_indices = memoryview(csr.rev_indptr), memoryview(csr.rev_indices)
+        nodes = csr.nodes
+        
+        visited[start] = 1
+        connected = [start]
+        queue = deque([start])
         
         while queue:
-            node_id = queue.popleft()
+            u = queue.popleft()
             
             # Check all adjacent nodes (both upstream and downstream)
-            adjacent = (self.adjacency.get(node_id, []) + 
-                       self.reverse_adjacency.get(node_id, []))
-            
-            for adj_id in adjacent:
-                if adj_id in connected:
-                    continue
-                
-                if adj_id in self.nodes:
-                    adj_node = self.nodes[adj_id]
+            for adjacent in (indices[indptr[u]:indptr[u + 1]],
+                             rev_indices[rev_indptr[u]:rev_indptr[u + 1]]):
+                for v in adjacent:
+                    if visited[v]:
+                        continue
+                    
+                    adj_node = nodes[v]
                     
                     # Only include if same voltage and bus-type component
-                    if (adj_node.voltage_level == voltage and 
+                    if (adj_node is not None and
+                        adj_node.voltage_level == voltage and 
                         adj_node.type in ["Bus", "Busbar", "Switchgear"]):
-                        connected.add(adj_id)
-                        queue.append(adj_id)
+                        visited[v] = 1
+                        connected.append(v)
+                        queue.append(v)
         
-        return connected
+        return {csr.node_ids[i] for i in connected}
     
     def detect_loops(self) -> List[List[str]]:
         """
@@ -202,27 +366,37 @@ class TopologyGraph:
         """
         loops = []
         visited = set()
-        path = []
+        path: List[str] = []
+        path_pos: Dict[str, int] = {}  # node ID -> position in path
         
-        def dfs_cycle(node_id: str, parent: Optional[str] = None):
-            visited.add(node_id)
-            path.append(node_id)
+        # Check from each source (iterative DFS)
+        for source_id in self.sources:
+            if source_id in visited:
+                continue
             
-            for neighbor in self.adjacency.get(node_id, []):
-                if neighbor not in visited:
-                    dfs_cycle(neighbor, node_id)
-                elif neighbor != parent and neighbor in path:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    loop = path[cycle_start:] + [neighbor]
-                    loops.append(loop)
+            visited.add(source_id)
+            path_pos[source_id] = 0
+            path.append(source_id)
+            stack = [(source_id, None, iter(self.adjacency.get(source_id, [])))]
             
-            path.pop()
-        
-        # Check from each source
-        for source_id in self.sources:
-            if source_id not in visited:
-                dfs_cycle(source_id)
+            while stack:
+                node_id, parent, neighbors = stack[-1]
+                
+                for neighbor in neighbors:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        path_pos[neighbor] = len(path)
+                        path.append(neighbor)
+                        stack.append((neighbor, node_id, iter(self.adjacency.get(neighbor, []))))
+                        break
+                    
+                    if neighbor != parent and neighbor in path_pos:
+                        # Found a cycle
+                        loops.append(path[path_pos[neighbor]:] + [neighbor])
+                else:
+                    stack.pop()
+                    path.pop()
+                    del path_pos[node_id]
         
         return loops
     
@@ -234,19 +408,25 @@ class TopologyGraph:
         if from_id not in self.nodes or to_id not in self.nodes:
             return None
         
-        queue = deque([(from_id, [from_id])])
-        visited = set([from_id])
+        queue = deque([from_id])
+        parents: Dict[str, Optional[str]] = {from_id: None}
         
         while queue:
-            node_id, path = queue.popleft()
+            node_id = queue.popleft()
             
             if node_id == to_id:
+                # Walk parent pointers back to the start
+                path = []
+                while node_id is not None:
+                    path.append(node_id)
+                    node_id = parents[node_id]
+                path.reverse()
                 return path
             
             for neighbor in self.adjacency.get(node_id, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                if neighbor not in parents:
+                    parents[neighbor] = node_id
+                    queue.append(neighbor)
         
         return None
     
@@ -297,15 +477,11 @@ class TopologyGraph:
         """
         total_impedance = 0j
         
-        for i in range(len(path) - 1):
-            source = path[i]
-            target = path[i + 1]
-            
+        for source, target in zip(path, path[1:]):
             # Find edge between these nodes
-            for edge in self.edges.values():
-                if edge.source_id == source and edge.target_id == target:
-                    total_impedance += edge.impedance
-                    break
+            edge = self._edge_by_endpoints.get((source, target))
+            if edge is not None:
+                total_impedance += edge.impedance
         
         return total_impedance
     
@@ -430,9 +606,53 @@ def build_topology_from_database(nodes_data: List[Dict], connections_data: List[
     return graph
 
 
+def build_topology_from_rows(
+    node_rows: Iterable[Tuple],
+    connection_rows: Iterable[Tuple],
+    voltage_level: float = 0.4
+) -> TopologyGraph:
+    """
+    Build topology graph directly from database result rows.
+    Avoids materializing intermediate dictionaries for large projects.
+    
+    Args:
+        node_rows: Rows of (id, type, custom_tag, properties)
+        connection_rows: Rows of (id, source_node_id, target_node_id, cable_library_id, length)
+        voltage_level: Voltage level (kV) assigned to every node
+    
+    Returns:
+        TopologyGraph instance
+    """
+    graph = TopologyGraph()
+    
+    for node_id, node_type, custom_tag, properties in node_rows:
+        graph.add_node(TopologyNode(
+            id=str(node_id),
+            type=node_type,
+            tag=custom_tag,
+            voltage_level=voltage_level,
+            properties=properties or {}
+        ))
+    
+    for conn_id, source_node_id, target_node_id, cable_library_id, length in connection_rows:
+        graph.add_edge(TopologyEdge(
+            id=str(conn_id),
+            source_id=str(source_node_id),
+            target_id=str(target_node_id),
+            cable_id=str(cable_library_id),
+            length=length
+        ))
+    
+    # Calculate network topology
+    graph.calculate_network_levels()
+    graph.identify_buses()
+    
+    return graph
+
+
 # Example usage and testing
 if __name__ == "__main__":
-    print("ðŸ”— PwrSysPro Topology Graph Engine Test")
+    print("🔗 PwrSysPro Topology Graph Engine Test")
     print("=" * 70)
     
     # Create sample network
@@ -466,7 +686,7 @@ if __name__ == "__main__":
         graph.add_edge(edge)
     
     # Test topology analysis
-    print("\nðŸ“Š Network Analysis:")
+    print("\n📊 Network Analysis:")
     print("-" * 70)
     
     graph.calculate_network_levels()
@@ -474,25 +694,25 @@ if __name__ == "__main__":
     for nid, node in graph.nodes.items():
         print(f"  {node.tag:30} Level: {node.level}")
     
-    print("\nðŸ” Bus Identification:")
+    print("\n🔍 Bus Identification:")
     buses = graph.identify_buses()
     for bus_name, node_ids in buses.items():
         print(f"  {bus_name}: {[graph.nodes[nid].tag for nid in node_ids]}")
     
-    print("\nðŸ›¤ï¸  Path Finding:")
+    print("\n🛤️  Path Finding:")
     path = graph.find_path("1", "5")
     if path:
         path_tags = [graph.nodes[nid].tag for nid in path]
-        print(f"  Source to Motor 1: {' â†’ '.join(path_tags)}")
+        print(f"  Source to Motor 1: {' → '.join(path_tags)}")
         impedance = graph.calculate_path_impedance(path)
-        print(f"  Total Impedance: {impedance.real:.4f} + j{impedance.imag:.4f} Î©")
+        print(f"  Total Impedance: {impedance.real:.4f} + j{impedance.imag:.4f} Ω")
     
-    print("\nâš ï¸  Topology Validation:")
+    print("\n⚠️  Topology Validation:")
     issues = graph.validate_topology()
     if issues:
         for issue in issues:
-            print(f"  â€¢ {issue}")
+            print(f"  • {issue}")
     else:
-        print("  âœ… No issues found")
+        print("  ✅ No issues found")
     
-    print("\nâœ… Topology engine test complete!")
+    print("\n✅ Topology engine test complete!")
@@ -84,29 +84,29 @@ class IntegratedCalculationService:
             NetworkAnalysisResult with all calculations
         """
         # Step 1: Build per-unit system
-        print("ðŸ“Š Step 1: Building per-unit system...")
+        print("📊 Step 1: Building per-unit system...")
         self._build_per_unit_system(topology)
         
         # Step 2: Convert all impedances to per-unit
-        print("ðŸ”„ Step 2: Converting impedances...")
+        print("🔄 Step 2: Converting impedances...")
         impedances_pu = self._convert_network_impedances(topology, component_data)
         
         # Step 3: Build Y-bus matrix
-        print("âš¡ Step 3: Building Y-bus matrix...")
+        print("⚡ Step 3: Building Y-bus matrix...")
         y_bus = self._build_ybus(topology, impedances_pu)
         
         # Step 4: Short circuit analysis
-        print("âš¡ Step 4: Running short circuit analysis...")
+        print("⚡ Step 4: Running short circuit analysis...")
         sc_results = self._analyze_short_circuits(topology, impedances_pu, component_data)
         
         # Step 5: Load flow analysis (optional)
         load_flow_result = None
         if run_load_flow:
-            print("ðŸ“ˆ Step 5: Running load flow analysis...")
+            print("📈 Step 5: Running load flow analysis...")
             load_flow_result = self._analyze_load_flow(topology, y_bus)
         
         # Step 6: Breaker validation
-        print("ðŸ”’ Step 6: Validating breaker ratings...")
+        print("🔒 Step 6: Validating breaker ratings...")
         breaker_validations = self._validate_breakers(topology, sc_results, component_data)
         
         # Compile summary
@@ -369,7 +369,7 @@ class IntegratedCalculationService:
 
 # Example usage
 if __name__ == "__main__":
-    print("âš¡ Integrated Calculation Service Test")
+    print("⚡ Integrated Calculation Service Test")
     print("=" * 70)
     print("This service combines:")
     print("  1. Per-unit system")
@@ -377,4 +377,4 @@ if __name__ == "__main__":
     print("  3. Load flow analysis (Newton-Raphson)")
     print("  4. Breaker validation")
     print("=" * 70)
-    print("\nâœ… Service ready for integration!")
+    print("\n✅ Service ready for integration!")
@@ -9,7 +9,7 @@ Load Flow calculates:
 - Power losses
 
 Bus Types:
-- Slack Bus (V-Î¸): Voltage magnitude and angle specified
+- Slack Bus (V-θ): Voltage magnitude and angle specified
 - PV Bus (P-V): Real power and voltage specified
 - PQ Bus (P-Q): Real and reactive power specified (loads)
 
@@ -89,13 +89,13 @@ class NewtonRaphsonLoadFlow:
     Newton-Raphson Load Flow Solver.
     
     Solves the power flow equations:
-    P_i = V_i Ã— Î£(V_j Ã— Y_ij Ã— cos(Î¸_i - Î¸_j - Ï†_ij))
-    Q_i = V_i Ã— Î£(V_j Ã— Y_ij Ã— sin(Î¸_i - Î¸_j - Ï†_ij))
+    P_i = V_i × Σ(V_j × Y_ij × cos(θ_i - θ_j - φ_ij))
+    Q_i = V_i × Σ(V_j × Y_ij × sin(θ_i - θ_j - φ_ij))
     
     Where:
     - P_i, Q_i: Real and reactive power at bus i
-    - V_i, Î¸_i: Voltage magnitude and angle at bus i
-    - Y_ij, Ï†_ij: Admittance magnitude and angle
+    - V_i, θ_i: Voltage magnitude and angle at bus i
+    - Y_ij, φ_ij: Admittance magnitude and angle
     """
     
     def __init__(
@@ -189,7 +189,7 @@ class NewtonRaphsonLoadFlow:
             # Build mismatch vector (excluding slack bus)
             mismatch = self._build_mismatch_vector(delta_p, delta_q)
             
-            # Solve: J Ã— Î”x = Î”f
+            # Solve: J × Δx = Δf
             try:
                 delta_x = np.linalg.solve(jacobian, mismatch)
             except np.linalg.LinAlgError:
@@ -220,8 +220,8 @@ class NewtonRaphsonLoadFlow:
         """
         Calculate real and reactive power at all buses.
         
-        P_i = Î£ |V_i||V_j||Y_ij| cos(Î¸_i - Î¸_j - Ï†_ij)
-        Q_i = Î£ |V_i||V_j||Y_ij| sin(Î¸_i - Î¸_j - Ï†_ij)
+        P_i = Σ |V_i||V_j||Y_ij| cos(θ_i - θ_j - φ_ij)
+        Q_i = Σ |V_i||V_j||Y_ij| sin(θ_i - θ_j - φ_ij)
         
         Args:
             v: Voltage magnitudes
@@ -255,8 +255,8 @@ class NewtonRaphsonLoadFlow:
         Build the Jacobian matrix for Newton-Raphson.
         
         Jacobian structure:
-        J = [ âˆ‚P/âˆ‚Î¸  âˆ‚P/âˆ‚V ]
-            [ âˆ‚Q/âˆ‚Î¸  âˆ‚Q/âˆ‚V ]
+        J = [ ∂P/∂θ  ∂P/∂V ]
+            [ ∂Q/∂θ  ∂Q/∂V ]
         
         Args:
             v: Voltage magnitudes
@@ -394,9 +394,9 @@ def calculate_branch_flows(
     Calculate power flows in all branches.
     
     For a branch from bus i to bus j:
-    S_ij = V_i Ã— conj(I_ij)
+    S_ij = V_i × conj(I_ij)
     
-    Where I_ij = (V_i - V_j) Ã— Y_ij
+    Where I_ij = (V_i - V_j) × Y_ij
     
     Args:
         buses: Dictionary of buses with solved voltages
@@ -444,13 +444,13 @@ def calculate_branch_flows(
 
 # Example usage
 if __name__ == "__main__":
-    print("âš¡ Load Flow Analysis Test")
+    print("⚡ Load Flow Analysis Test")
     print("=" * 70)
     
     # Simple 3-bus system
-    print("\nðŸ“Š Test System: 3-Bus Network")
+    print("\n📊 Test System: 3-Bus Network")
     print("-" * 70)
-    print("Bus 1: Slack (1.0âˆ 0Â° pu)")
+    print("Bus 1: Slack (1.0∠0° pu)")
     print("Bus 2: Load (-0.5 pu P, -0.2 pu Q)")
     print("Bus 3: Load (-0.3 pu P, -0.1 pu Q)")
     
@@ -474,24 +474,24 @@ if __name__ == "__main__":
     solver = NewtonRaphsonLoadFlow(buses, y_bus, bus_index)
     result = solver.solve()
     
-    print("\nðŸ“Š Load Flow Results:")
+    print("\n📊 Load Flow Results:")
     print("-" * 70)
     print(f"Converged: {result.converged}")
     print(f"Iterations: {result.iterations}")
     print(f"Max Mismatch: {result.max_mismatch:.2e} pu")
     
-    print("\nðŸ”Œ Bus Voltages:")
+    print("\n🔌 Bus Voltages:")
     print("-" * 70)
     for bus_id, bus in result.buses.items():
         v_pu = bus.v_magnitude
         theta_deg = np.rad2deg(bus.v_angle)
-        print(f"Bus {bus_id}: {v_pu:.4f}âˆ {theta_deg:.2f}Â° pu  "
+        print(f"Bus {bus_id}: {v_pu:.4f}∠{theta_deg:.2f}° pu  "
               f"P={bus.p_calculated:.3f} pu, Q={bus.q_calculated:.3f} pu")
     
-    print("\nðŸ“Š System Summary:")
+    print("\n📊 System Summary:")
     print("-" * 70)
     print(f"Total Generation P: {result.total_generation_p:.3f} pu")
     print(f"Total Load P:       {result.total_load_p:.3f} pu")
     print(f"Total Losses P:     {result.total_losses_p:.3f} pu")
     
-    print("\nâœ… Load flow test complete!")
+    print("\n✅ Load flow test complete!")
@@ -8,7 +8,7 @@ all quantities to dimensionless values based on chosen base values.
 Base Values:
 - S_base (MVA): Base apparent power (typically 100 MVA)
 - V_base (kV): Base voltage at each voltage level
-- Z_base (Î©): Base impedance = V_baseÂ² / S_base
+- Z_base (Ω): Base impedance = V_base² / S_base
 
 Standards Reference:
 - IEC 60909: Short-circuit current calculation
@@ -31,16 +31,16 @@ class PerUnitBase:
     
     @property
     def impedance_ohms(self) -> float:
-        """Base impedance in ohms: Z_base = V_baseÂ² / S_base"""
+        """Base impedance in ohms: Z_base = V_base² / S_base"""
         return (self.voltage_kv ** 2 * 1000) / self.power_mva
     
     @property
     def current_amps(self) -> float:
-        """Base current in amps: I_base = S_base / (âˆš3 Ã— V_base)"""
+        """Base current in amps: I_base = S_base / (√3 × V_base)"""
         return (self.power_mva * 1000) / (math.sqrt(3) * self.voltage_kv)
     
     def __repr__(self):
-        return f"PerUnitBase({self.voltage_kv}kV, {self.power_mva}MVA, Z={self.impedance_ohms:.4f}Î©)"
+        return f"PerUnitBase({self.voltage_kv}kV, {self.power_mva}MVA, Z={self.impedance_ohms:.4f}Ω)"
 
 
 class PerUnitSystem:
@@ -144,8 +144,8 @@ def convert_cable_impedance_to_pu(
     Convert cable impedance to per-unit.
     
     Args:
-        resistance_per_km: Cable resistance in Î©/km
-        reactance_per_km: Cable reactance in Î©/km
+        resistance_per_km: Cable resistance in Ω/km
+        reactance_per_km: Cable reactance in Ω/km
         length_km: Cable length in km
         voltage_kv: Operating voltage in kV
         base_mva: Base MVA
@@ -191,7 +191,7 @@ def convert_transformer_impedance_to_pu(
     z_pu_transformer_base = z_percent / 100.0
     
     # Convert to system base
-    # Z_pu_system = Z_pu_transformer Ã— (S_base / S_transformer)
+    # Z_pu_system = Z_pu_transformer × (S_base / S_transformer)
     z_pu_system_base = z_pu_transformer_base * (base_mva / transformer_mva)
     
     # For transformers, assume X/R ratio of 10 (typical for distribution)
@@ -315,22 +315,22 @@ def calculate_z_matrix(Y_bus: np.ndarray) -> np.ndarray:
 
 # Example usage and validation
 if __name__ == "__main__":
-    print("âš¡ Per-Unit System Test")
+    print("⚡ Per-Unit System Test")
     print("=" * 70)
     
     # Create per-unit system
     pu_system = PerUnitSystem(base_mva=100.0)
     
     # Add voltage levels
-    print("\nðŸ“Š Voltage Levels:")
+    print("\n📊 Voltage Levels:")
     print("-" * 70)
     for voltage in [11.0, 0.4]:
         base = pu_system.add_voltage_level(voltage)
-        print(f"{voltage}kV: Z_base = {base.impedance_ohms:.4f}Î©, "
+        print(f"{voltage}kV: Z_base = {base.impedance_ohms:.4f}Ω, "
               f"I_base = {base.current_amps:.2f}A")
     
     # Test cable impedance conversion
-    print("\nðŸ”Œ Cable Impedance Conversion:")
+    print("\n🔌 Cable Impedance Conversion:")
     print("-" * 70)
     z_cable_pu = convert_cable_impedance_to_pu(
         resistance_per_km=0.161,  # NYY 4x120
@@ -344,7 +344,7 @@ if __name__ == "__main__":
     print(f"  |Z| = {abs(z_cable_pu):.6f} pu")
     
     # Test transformer impedance conversion
-    print("\nðŸ”„ Transformer Impedance Conversion:")
+    print("\n🔄 Transformer Impedance Conversion:")
     print("-" * 70)
     z_pri, z_sec = convert_transformer_impedance_to_pu(
         z_percent=6.0,
@@ -358,7 +358,7 @@ if __name__ == "__main__":
     print(f"  Secondary: {z_sec.real:.6f} + j{z_sec.imag:.6f} pu")
     
     # Test motor impedance conversion
-    print("\nðŸ”§ Motor Impedance Conversion:")
+    print("\n🔧 Motor Impedance Conversion:")
     print("-" * 70)
     z_motor = convert_motor_impedance_to_pu(
         motor_kw=75.0,
@@ -371,7 +371,7 @@ if __name__ == "__main__":
     print(f"  Z = {z_motor.real:.6f} + j{z_motor.imag:.6f} pu")
     
     # Test Y-bus construction
-    print("\nâš¡ Y-bus Matrix Construction:")
+    print("\n⚡ Y-bus Matrix Construction:")
     print("-" * 70)
     nodes = ['1', '2', '3']
     impedances = {
@@ -384,11 +384,11 @@ if __name__ == "__main__":
     print(np.array2string(Y_bus, precision=4, suppress_small=True))
     
     # Calculate Z-bus
-    print("\nðŸ“ Z-bus Matrix Calculation:")
+    print("\n📐 Z-bus Matrix Calculation:")
     print("-" * 70)
     Z_bus = calculate_z_matrix(Y_bus)
     if Z_bus is not None:
         print("Z-bus (3x3):")
         print(np.array2string(Z_bus, precision=4, suppress_small=True))
     
-    print("\nâœ… Per-unit system test complete!")
+    print("\n✅ Per-unit system test complete!")
@@ -89,7 +89,7 @@ class IEC60909Calculator:
         Calculate three-phase short-circuit current.
         
         Per IEC 60909, the three-phase fault current is:
-        I''k3 = (c Ã— Un) / (âˆš3 Ã— |Zk|)
+        I''k3 = (c × Un) / (√3 × |Zk|)
         
         Where:
         - c: Voltage factor (1.1 for maximum, 1.0 for minimum)
@@ -126,19 +126,19 @@ class IEC60909Calculator:
         z_total_ohms = z_total_pu * z_base
         
         # Calculate initial symmetrical short-circuit current (IEC 60909 Eq. 9)
-        # I''k3 = (c Ã— Un) / (âˆš3 Ã— |Zk|)
+        # I''k3 = (c × Un) / (√3 × |Zk|)
         i_k3_initial = (c_u_n * 1000) / (math.sqrt(3) * abs(z_total_ohms))  # in A
         i_k3_initial_ka = i_k3_initial / 1000  # Convert to kA
         
         # Calculate peak short-circuit current (IEC 60909 Eq. 60)
-        # ip = Îº Ã— âˆš2 Ã— I''k3
-        # Îº is the peak factor
+        # ip = κ × √2 × I''k3
+        # κ is the peak factor
         kappa = self._calculate_peak_factor(z_total_ohms)
         i_peak_ka = kappa * math.sqrt(2) * i_k3_initial_ka
         
         # Calculate symmetrical breaking current (IEC 60909 Eq. 65)
-        # Ib = Î¼ Ã— I''k3
-        # Î¼ is the decay factor (typically 1.0 for far-from-generator)
+        # Ib = μ × I''k3
+        # μ is the decay factor (typically 1.0 for far-from-generator)
         mu = self._calculate_decay_factor(z_total_ohms)
         i_breaking_ka = mu * i_k3_initial_ka
         
@@ -148,8 +148,8 @@ class IEC60909Calculator:
         i_steady_state_ka = i_k3_initial_ka
         
         # DC component (for thermal calculations)
-        # IDC = âˆš2 Ã— I''k3 Ã— e^(-2Ï€ft/T)
-        # Simplified: at t=0, IDC = âˆš2 Ã— I''k3
+        # IDC = √2 × I''k3 × e^(-2πft/T)
+        # Simplified: at t=0, IDC = √2 × I''k3
         i_dc_ka = math.sqrt(2) * i_k3_initial_ka
         
         # Short-circuit power
@@ -167,18 +167,18 @@ class IEC60909Calculator:
     
     def _calculate_peak_factor(self, z_total: complex) -> float:
         """
-        Calculate peak factor Îº per IEC 60909.
+        Calculate peak factor κ per IEC 60909.
         
-        Îº depends on the R/X ratio of the fault path.
+        κ depends on the R/X ratio of the fault path.
         
         IEC 60909 Eq. 61:
-        Îº = 1.02 + 0.98 Ã— e^(-3R/X)
+        κ = 1.02 + 0.98 × e^(-3R/X)
         
         Args:
             z_total: Total impedance to fault
         
         Returns:
-            Peak factor Îº
+            Peak factor κ
         """
         r = z_total.real
         x = z_total.imag
@@ -195,18 +195,18 @@ class IEC60909Calculator:
     
     def _calculate_decay_factor(self, z_total: complex) -> float:
         """
-        Calculate decay factor Î¼ per IEC 60909.
+        Calculate decay factor μ per IEC 60909.
         
-        Î¼ represents the decay of AC component during breaking time.
+        μ represents the decay of AC component during breaking time.
         
-        For far-from-generator faults: Î¼ â‰ˆ 1.0
-        For near-to-generator faults: Î¼ < 1.0
+        For far-from-generator faults: μ ≈ 1.0
+        For near-to-generator faults: μ < 1.0
         
         Args:
             z_total: Total impedance to fault
         
         Returns:
-            Decay factor Î¼
+            Decay factor μ
         """
         # Simplified: For utility-fed systems, typically 1.0
         # Full implementation would consider:
@@ -225,7 +225,7 @@ class IEC60909Calculator:
         Calculate single line-to-ground fault current.
         
         IEC 60909 Eq. 35:
-        I''k1 = (âˆš3 Ã— c Ã— Un) / (2Ã—Z1 + Z0)
+        I''k1 = (√3 × c × Un) / (2×Z1 + Z0)
         
         Where:
         - Z1: Positive sequence impedance
@@ -265,9 +265,9 @@ class IEC60909Calculator:
         Calculate line-to-line fault current.
         
         IEC 60909 Eq. 43:
-        I''k2 = (c Ã— Un) / (2 Ã— |Z1|)
+        I''k2 = (c × Un) / (2 × |Z1|)
         
-        For balanced systems: I''k2 â‰ˆ 0.866 Ã— I''k3
+        For balanced systems: I''k2 ≈ 0.866 × I''k3
         
         Args:
             fault_impedance_pu: Positive sequence impedance
@@ -303,8 +303,8 @@ def calculate_motor_contribution(
     - MV motors: longer contribution
     
     Motor contribution factor:
-    - LV motors: I''M/IrM â‰ˆ 5-7
-    - MV motors: I''M/IrM â‰ˆ 4-6
+    - LV motors: I''M/IrM ≈ 5-7
+    - MV motors: I''M/IrM ≈ 4-6
     
     Args:
         motors: List of motor dictionaries with kW, voltage, etc.
@@ -317,7 +317,7 @@ def calculate_motor_contribution(
         return None
     
     # Calculate equivalent impedance
-    # Motors in parallel: 1/Zeq = Î£(1/Zm)
+    # Motors in parallel: 1/Zeq = Σ(1/Zm)
     y_total = 0j  # Total admittance
     
     for motor in motors:
@@ -390,11 +390,11 @@ def validate_breaker_rating(
 
 # Example usage and validation
 if __name__ == "__main__":
-    print("âš¡ IEC 60909 Short Circuit Calculator Test")
+    print("⚡ IEC 60909 Short Circuit Calculator Test")
     print("=" * 70)
     
     # Example system: 11kV/0.4kV transformer feeding motor
-    print("\nðŸ“Š Test System:")
+    print("\n📊 Test System:")
     print("-" * 70)
     print("Utility: 11kV, Sk = 500 MVA")
     print("Transformer: 1 MVA, 11/0.4 kV, Z = 6%")
@@ -415,7 +415,7 @@ if __name__ == "__main__":
     # Calculate fault at motor terminals
     calculator = IEC60909Calculator(params)
     
-    print("\nâš¡ Three-Phase Fault Calculation:")
+    print("\n⚡ Three-Phase Fault Calculation:")
     print("-" * 70)
     
     # Without motor contribution
@@ -437,7 +437,7 @@ if __name__ == "__main__":
     print(f"  Increase:            {((result_with_motor.i_k3_initial / result_no_motor.i_k3_initial - 1) * 100):.1f}%")
     
     # Breaker validation
-    print("\nðŸ”’ Breaker Rating Validation:")
+    print("\n🔒 Breaker Rating Validation:")
     print("-" * 70)
     
     breaker_ratings = [10, 15, 20, 25]
@@ -447,8 +447,8 @@ if __name__ == "__main__":
             rating,
             params.voltage_kv
         )
-        status_icon = "âœ…" if validation["is_adequate"] else "âŒ"
+        status_icon = "✅" if validation["is_adequate"] else "❌"
         print(f"{status_icon} {rating}kA breaker: {validation['status']} "
               f"(Utilization: {validation['utilization_percent']:.1f}%)")
     
-    print("\nâœ… IEC 60909 calculator test complete!")
+    print("\n✅ IEC 60909 calculator test complete!")
@@ -140,13 +140,13 @@ class ProtectionCoordinator:
         Calculate operating time for given current.
         
         Uses IEC 60255 standard equations:
-        t = TMS Ã— k / ((I/I_p)^Î± - 1)
+        t = TMS × k / ((I/I_p)^α - 1)
         
         Where:
         - TMS: Time multiplier setting
         - I: Fault current
         - I_p: Pickup current
-        - k, Î±: Constants depending on curve type
+        - k, α: Constants depending on curve type
         """
         if current < pickup:
             return None  # Below pickup, won't operate
@@ -359,7 +359,7 @@ def recommend_relay_settings(
     Returns:
         Recommended settings
     """
-    # Pickup: 1.2-1.5Ã— load current
+    # Pickup: 1.2-1.5× load current
     recommended_pickup = load_current * 1.3
     
     # Time multiplier: Calculate to coordinate with upstream
@@ -370,11 +370,11 @@ def recommend_relay_settings(
     k = 0.14
     alpha = 0.02
     
-    # Solve for TMS: t = TMS Ã— k / (m^Î± - 1)
+    # Solve for TMS: t = TMS × k / (m^α - 1)
     recommended_tms = target_time * (m**alpha - 1) / k
     recommended_tms = max(0.05, min(recommended_tms, 1.0))  # Limit 0.05-1.0
     
-    # Instantaneous: 8-12Ã— pickup, beyond fault current
+    # Instantaneous: 8-12× pickup, beyond fault current
     recommended_inst = recommended_pickup * 10.0
     if recommended_inst <= fault_current * 1.2:
         recommended_inst = fault_current * 1.3
@@ -385,7 +385,7 @@ def recommend_relay_settings(
         'instantaneous_multiple': round(recommended_inst / recommended_pickup, 1),
         'curve_type': 'STANDARD_INVERSE',
         'notes': [
-            f"Pickup set at {(recommended_pickup/load_current):.1f}Ã— load current",
+            f"Pickup set at {(recommended_pickup/load_current):.1f}× load current",
             f"TMS coordinated with upstream device",
             f"Instantaneous set above maximum fault current"
         ]
@@ -394,7 +394,7 @@ def recommend_relay_settings(
 
 # Example usage
 if __name__ == "__main__":
-    print("ðŸ”’ Protection Coordination Test")
+    print("🔒 Protection Coordination Test")
     print("=" * 70)
     
     # Create coordinator
@@ -422,20 +422,20 @@ if __name__ == "__main__":
     ))
     
     # Analyze coordination
-    print("\nðŸ” Coordination Analysis:")
+    print("\n🔍 Coordination Analysis:")
     print("-" * 70)
     
     result = coord.analyze_coordination("CB-MAIN", "CB-FEEDER-1", required_cti=0.3)
     
     print(f"Upstream:         {result.upstream_device}")
     print(f"Downstream:       {result.downstream_device}")
-    print(f"Coordinated:      {'âœ… YES' if result.is_coordinated else 'âŒ NO'}")
+    print(f"Coordinated:      {'✅ YES' if result.is_coordinated else '❌ NO'}")
     print(f"Min CTI:          {result.min_cti} seconds")
     print(f"Critical Current: {result.critical_current} A")
     print(f"Margin:           {result.margin}")
     
     # Recommend settings
-    print("\nâš™ï¸  Recommended Settings for New Relay:")
+    print("\n⚙️  Recommended Settings for New Relay:")
     print("-" * 70)
     
     recommendations = recommend_relay_settings(
@@ -446,10 +446,10 @@ if __name__ == "__main__":
     
     print(f"Pickup Current:   {recommendations['pickup_current']} A")
     print(f"Time Multiplier:  {recommendations['time_multiplier']}")
-    print(f"Inst Multiple:    {recommendations['instantaneous_multiple']}Ã—")
+    print(f"Inst Multiple:    {recommendations['instantaneous_multiple']}×")
     print(f"Curve Type:       {recommendations['curve_type']}")
     print("\nNotes:")
     for note in recommendations['notes']:
-        print(f"  â€¢ {note}")
+        print(f"  • {note}")
     
-    print("\nâœ… Protection coordination test complete!")
+    print("\n✅ Protection coordination test complete!")
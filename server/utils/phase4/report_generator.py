@@ -113,7 +113,7 @@ class PwrSysProReportGenerator:
         """
         # Logo/Title
         title = Paragraph(
-            "âš¡ PwrSysPro Analysis Suite",
+            "⚡ PwrSysPro Analysis Suite",
             self.styles['ReportTitle']
         )
         self.story.append(title)
@@ -179,11 +179,11 @@ class PwrSysProReportGenerator:
         # Standards compliance
         standards = Paragraph(
             "<b>Standards Compliance:</b><br/>"
-            "â€¢ IEC 60909: Short-Circuit Current Calculation<br/>"
-            "â€¢ IEC 60364-5-52: Cable Selection and Installation<br/>"
-            "â€¢ IEEE 1584: Arc Flash Hazard Calculation<br/>"
-            "â€¢ IEEE Std 399: Power System Analysis<br/>"
-            "â€¢ NFPA 70E: Electrical Safety in the Workplace",
+            "• IEC 60909: Short-Circuit Current Calculation<br/>"
+            "• IEC 60364-5-52: Cable Selection and Installation<br/>"
+            "• IEEE 1584: Arc Flash Hazard Calculation<br/>"
+            "• IEEE Std 399: Power System Analysis<br/>"
+            "• NFPA 70E: Electrical Safety in the Workplace",
             self.styles['Normal']
         )
         self.story.append(standards)
@@ -233,22 +233,22 @@ class PwrSysProReportGenerator:
         
         basis_text = f"""
         <b>System Parameters:</b><br/>
-        â€¢ Base MVA: {design_data.get('base_mva', 100)} MVA<br/>
-        â€¢ System Frequency: {design_data.get('frequency', 50)} Hz<br/>
-        â€¢ Primary Voltage: {design_data.get('primary_voltage', 11)} kV<br/>
-        â€¢ Secondary Voltage: {design_data.get('secondary_voltage', 0.4)} kV<br/>
+        • Base MVA: {design_data.get('base_mva', 100)} MVA<br/>
+        • System Frequency: {design_data.get('frequency', 50)} Hz<br/>
+        • Primary Voltage: {design_data.get('primary_voltage', 11)} kV<br/>
+        • Secondary Voltage: {design_data.get('secondary_voltage', 0.4)} kV<br/>
         <br/>
         <b>Analysis Methods:</b><br/>
-        â€¢ Short Circuit: IEC 60909 with motor contribution<br/>
-        â€¢ Load Flow: Newton-Raphson iterative method<br/>
-        â€¢ Voltage Drop: Per IEC 60364-5-52<br/>
-        â€¢ Arc Flash: IEEE 1584-2018<br/>
+        • Short Circuit: IEC 60909 with motor contribution<br/>
+        • Load Flow: Newton-Raphson iterative method<br/>
+        • Voltage Drop: Per IEC 60364-5-52<br/>
+        • Arc Flash: IEEE 1584-2018<br/>
         <br/>
         <b>Assumptions:</b><br/>
-        â€¢ System grounding: Solidly grounded<br/>
-        â€¢ Voltage factor (c): 1.1 for maximum fault current<br/>
-        â€¢ Ambient temperature: 30Â°C<br/>
-        â€¢ Cable installation: As per IEC 60364-5-52 Method E<br/>
+        • System grounding: Solidly grounded<br/>
+        • Voltage factor (c): 1.1 for maximum fault current<br/>
+        • Ambient temperature: 30°C<br/>
+        • Cable installation: As per IEC 60364-5-52 Method E<br/>
         """
         
         self.story.append(Paragraph(basis_text, self.styles['Normal']))
@@ -316,7 +316,7 @@ class PwrSysProReportGenerator:
         # Results table
         if 'bus_results' in results:
             table_data = [[
-                'Bus', 'IE (cal/cmÂ²)', 'AFB (ft)', 
+                'Bus', 'IE (cal/cm²)', 'AFB (ft)', 
                 'PPE Cat', 'Hazard Level'
             ]]
             
@@ -348,9 +348,9 @@ class PwrSysProReportGenerator:
         
         # Safety note
         safety_note = Paragraph(
-            "<b>âš ï¸  Safety Notice:</b> All personnel must wear appropriate PPE "
+            "<b>⚠️  Safety Notice:</b> All personnel must wear appropriate PPE "
             "as indicated above when working on energized equipment. "
-            "Consider de-energizing equipment when incident energy exceeds 40 cal/cmÂ².",
+            "Consider de-energizing equipment when incident energy exceeds 40 cal/cm².",
             ParagraphStyle(
                 name='SafetyNote',
                 parent=self.styles['Normal'],
@@ -390,11 +390,11 @@ class PwrSysProReportGenerator:
         
         # Bus voltage table
         if 'bus_voltages' in results:
-            table_data = [['Bus', 'V (pu)', 'Î¸ (deg)', 'P (MW)', 'Q (MVAR)', 'Status']]
+            table_data = [['Bus', 'V (pu)', 'θ (deg)', 'P (MW)', 'Q (MVAR)', 'Status']]
             
             for bus_id, data in results['bus_voltages'].items():
                 v_pu = data.get('v_magnitude', 1.0)
-                status = 'âœ“' if 0.95 <= v_pu <= 1.05 else 'âš '
+                status = '✓' if 0.95 <= v_pu <= 1.05 else '⚠'
                 
                 table_data.append([
                     data.get('tag', bus_id),
@@ -551,7 +551,7 @@ def generate_analysis_report(
 
 # Test
 if __name__ == "__main__":
-    print("ðŸ“„ PDF Report Generator Test")
+    print("📄 PDF Report Generator Test")
     print("=" * 70)
     
     test_data = {
@@ -582,4 +582,4 @@ if __name__ == "__main__":
     
     output = "/tmp/test_report.pdf"
     result = generate_analysis_report(output, test_data['project'], test_data)
-    print(f"\nâœ… Report generated: {result}")
+    print(f"\n✅ Report generated: {result}")
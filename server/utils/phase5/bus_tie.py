@@ -96,9 +96,9 @@ class BusTieController:
     """
     
     # IEEE 1547 synchronization limits
-    VOLTAGE_LIMIT_PERCENT = 5.0      # Â±5% voltage difference
-    FREQUENCY_LIMIT_HZ = 0.3         # Â±0.3 Hz frequency difference
-    PHASE_ANGLE_LIMIT_DEG = 20.0     # Â±20Â° phase angle difference
+    VOLTAGE_LIMIT_PERCENT = 5.0      # ±5% voltage difference
+    FREQUENCY_LIMIT_HZ = 0.3         # ±0.3 Hz frequency difference
+    PHASE_ANGLE_LIMIT_DEG = 20.0     # ±20° phase angle difference
     
     def __init__(self):
         self.bus_ties: Dict[str, BusTieParameters] = {}
@@ -121,9 +121,9 @@ class BusTieController:
         Check if two buses are synchronized for parallel operation.
         
         Per IEEE 1547-2018:
-        - Voltage: Within Â±5%
-        - Frequency: Within Â±0.3 Hz
-        - Phase angle: Within Â±20Â°
+        - Voltage: Within ±5%
+        - Frequency: Within ±0.3 Hz
+        - Phase angle: Within ±20°
         
         Args:
             bus_1_id: First bus identifier
@@ -176,8 +176,8 @@ class BusTieController:
         
         if phase_diff > self.PHASE_ANGLE_LIMIT_DEG:
             issues.append(
-                f"Phase angle difference {phase_diff:.1f}Â° exceeds "
-                f"{self.PHASE_ANGLE_LIMIT_DEG}Â° limit"
+                f"Phase angle difference {phase_diff:.1f}° exceeds "
+                f"{self.PHASE_ANGLE_LIMIT_DEG}° limit"
             )
             synchronized = False
         
@@ -472,7 +472,7 @@ class BusTieController:
 
 # Testing and example usage
 if __name__ == "__main__":
-    print("âš¡ Bus Tie Synchronization Test")
+    print("⚡ Bus Tie Synchronization Test")
     print("=" * 70)
     
     controller = BusTieController()
@@ -503,37 +503,37 @@ if __name__ == "__main__":
     controller.add_bus(bus1)
     controller.add_bus(bus2)
     
-    print("\nâœ… Added 2 test buses")
+    print("\n✅ Added 2 test buses")
     
     # Test synchronization check
-    print("\nðŸ“Š Synchronization Check:")
+    print("\n📊 Synchronization Check:")
     sync_check = controller.check_synchronization("bus1", "bus2")
     print(f"  Synchronized: {sync_check.synchronized}")
     print(f"  Voltage Diff: {sync_check.voltage_diff_percent:.2f}%")
     print(f"  Frequency Diff: {sync_check.frequency_diff_hz:.3f} Hz")
-    print(f"  Phase Diff: {sync_check.phase_diff_deg:.1f}Â°")
+    print(f"  Phase Diff: {sync_check.phase_diff_deg:.1f}°")
     if sync_check.issues:
         print(f"  Issues: {', '.join(sync_check.issues)}")
     
     # Test load transfer planning
-    print("\nðŸ”„ Load Transfer Plan (Open Transition):")
+    print("\n🔄 Load Transfer Plan (Open Transition):")
     transfer_plan = controller.plan_load_transfer(
         "bus1", "bus2", 200.0, TransferMode.OPEN_TRANSITION
     )
     
     if transfer_plan['feasible']:
         print(f"  Transfer: {transfer_plan['load_mw']} MW")
-        print(f"  From: {transfer_plan['from_bus']} â†’ To: {transfer_plan['to_bus']}")
+        print(f"  From: {transfer_plan['from_bus']} → To: {transfer_plan['to_bus']}")
         print(f"  Time: {transfer_plan['estimated_time_seconds']} seconds")
         print(f"\n  Sequence:")
         for step in transfer_plan['sequence']:
             print(f"    Step {step['step_number']}: {step['action']} @ {step['time_ms']}ms")
     
     # Test load sharing
-    print("\nâš–ï¸  Load Sharing Calculation:")
+    print("\n⚖️  Load Sharing Calculation:")
     sharing = controller.calculate_load_sharing("bus1", "bus2")
     print(f"  Total Load: {sharing['total_load_mw']} MW")
     print(f"  {sharing['bus_1_tag']}: {sharing['bus_1_load_mw']:.1f} MW ({sharing['bus_1_percent']:.1f}%)")
     print(f"  {sharing['bus_2_tag']}: {sharing['bus_2_load_mw']:.1f} MW ({sharing['bus_2_percent']:.1f}%)")
     
-    print("\nâœ… Bus Tie Synchronization test complete!")
+    print("\n✅ Bus Tie Synchronization test complete!")
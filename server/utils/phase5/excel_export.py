@@ -266,7 +266,7 @@ class ExcelExporter:
         ws = self.wb.create_sheet("Cable Schedule")
         
         headers = [
-            'Cable Tag', 'From', 'To', 'Type', 'Size (mmÂ²)',
+            'Cable Tag', 'From', 'To', 'Type', 'Size (mm²)',
             'Length (m)', 'Cores', 'Voltage (kV)',
             'Installation Method', 'Ampacity (A)',
             'Material', 'Insulation'
@@ -398,7 +398,7 @@ class ExcelExporter:
         
         # Results table
         row = 4
-        headers = ['Bus Tag', 'IE (cal/cmÂ²)', 'AFB (ft)', 'PPE Cat', 'Hazard Level']
+        headers = ['Bus Tag', 'IE (cal/cm²)', 'AFB (ft)', 'PPE Cat', 'Hazard Level']
         for col, header in enumerate(headers, start=1):
             cell = ws.cell(row=row, column=col, value=header)
             cell.font = self.header_font
@@ -448,11 +448,11 @@ class ExcelExporter:
 
 # Testing and example usage
 if __name__ == "__main__":
-    print("ðŸ“Š Excel Export Test")
+    print("📊 Excel Export Test")
     print("=" * 70)
     
     if not OPENPYXL_AVAILABLE:
-        print("âŒ openpyxl not available - test skipped")
+        print("❌ openpyxl not available - test skipped")
         print("Install with: pip install openpyxl")
     else:
         exporter = ExcelExporter()
@@ -480,19 +480,19 @@ if __name__ == "__main__":
             '10': {'type': 'Cable', 'manufacturer': 'Nexans', 'cross_section': 185, 'voltage_rating': 11, 'ampacity_base': 420, 'conductor_material': 'Copper', 'insulation_type': 'XLPE'}
         }
         
-        print("\nâœ… Test data created")
+        print("\n✅ Test data created")
         
         # Test equipment list export
-        print("\nðŸ“„ Exporting equipment list...")
+        print("\n📄 Exporting equipment list...")
         try:
             excel_data = exporter.export_equipment_list(test_project, test_components)
-            print(f"âœ… Generated Excel file: {len(excel_data.getvalue())} bytes")
+            print(f"✅ Generated Excel file: {len(excel_data.getvalue())} bytes")
             
             # Optionally save to file
             with open('/tmp/test_equipment_list.xlsx', 'wb') as f:
                 f.write(excel_data.getvalue())
-            print("âœ… Saved to /tmp/test_equipment_list.xlsx")
+            print("✅ Saved to /tmp/test_equipment_list.xlsx")
         except Exception as e:
-            print(f"âŒ Export failed: {e}")
+            print(f"❌ Export failed: {e}")
         
-        print("\nâœ… Excel Export test complete!")
+        print("\n✅ Excel Export test complete!")
@@ -225,7 +225,7 @@ class LoopFlowAnalyzer:
         num_nodes: int
     ) -> np.ndarray:
         """
-        Solve mesh equations: Z Ã— I = V
+        Solve mesh equations: Z × I = V
         
         For loops with no EMF sources, circulating current
         depends on load distribution (simplified model).
@@ -281,7 +281,7 @@ class LoopFlowAnalyzer:
             key = f"{branch.from_node}-{branch.to_node}"
             current = branch_currents.get(key, 0j)
             
-            # Power = IÂ² Ã— Z
+            # Power = I² × Z
             power = current * branch.impedance * np.conj(current)
             
             branch.power_mw = power.real * 1000  # Convert to kW
@@ -302,14 +302,14 @@ class LoopFlowAnalyzer:
         branches: List[LoopBranch],
         branch_currents: Dict[str, complex]
     ) -> float:
-        """Calculate total IÂ²R losses in loop"""
+        """Calculate total I²R losses in loop"""
         total_losses = 0.0
         
         for branch in branches:
             key = f"{branch.from_node}-{branch.to_node}"
             current = branch_currents.get(key, 0j)
             
-            # Losses = IÂ² Ã— R
+            # Losses = I² × R
             r = branch.impedance.real
             losses_kw = abs(current) ** 2 * r * 1000  # Convert to kW
             
@@ -338,7 +338,7 @@ class LoopFlowAnalyzer:
         for branch in branches:
             if branch.power_mw > 100:  # Arbitrary threshold
                 suggestions.append(
-                    f"Branch {branch.from_node}â†’{branch.to_node} shows high power flow. "
+                    f"Branch {branch.from_node}→{branch.to_node} shows high power flow. "
                     "Consider parallel path or cable upgrade."
                 )
         
@@ -366,8 +366,8 @@ class LoopFlowAnalyzer:
         report = []
         report.append(f"Loop Analysis Report: {loop_result.loop_id}")
         report.append("=" * 70)
-        report.append(f"\nLoop Nodes: {' â†’ '.join(loop_result.loop_nodes)}")
-        report.append(f"Total Loop Impedance: {abs(loop_result.loop_impedance_total):.4f} Î©")
+        report.append(f"\nLoop Nodes: {' → '.join(loop_result.loop_nodes)}")
+        report.append(f"Total Loop Impedance: {abs(loop_result.loop_impedance_total):.4f} Ω")
         report.append(f"Circulating Current: {abs(loop_result.circulating_current):.3f} A")
         report.append(f"Total Losses: {loop_result.total_losses_kw:.2f} kW")
         
@@ -375,7 +375,7 @@ class LoopFlowAnalyzer:
         report.append("-" * 70)
         for branch in loop_result.branches:
             report.append(
-                f"  {branch.from_node} â†’ {branch.to_node}: "
+                f"  {branch.from_node} → {branch.to_node}: "
                 f"I={abs(branch.current):.2f}A, "
                 f"P={branch.power_mw:.2f}kW, "
                 f"Losses={branch.losses_kw:.2f}kW"
@@ -391,7 +391,7 @@ class LoopFlowAnalyzer:
 
 # Testing and example usage
 if __name__ == "__main__":
-    print("ðŸ”„ Loop Flow Analysis Test")
+    print("🔄 Loop Flow Analysis Test")
     print("=" * 70)
     
     analyzer = LoopFlowAnalyzer()
@@ -407,27 +407,27 @@ if __name__ == "__main__":
         "BUS4-BUS1": 0.15 + 0.20j
     }
     
-    print(f"\nâœ… Test loop: {' â†’ '.join(test_loop[:-1])}")
-    print(f"âœ… {len(impedances)} branches defined")
+    print(f"\n✅ Test loop: {' → '.join(test_loop[:-1])}")
+    print(f"✅ {len(impedances)} branches defined")
     
     # Analyze loop
     result = analyzer.analyze_loop(test_loop[:-1], impedances)
     
-    print(f"\nðŸ“Š Analysis Results:")
-    print(f"  Loop Impedance: {abs(result.loop_impedance_total):.4f} Î©")
+    print(f"\n📊 Analysis Results:")
+    print(f"  Loop Impedance: {abs(result.loop_impedance_total):.4f} Ω")
     print(f"  Circulating Current: {abs(result.circulating_current):.3f} A")
     print(f"  Total Losses: {result.total_losses_kw:.4f} kW")
     
-    print(f"\nâš¡ Branch Power Flows:")
+    print(f"\n⚡ Branch Power Flows:")
     for key, flow in result.power_flows.items():
         print(f"  {key}: {flow['power_kw']:.3f} kW @ {flow['current_a']:.3f} A")
     
-    print(f"\nðŸ’¡ Optimization Suggestions:")
+    print(f"\n💡 Optimization Suggestions:")
     for i, suggestion in enumerate(result.optimization_suggestions, 1):
         print(f"  {i}. {suggestion}")
     
     # Generate report
-    print(f"\nðŸ“„ Full Report:")
+    print(f"\n📄 Full Report:")
     print(analyzer.generate_loop_report(result))
     
-    print("\nâœ… Loop Flow Analysis test complete!")
+    print("\n✅ Loop Flow Analysis test complete!")
@@ -200,7 +200,7 @@ class NarrativeGenerator:
             
             return (
                 f"Arc flash analysis per IEEE 1584-2018 identifies {len(extreme_hazard)} "
-                f"location(s) with extreme hazard levels (>40 cal/cmÂ²): {location_list}. "
+                f"location(s) with extreme hazard levels (>40 cal/cm²): {location_list}. "
                 f"These locations exceed the maximum PPE category and require de-energization "
                 f"procedures for all maintenance activities. Remote racking and operation "
                 f"should be implemented where feasible per NFPA 70E requirements."
@@ -211,7 +211,7 @@ class NarrativeGenerator:
             
             return (
                 f"Arc flash analysis identifies {len(high_hazard)} location(s) requiring "
-                f"PPE Category 4 protection: {location_list}. Personnel must wear 40 cal/cmÂ² "
+                f"PPE Category 4 protection: {location_list}. Personnel must wear 40 cal/cm² "
                 f"rated arc flash suits when working on energized equipment at these locations. "
                 f"All work procedures must comply with NFPA 70E Table 130.5(G) requirements."
             )
@@ -223,7 +223,7 @@ class NarrativeGenerator:
             
             return (
                 f"Arc flash analysis indicates all equipment locations have incident energy "
-                f"levels within manageable limits. Maximum incident energy is {max_ie:.1f} cal/cmÂ². "
+                f"levels within manageable limits. Maximum incident energy is {max_ie:.1f} cal/cm². "
                 f"Appropriate PPE categories have been determined for each location per NFPA 70E. "
                 f"Arc flash labels should be affixed to all equipment indicating hazard level "
                 f"and required PPE."
@@ -254,7 +254,7 @@ class NarrativeGenerator:
             return (
                 f"Load flow analysis converged in {iterations} iterations using the "
                 f"Newton-Raphson method. However, {len(voltage_violations)} bus(es) show "
-                f"voltage violations outside the Â±5% regulatory limits: {violation_list}. "
+                f"voltage violations outside the ±5% regulatory limits: {violation_list}. "
                 f"Voltage regulation measures such as tap changer adjustment, capacitor banks, "
                 f"or voltage regulators are recommended to maintain acceptable voltage profiles."
             )
@@ -264,7 +264,7 @@ class NarrativeGenerator:
             
             return (
                 f"Load flow analysis converged successfully in {iterations} iterations. "
-                f"All bus voltages are within acceptable limits (Â±5% of nominal). "
+                f"All bus voltages are within acceptable limits (±5% of nominal). "
                 f"Total system losses are {losses_mw:.2f} MW ({loss_percent:.1f}% of total load), "
                 f"which is within typical ranges for distribution systems. The voltage regulation "
                 f"and power factor performance indicate satisfactory system operation."
@@ -330,7 +330,7 @@ class NarrativeGenerator:
         return (
             f"The voltage drop of {vd_percent:.1f}% between {from_bus} and {to_bus} "
             f"results from the {cable_length:.0f}m cable run. With a cable resistance of "
-            f"{cable_r:.3f} Î©/km and load current of {current:.0f}A, the voltage drop "
+            f"{cable_r:.3f} Ω/km and load current of {current:.0f}A, the voltage drop "
             f"calculates to {vd_volts:.1f}V. This {'is within' if within_limit else 'exceeds'} "
             f"the 5% limit specified in IEC 60364-5-52. "
             f"{'No corrective action is required.' if within_limit else 'Cable upsizing or voltage boost is recommended.'}"
@@ -358,7 +358,7 @@ class NarrativeGenerator:
         
         return (
             f"Arc flash calculations per IEEE 1584-2018 determine an incident energy of "
-            f"{ie:.1f} cal/cmÂ² at the typical working distance. The arc flash boundary "
+            f"{ie:.1f} cal/cm² at the typical working distance. The arc flash boundary "
             f"extends {afb:.1f} feet, within which personnel require PPE Category {ppe_cat}. "
             f"This analysis considers the available fault current, clearing time of "
             f"protective devices, and equipment configuration to determine the thermal "
@@ -415,7 +415,7 @@ class NarrativeGenerator:
 
 # Testing and example usage
 if __name__ == "__main__":
-    print("ðŸ“ Automated Narrative Generation Test")
+    print("📝 Automated Narrative Generation Test")
     print("=" * 70)
     
     generator = NarrativeGenerator()
@@ -454,35 +454,35 @@ if __name__ == "__main__":
     }
     
     # Generate executive summary
-    print("\nðŸ“„ Executive Summary:")
+    print("\n📄 Executive Summary:")
     print("-" * 70)
     summary = generator.generate_executive_summary(test_project, test_analysis)
     print(summary)
     
     # Generate short circuit interpretation
-    print("\nâš¡ Short Circuit Analysis:")
+    print("\n⚡ Short Circuit Analysis:")
     print("-" * 70)
     sc_narrative = generator.interpret_short_circuit_results(test_analysis['short_circuit'])
     print(sc_narrative)
     
     # Generate arc flash interpretation
-    print("\nðŸ”¥ Arc Flash Analysis:")
+    print("\n🔥 Arc Flash Analysis:")
     print("-" * 70)
     af_narrative = generator.interpret_arc_flash_results(test_analysis['arc_flash'])
     print(af_narrative)
     
     # Generate load flow interpretation
-    print("\nðŸ“Š Load Flow Analysis:")
+    print("\n📊 Load Flow Analysis:")
     print("-" * 70)
     lf_narrative = generator.interpret_load_flow_results(test_analysis['load_flow'])
     print(lf_narrative)
     
     # Generate compliance statement
-    print("\nðŸ“‹ Compliance Statement:")
+    print("\n📋 Compliance Statement:")
     print("-" * 70)
     compliance = generator.generate_compliance_statement([
         'IEC 60909', 'IEEE 1584', 'NFPA 70E', 'IEEE 399'
     ])
     print(compliance)
     
-    print("\nâœ… Automated Narrative Generation test complete!")
+    print("\n✅ Automated Narrative Generation test complete!")
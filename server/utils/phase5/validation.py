@@ -280,7 +280,7 @@ class ValidationEngine:
                     title="Extreme Arc Flash Hazard",
                     message=(
                         f"Bus {result.get('tag')} has incident energy "
-                        f"{incident_energy:.1f} cal/cmÂ² (>40). "
+                        f"{incident_energy:.1f} cal/cm² (>40). "
                         f"De-energization strongly recommended."
                     ),
                     node_id=result.get('node_id'),
@@ -296,7 +296,7 @@ class ValidationEngine:
                     title="High Arc Flash Hazard",
                     message=(
                         f"Bus {result.get('tag')} requires PPE Category 4. "
-                        f"Incident energy: {incident_energy:.1f} cal/cmÂ²"
+                        f"Incident energy: {incident_energy:.1f} cal/cm²"
                     ),
                     node_id=result.get('node_id'),
                     auto_fix_available=False,
@@ -382,7 +382,7 @@ class ValidationEngine:
 
 # Testing and example usage
 if __name__ == "__main__":
-    print("ðŸš¨ Visual Red-Flag Validation Test")
+    print("🚨 Visual Red-Flag Validation Test")
     print("=" * 70)
     
     engine = ValidationEngine()
@@ -440,29 +440,29 @@ if __name__ == "__main__":
     # Run validation
     issues = engine.validate_project(test_project, None, test_analysis)
     
-    print(f"\nâœ… Validation complete: {len(issues)} issues found")
+    print(f"\n✅ Validation complete: {len(issues)} issues found")
     
     # Display summary
     summary = engine.get_summary()
-    print(f"\nðŸ“Š Summary:")
+    print(f"\n📊 Summary:")
     print(f"  Total Issues: {summary['total_issues']}")
     print(f"  Critical: {summary['critical']}")
     print(f"  Warnings: {summary['warning']}")
     print(f"  Info: {summary['info']}")
     
     # Display issues by severity
-    print(f"\nðŸš¨ Issues by Severity:")
+    print(f"\n🚨 Issues by Severity:")
     for issue in issues:
         icon = {
-            ValidationSeverity.CRITICAL: "ðŸ”´",
-            ValidationSeverity.WARNING: "âš ï¸",
-            ValidationSeverity.INFO: "â„¹ï¸",
-            ValidationSeverity.SUCCESS: "âœ…"
-        }.get(issue.severity, "â€¢")
+            ValidationSeverity.CRITICAL: "🔴",
+            ValidationSeverity.WARNING: "⚠️",
+            ValidationSeverity.INFO: "ℹ️",
+            ValidationSeverity.SUCCESS: "✅"
+        }.get(issue.severity, "•")
         
         print(f"  {icon} [{issue.severity.value.upper()}] {issue.title}")
         print(f"     {issue.message}")
         if issue.auto_fix_available:
-            print(f"     ðŸ”§ Auto-fix: {issue.fix_description}")
+            print(f"     🔧 Auto-fix: {issue.fix_description}")
     
-    print("\nâœ… Visual Red-Flag Validation test complete!")
+    print("\n✅ Visual Red-Flag Validation test complete!")